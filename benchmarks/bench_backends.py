@@ -0,0 +1,111 @@
+"""Compara os backends de consulta (pandas e DuckDB) em datasets Parquet de vários tamanhos.
+
+Uso:
+    python benchmarks/bench_backends.py [--linhas 41000 1000000 10000000] [--repeticoes R]
+
+Para cada tamanho é gerado (e guardado em .cache/bench) um Parquet com as
+mesmas colunas do `data_processada_final.csv`; acima de 1 milhão de
+linhas, o Parquet repete o dataset sintético de 1 milhão em vários row
+groups, sem gerar tudo na memória. Cada backend roda em um subprocesso
+novo: é medido o tempo de abertura (no pandas, a leitura do Parquet
+inteiro), o tempo de cada consulta de CONSULTAS (mediana das repetições)
+e o pico de RSS do processo.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from benchmarks.bench_paginas import dataset_sintetico  # noqa: E402
+
+LINHAS_BASE = 1_000_000
+
+MEDICAO = r"""
+import json, resource, statistics, sys, time
+sys.path.insert(0, {raiz!r})
+from pvd.backends import DuckDBBackend, PandasBackend
+from pvd.cube import DIMENSOES
+from pvd.density import COLUNA_IDADE, COLUNA_INVESTIMENTO
+from pvd.loader import ler_tipado
+from pvd.paises import REGIAO_LATINOS, REGIOES
+
+CONSULTAS = {{
+    "cubo (Hip. 2-4)": (DIMENSOES, None),
+    "idade x investimento (Hip. 5)": ([COLUNA_IDADE, COLUNA_INVESTIMENTO], None),
+    "Hip. 4: Private, 40h": (["sex_Male", "income"], {{"workclass": "workclass_Private", "hours-per-week": 0.5}}),
+    "Hip. 2: latinos": (["income", "education-num"], {{"native-country-name": REGIOES[REGIAO_LATINOS]}}),
+}}
+
+inicio = time.perf_counter()
+if {backend!r} == "pandas":
+    backend = PandasBackend(ler_tipado({caminho!r}), None)
+else:
+    backend = DuckDBBackend({caminho!r}, cache_dir={cache!r})
+resultado = {{"abrir_s": time.perf_counter() - inicio, "consultas_s": {{}}}}
+for nome, (colunas, filtros) in CONSULTAS.items():
+    tempos = []
+    for _ in range({repeticoes}):
+        inicio = time.perf_counter()
+        backend.count_by(colunas, filtros)
+        tempos.append(time.perf_counter() - inicio)
+    resultado["consultas_s"][nome] = statistics.median(tempos)
+resultado["pico_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps(resultado))
+"""
+
+
+def parquet_sintetico(n_linhas):
+    """Parquet com `n_linhas` linhas, repetindo o dataset de 1 milhão quando maior que ele."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from pvd.loader import ler_tipado
+
+    caminho = RAIZ / ".cache" / "bench" / f"processado-{n_linhas}-0.parquet"
+    if caminho.exists():
+        return caminho
+    base = ler_tipado(dataset_sintetico(min(n_linhas, LINHAS_BASE)))
+    tabela = pa.Table.from_pandas(base, preserve_index=False)
+    temporario = caminho.with_suffix(".tmp")
+    with pq.ParquetWriter(temporario, tabela.schema) as escritor:
+        restantes = n_linhas
+        while restantes > 0:
+            escritor.write_table(tabela.slice(0, restantes))
+            restantes -= len(tabela)
+    temporario.replace(caminho)
+    return caminho
+
+
+def medir(backend, caminho, repeticoes):
+    codigo = MEDICAO.format(raiz=str(RAIZ), backend=backend, caminho=str(caminho), repeticoes=repeticoes,
+                            cache=str(RAIZ / ".cache" / "bench"))
+    saida = subprocess.run([sys.executable, "-c", codigo], check=True, capture_output=True, text=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo e memória dos backends pandas e DuckDB.")
+    parser.add_argument("--linhas", type=int, nargs="+", default=[41_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for n_linhas in args.linhas:
+        caminho = parquet_sintetico(n_linhas)
+        print(f"{n_linhas:,} linhas ({caminho.stat().st_size / 2**20:.0f} MB em Parquet)".replace(",", "."))
+        resultados = {backend: medir(backend, caminho, args.repeticoes) for backend in ("pandas", "duckdb")}
+        print(f"    {'':32} {'pandas':>10} {'duckdb':>10}")
+        print(f"    {'abrir (s)':32} {resultados['pandas']['abrir_s']:10.3f} {resultados['duckdb']['abrir_s']:10.3f}")
+        for consulta in resultados["pandas"]["consultas_s"]:
+            tempos = [resultados[b]["consultas_s"][consulta] for b in ("pandas", "duckdb")]
+            print(f"    {consulta + ' (s)':32} {tempos[0]:10.3f} {tempos[1]:10.3f}")
+        print(f"    {'pico de RSS (MB)':32} {resultados['pandas']['pico_rss_mb']:10.0f} "
+              f"{resultados['duckdb']['pico_rss_mb']:10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
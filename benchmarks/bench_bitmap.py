@@ -0,0 +1,74 @@
+"""Micro-benchmark: máscaras do pandas x índice de bitmaps.
+
+Uso:
+    python benchmarks/bench_bitmap.py [caminho_csv]
+
+Mede as contagens da Hipótese 4 (classe de trabalho, horas, sexo e renda)
+e o filtro de países da Hipótese 2, nas duas implementações.
+"""
+import sys
+import timeit
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from pvd.bitmap import BitmapIndex  # noqa: E402
+from pvd.loader import load_dataset  # noqa: E402
+
+WORKCLASS = "workclass_Private"
+HORAS = 0.5
+GRUPO = ["Mexico", "Cuba", "Jamaica", "India", "China", "Philippines"]
+
+
+def hipotese4_pandas(df):
+    df_filtered = df[df[WORKCLASS] == 1]
+    df_filtered = df_filtered[df_filtered["hours-per-week"] == HORAS]
+    return (
+        len(df_filtered[df_filtered['sex_Male'] == 0]),
+        len(df_filtered[df_filtered['sex_Male'] == 1]),
+        len(df_filtered[(df_filtered['sex_Male'] == 0) & (df_filtered['income'] == 1)]),
+        len(df_filtered[(df_filtered['sex_Male'] == 1) & (df_filtered['income'] == 1)]),
+    )
+
+
+def hipotese4_bitmap(indice):
+    filtro = indice.bits(WORKCLASS) & indice.bits("hours-per-week", HORAS)
+    mulheres = filtro & indice.bits("sex_Male", 0)
+    homens = filtro & indice.bits("sex_Male", 1)
+    renda = indice.bits("income")
+    return mulheres.contar(), homens.contar(), (mulheres & renda).contar(), (homens & renda).contar()
+
+
+def hipotese2_pandas(df):
+    return len(df[(df['native-country-name'].isin(GRUPO)) & (df[WORKCLASS] == 1)])
+
+
+def hipotese2_bitmap(indice):
+    return (indice.em("native-country-name", GRUPO) & indice.bits(WORKCLASS)).contar()
+
+
+def medir(funcao, argumento, repeticoes=200):
+    return min(timeit.repeat(lambda: funcao(argumento), number=repeticoes, repeat=3)) / repeticoes
+
+
+def main():
+    caminho = sys.argv[1] if len(sys.argv) > 1 else str(RAIZ / "data_processada_final.csv")
+    df, _ = load_dataset(caminho)
+
+    construcao = min(timeit.repeat(lambda: BitmapIndex.from_frame(df), number=1, repeat=3))
+    indice = BitmapIndex.from_frame(df)
+    print(f"{len(df)} linhas | índice: {construcao * 1000:.1f} ms para montar, {indice.nbytes / 1024:.0f} KB")
+
+    for nome, pandas_, bitmap in [
+        ("Hipótese 4", hipotese4_pandas, hipotese4_bitmap),
+        ("Hipótese 2", hipotese2_pandas, hipotese2_bitmap),
+    ]:
+        assert pandas_(df) == bitmap(indice)
+        t_pandas = medir(pandas_, df)
+        t_bitmap = medir(bitmap, indice)
+        print(f"{nome}: pandas {t_pandas * 1e6:8.1f} us | bitmap {t_bitmap * 1e6:7.1f} us | {t_pandas / t_bitmap:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
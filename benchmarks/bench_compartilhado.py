@@ -0,0 +1,130 @@
+"""Memória do dataset compartilhado: RSS por sessão adicional e por processo adicional.
+
+Uso:
+    python benchmarks/bench_compartilhado.py [--linhas N] [--sessoes S] [--processos P] [--pagina NOME]
+
+Sessões: em um subprocesso, o `dashboards.py` roda no AppTest sobre um
+dataset sintético com N linhas; S sessões são abertas uma após a outra
+(todas mantidas vivas) na página escolhida, e o RSS é lido depois de cada
+uma. Processos: P subprocessos carregam o dataset ao mesmo tempo, cada um
+com a sua cópia (`load_dataset`) ou anexando o compartilhado
+(`load_shared_dataset`), e leem todas as colunas. Com todos vivos, são
+somados o RSS e o PSS (que divide as páginas compartilhadas entre os
+processos que as mapeiam, ou seja, a memória que a máquina realmente gasta).
+
+Só funciona no Linux (lê /proc).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from benchmarks.bench_paginas import dataset_sintetico  # noqa: E402
+
+SESSOES = r"""
+import json, os, sys
+sys.path.insert(0, {raiz!r})
+from streamlit.testing.v1 import AppTest
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+sessoes, medidas = [], [rss_mb()]
+for _ in range({sessoes}):
+    at = AppTest.from_file({script!r}, default_timeout=600)
+    at.run()
+    at.sidebar.selectbox[0].set_value({pagina!r}).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    sessoes.append(at)
+    medidas.append(rss_mb())
+print(json.dumps(medidas))
+"""
+
+PROCESSO = r"""
+import sys
+sys.path.insert(0, {raiz!r})
+from pvd.loader import load_dataset
+from pvd.shared import load_shared_dataset
+
+carregar = load_shared_dataset if {modo!r} == "compartilhado" else load_dataset
+df, _ = carregar({caminho!r})
+# Lê todas as colunas, como as estruturas montadas pelas páginas fazem
+for coluna in df.columns:
+    df[coluna].to_numpy().sum() if df[coluna].dtype != "category" else df[coluna].cat.codes.sum()
+print("pronto", flush=True)
+sys.stdin.read()
+"""
+
+
+def memoria_processo(pid):
+    """(RSS, PSS) em MB de um processo vivo."""
+    valores = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for linha in f:
+            campos = linha.split()
+            if campos[0] in ("Rss:", "Pss:"):
+                valores[campos[0][:-1]] = int(campos[1]) / 1024
+    return valores["Rss"], valores["Pss"]
+
+
+def medir_sessoes(script, caminho, sessoes, pagina):
+    codigo = SESSOES.format(raiz=str(RAIZ), script=script, sessoes=sessoes, pagina=pagina)
+    ambiente = dict(os.environ, PVD_DADOS=caminho)
+    saida = subprocess.run([sys.executable, "-c", codigo], check=True, capture_output=True, text=True,
+                           cwd=RAIZ, env=ambiente)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def medir_processos(modo, caminho, processos):
+    codigo = PROCESSO.format(raiz=str(RAIZ), modo=modo, caminho=caminho)
+    filhos = [subprocess.Popen([sys.executable, "-c", codigo], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               text=True, cwd=RAIZ)
+              for _ in range(processos)]
+    try:
+        for filho in filhos:
+            if filho.stdout.readline().strip() != "pronto":
+                raise RuntimeError(f"O processo {filho.pid} terminou antes de carregar o dataset")
+        return [memoria_processo(filho.pid) for filho in filhos]
+    finally:
+        for filho in filhos:
+            filho.stdin.close()
+            filho.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RSS por sessão e por processo com o dataset compartilhado.")
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="linhas do dataset sintético")
+    parser.add_argument("--sessoes", type=int, default=5)
+    parser.add_argument("--processos", type=int, default=4)
+    parser.add_argument("--pagina", default="Hipotese 2")
+    parser.add_argument("--script", default=str(RAIZ / "dashboards.py"))
+    args = parser.parse_args(argv)
+
+    caminho = str(dataset_sintetico(args.linhas))
+    # Garante os caches (colunar e compartilhado) antes de medir
+    medir_processos("compartilhado", caminho, 1)
+
+    rss = medir_sessoes(args.script, caminho, args.sessoes, args.pagina)
+    print(f"Sessões ({args.pagina}, {args.linhas} linhas):")
+    for i in range(1, len(rss)):
+        print(f"    {i} sessão(ões): RSS {rss[i]:8.1f} MB (+{rss[i] - rss[i - 1]:6.1f} MB)")
+    if len(rss) > 2:
+        print(f"    por sessão adicional: +{(rss[-1] - rss[1]) / (len(rss) - 2):.1f} MB")
+
+    print(f"Processos ({args.processos} ao mesmo tempo):")
+    for modo in ("cópia própria", "compartilhado"):
+        medidas = medir_processos("compartilhado" if modo == "compartilhado" else "copia", caminho, args.processos)
+        print(f"    {modo:>14}: RSS {sum(r for r, _ in medidas):8.1f} MB | PSS {sum(p for _, p in medidas):8.1f} MB"
+              f" (PSS por processo: {' '.join(f'{p:.1f}' for _, p in medidas)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
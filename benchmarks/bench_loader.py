@@ -0,0 +1,57 @@
+"""Compara o carregamento do CSV original com o cache colunar tipado.
+
+Uso:
+    python benchmarks/bench_loader.py [caminho_csv]
+
+Cada modo roda em um subprocesso novo para que o RSS medido seja apenas o
+do carregamento.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+MEDICAO = r"""
+import json, resource, sys, time
+sys.path.insert(0, {raiz!r})
+import pandas as pd
+from pvd.loader import load_dataset
+
+rss_antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+inicio = time.perf_counter()
+if {modo!r} == "csv":
+    df = pd.read_csv({caminho!r}, sep=",", decimal=",", header=0)
+else:
+    df, _ = load_dataset({caminho!r}, cache_dir={cache!r})
+tempo = time.perf_counter() - inicio
+rss_depois = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "tempo_s": tempo,
+    "rss_delta_mb": (rss_depois - rss_antes) / 1024,
+    "df_mb": df.memory_usage(deep=True).sum() / 2**20,
+}}))
+"""
+
+
+def medir(modo, caminho, cache):
+    codigo = MEDICAO.format(raiz=str(RAIZ), modo=modo, caminho=caminho, cache=cache)
+    saida = subprocess.run([sys.executable, "-c", codigo], check=True, capture_output=True, text=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    caminho = sys.argv[1] if len(sys.argv) > 1 else str(RAIZ / "data_processada_final.csv")
+    cache = str(RAIZ / ".cache" / "bench_loader")
+
+    # Garante que o cache exista antes de medir a leitura a partir dele
+    medir("cache", caminho, cache)
+
+    for modo in ("csv", "cache"):
+        r = medir(modo, caminho, cache)
+        print(f"{modo:>5}: {r['tempo_s'] * 1000:8.1f} ms | RSS +{r['rss_delta_mb']:6.1f} MB | DataFrame {r['df_mb']:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
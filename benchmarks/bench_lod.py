@@ -0,0 +1,59 @@
+"""Tamanho do payload e tempo de serialização do scatter_3d por modo de LOD.
+
+Uso:
+    python benchmarks/bench_lod.py [caminho_csv]
+
+O tempo de renderização no navegador não é medido aqui; para isso, use a
+aba Performance das ferramentas de desenvolvedor ao trocar o modo na página.
+"""
+import sys
+import time
+from pathlib import Path
+
+import plotly.express as px
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from pvd.loader import load_dataset  # noqa: E402
+from pvd.lod import MODOS, reduzir  # noqa: E402
+from pvd.projection import ProjectionStore  # noqa: E402
+
+
+def figura(dados, cor, forma):
+    voxels = "contagem" in dados.columns
+    fig = px.scatter_3d(dados, x="PC1", y="PC2", z="PC3", color=cor, symbol=forma,
+                        size="contagem" if voxels else None, size_max=20)
+    if voxels:
+        fig.update_traces(marker=dict(line=dict(width=2, color="black")))
+    else:
+        fig.update_traces(marker=dict(size=6, line=dict(width=2, color="black")))
+    return fig
+
+
+def main():
+    caminho = sys.argv[1] if len(sys.argv) > 1 else str(RAIZ / "data_processada_final.csv")
+    df, versao = load_dataset(caminho)
+    colunas = df.select_dtypes(include=["number"]).columns.tolist()
+    projecao = ProjectionStore().get(df, versao, colunas)
+    cor, forma = "income", "sex_Male"
+    dados = df[[cor, forma]].assign(
+        PC1=projecao.componentes[:, 0], PC2=projecao.componentes[:, 1], PC3=projecao.componentes[:, 2]
+    )
+
+    for modo in MODOS:
+        for orcamento in ([len(dados)] if modo == "todos" else [2000, 10000, 50000]):
+            inicio = time.perf_counter()
+            reduzido = reduzir(dados, ["PC1", "PC2", "PC3"], [cor, forma], modo=modo, orcamento=orcamento)
+            tempo_reducao = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            payload = figura(reduzido, cor, forma).to_json()
+            tempo_json = time.perf_counter() - inicio
+            print(f"{modo:>13} | orçamento {orcamento:6d} | {len(reduzido):6d} marcadores | "
+                  f"{len(payload) / 1024:7.0f} KB | redução {tempo_reducao * 1000:5.1f} ms | "
+                  f"figura+JSON {tempo_json * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
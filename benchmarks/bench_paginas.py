@@ -0,0 +1,210 @@
+"""Latência e memória de cada página do dashboard, medidas com o AppTest do Streamlit.
+
+Uso:
+    python benchmarks/bench_paginas.py [--linhas N] [--repeticoes R] [--sem-memoria]
+                                       [--gravar-baseline arquivo.json | --baseline arquivo.json]
+
+O `dashboards.py` roda sem navegador sobre um dataset sintético com as
+mesmas colunas do `data_processada_final.csv` (gerado e guardado em
+.cache/bench na primeira vez), com N linhas. Para cada página são aplicadas
+as combinações de widgets de CENARIOS, cada uma em uma sessão nova:
+abrir a página é uma reexecução e aplicar os widgets é outra. De cada
+reexecução são registrados o tempo e o pico de memória alocada (tracemalloc;
+com --sem-memoria só o tempo, sem o custo do rastreamento).
+
+Com --gravar-baseline os resultados (medianas das repetições) são gravados
+em JSON; com --baseline são comparados a um arquivo gravado antes, e o
+script termina com erro se alguma reexecução ficou mais lenta ou usou mais
+memória do que a tolerância permite. Só compare medições feitas com o mesmo
+número de linhas e o mesmo modo de memória.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from benchmarks.synthetic import gerar_processado  # noqa: E402
+from pvd.preprocessing import FORMATO_CSV  # noqa: E402
+
+# (tipo do widget, início do rótulo, valor)
+CENARIOS = {
+    "Hipotese 1": {
+        "padrão": [],
+        "heatmap spearman": [("radio", "Correlação:", "spearman")],
+        "heatmap 10 atributos": [("multiselect", "Selecione os atributos para o Heatmap",
+                                  ["income", "sex_Male", "education-num", "age", "hours-per-week", "race_White",
+                                   "race_Black", "workclass_Private", "marital-status_Never-married",
+                                   "investment_status"])],
+        "apriori sex_Male x income": [("multiselect", "Selecione dois atributos", ["sex_Male", "income"])],
+        "apriori race_White x workclass_Private": [("multiselect", "Selecione dois atributos",
+                                                    ["race_White", "workclass_Private"])],
+        "fp-growth education-num x income": [("multiselect", "Selecione dois atributos", ["education-num", "income"]),
+                                             ("radio", "Algoritmo:", "fpgrowth")],
+        "pca incremental": [("radio", "Método do PCA:", "incremental")],
+        "pca voxels": [("radio", "Modo de exibição:", "voxels")],
+    },
+    "Hipotese 2": {
+        "padrão": [],
+        "workclass_Private": [("selectbox", "Selecione a classe de trabalho:", "workclass_Private")],
+        "latinos": [("checkbox", "Selecionar todos os países menos os EUA", False),
+                    ("checkbox", "Selecionar todos os Países **Latinos**", True)],
+        "asiáticos x europeus": [("checkbox", "Selecionar todos os países menos os EUA", False),
+                                 ("checkbox", "Selecionar todos os Países **Europeus**", True),
+                                 ("multiselect", "Selecione os países do Grupo A",
+                                  ["China", "India", "Japan", "Philippines"])],
+        "latinos em State-gov": [("checkbox", "Selecionar todos os países menos os EUA", False),
+                                 ("checkbox", "Selecionar todos os Países **Latinos**", True),
+                                 ("selectbox", "Selecione a classe de trabalho:", "workclass_State-gov")],
+    },
+    "Hipotese 3": {
+        "padrão": [],
+        "workclass_Private": [("selectbox", "Selecione a classe de trabalho:", "workclass_Private")],
+        "ensino médio a bacharel": [("select_slider", "Selecione o intervalo de education-num", (0.25, 0.75))],
+        "pós-graduação em Self-emp-inc": [("selectbox", "Selecione a classe de trabalho:", "workclass_Self-emp-inc"),
+                                          ("select_slider", "Selecione o intervalo de education-num", (0.875, 1))],
+    },
+    "Hipotese 4": {
+        "padrão": [],
+        "workclass_Private": [("selectbox", "Selecione a classe de trabalho:", "workclass_Private")],
+        "40h semanais": [("selectbox", "Selecione a carga horária", 0.5)],
+        "Local-gov, mais de 40h": [("selectbox", "Selecione a classe de trabalho:", "workclass_Local-gov"),
+                                   ("selectbox", "Selecione a carga horária", 1)],
+    },
+    "Hipotese 5": {
+        "padrão": [],
+        "20 a 30 anos": [("slider", "Selecione uma faixa etária", (20, 30))],
+        "40 a 60 anos sem zeros": [("slider", "Selecione uma faixa etária", (40, 60)),
+                                   ("checkbox", "Desconsiderar pessoas com investimento 0", True)],
+        "limite de 5000": [("number_input", "Digite o valor máximo", 5000)],
+    },
+}
+
+
+def dataset_sintetico(n_linhas, seed=0):
+    caminho = RAIZ / ".cache" / "bench" / f"processado-{n_linhas}-{seed}.csv"
+    if not caminho.exists():
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        gerar_processado(n_linhas, seed=seed).to_csv(caminho, **FORMATO_CSV)
+    return caminho
+
+
+def widget(at, tipo, rotulo):
+    for elemento in getattr(at, tipo):
+        if elemento.label.startswith(rotulo):
+            return elemento
+    raise LookupError(f"Widget {tipo} com rótulo {rotulo!r} não encontrado")
+
+
+def reexecutar(at, memoria):
+    """Executa o script uma vez, devolvendo (tempo em ms, pico de memória em MB)."""
+    if memoria:
+        tracemalloc.reset_peak()
+    inicio = time.perf_counter()
+    at.run()
+    tempo = (time.perf_counter() - inicio) * 1000
+    pico = tracemalloc.get_traced_memory()[1] / 2**20 if memoria else None
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return tempo, pico
+
+
+def medir_cenario(script, pagina, acoes, memoria):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(script), default_timeout=600)
+    at.run()
+    at.sidebar.selectbox[0].set_value(pagina)
+    medidas = {"abrir": reexecutar(at, memoria)}
+    if acoes:
+        for tipo, rotulo, valor in acoes:
+            widget(at, tipo, rotulo).set_value(valor)
+        medidas["widgets"] = reexecutar(at, memoria)
+    return medidas
+
+
+def executar(script, repeticoes, memoria):
+    """Medianas de tempo e pico por "página/cenário/reexecução"."""
+    amostras = {}
+    for _ in range(repeticoes):
+        for pagina, cenarios in CENARIOS.items():
+            for nome, acoes in cenarios.items():
+                for etapa, medida in medir_cenario(script, pagina, acoes, memoria).items():
+                    amostras.setdefault(f"{pagina}/{nome}/{etapa}", []).append(medida)
+    resultados = {}
+    for chave, medidas in amostras.items():
+        tempos = [t for t, _ in medidas]
+        picos = [p for _, p in medidas if p is not None]
+        resultados[chave] = {
+            "tempo_ms": statistics.median(tempos),
+            "tempo_max_ms": max(tempos),
+            "pico_mb": statistics.median(picos) if picos else None,
+        }
+    return resultados
+
+
+def regressoes(resultados, baseline, tolerancia, folga_ms, folga_mb):
+    encontradas = []
+    for chave, base in baseline["resultados"].items():
+        atual = resultados.get(chave)
+        if atual is None:
+            continue
+        if atual["tempo_ms"] > base["tempo_ms"] * tolerancia + folga_ms:
+            encontradas.append(f"{chave}: {base['tempo_ms']:.0f} ms -> {atual['tempo_ms']:.0f} ms")
+        if base["pico_mb"] is not None and atual["pico_mb"] is not None \
+                and atual["pico_mb"] > base["pico_mb"] * tolerancia + folga_mb:
+            encontradas.append(f"{chave}: pico {base['pico_mb']:.1f} MB -> {atual['pico_mb']:.1f} MB")
+    return encontradas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das páginas do dashboard com o AppTest.")
+    parser.add_argument("--linhas", type=int, default=41000, help="linhas do dataset sintético")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória (tracemalloc)")
+    parser.add_argument("--script", default=str(RAIZ / "dashboards.py"))
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument("--gravar-baseline", metavar="ARQUIVO")
+    grupo.add_argument("--baseline", metavar="ARQUIVO")
+    parser.add_argument("--tolerancia", type=float, default=1.25, help="razão máxima em relação à baseline")
+    parser.add_argument("--folga-ms", type=float, default=25.0)
+    parser.add_argument("--folga-mb", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    memoria = not args.sem_memoria
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    if baseline is not None and (baseline["linhas"], baseline["memoria"]) != (args.linhas, memoria):
+        parser.error("a baseline foi medida com outro número de linhas ou outro modo de memória")
+
+    os.environ["PVD_DADOS"] = str(dataset_sintetico(args.linhas))
+    if memoria:
+        tracemalloc.start()
+    resultados = executar(args.script, args.repeticoes, memoria)
+
+    for chave, r in resultados.items():
+        pico = f" | pico {r['pico_mb']:7.1f} MB" if r["pico_mb"] is not None else ""
+        print(f"{chave:<65} {r['tempo_ms']:8.1f} ms (máx {r['tempo_max_ms']:8.1f}){pico}")
+
+    medicao = {"linhas": args.linhas, "memoria": memoria, "resultados": resultados}
+    if args.gravar_baseline:
+        Path(args.gravar_baseline).write_text(json.dumps(medicao, indent=2, ensure_ascii=False))
+        print(f"Baseline gravada em {args.gravar_baseline}")
+    elif baseline is not None:
+        encontradas = regressoes(resultados, baseline, args.tolerancia, args.folga_ms, args.folga_mb)
+        if encontradas:
+            print("Regressões em relação à baseline:")
+            for regressao in encontradas:
+                print(f"    {regressao}")
+            return 1
+        print("Nenhuma regressão em relação à baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Compara o pré-processamento vetorizado com a versão do notebook (apply).
+
+Uso:
+    python benchmarks/bench_preprocessing.py [--bruto adult.csv] [--linhas 48842] [--chunksize 10000]
+
+Sem `--bruto`, usa dados sintéticos no formato de `adult.data.original`.
+Além dos tempos, verifica que os CSVs gerados são idênticos byte a byte,
+inclusive com blocos pequenos (`--chunksize-pequeno`): as duplicatas dos
+dados sintéticos ficam no fim do arquivo, então os últimos blocos ficam
+vazios depois da deduplicação. Termina com erro se alguma saída diferir.
+"""
+import argparse
+import filecmp
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from sklearn.preprocessing import MinMaxScaler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import gerar_bruto  # noqa: E402
+from pvd.preprocessing import FORMATO_CSV, processar_arquivo  # noqa: E402
+
+
+def notebook(data):
+    """Etapas do notebook, copiadas como estão (apply linha a linha)."""
+    data = data.drop(columns=['education', 'fnlwgt'])
+    data = data.drop_duplicates()
+    data = data.dropna()
+    data = data.replace('?', pd.NA)
+    data = data.dropna()
+    data['income'] = data['income'].apply(lambda x: 0 if x in ['<=50K', '<=50K.'] else 1)
+    data['native-country'] = data['native-country'].apply(lambda x: 1 if x == 'United-States' else 0)
+
+    target_columns = ['workclass', 'marital-status', 'occupation', 'relationship', 'race', 'sex']
+    data_encoded_columns = pd.get_dummies(data[target_columns], drop_first=True, dtype=int)
+    data = pd.concat([data.drop(columns=target_columns), data_encoded_columns], axis=1)
+
+    data['investment_status_naoDiscretizado'] = data.apply(lambda row: 0 if row['capital-gain'] == 0 and row['capital-loss'] == 0 else (row['capital-gain'] if row['capital-gain'] > 0 else -1 * row['capital-loss']), axis=1)
+    data['investment_status'] = data.apply(lambda row: 0 if row['capital-gain'] == 0 and row['capital-loss'] == 0 else (0.5 if row['capital-gain'] > 0 else 1), axis=1)
+    data = data.drop(columns=['capital-gain', 'capital-loss'])
+    data['hours-per-week'] = data.apply(lambda row: 0 if row['hours-per-week'] < 40 else (0.5 if row['hours-per-week'] == 40 else 1), axis=1)
+    data['education-num'] = data['education-num'].apply(lambda x: 8 if x <= 8 else x)
+
+    data['age_naoDiscretizada'] = data['age']
+    scaler = MinMaxScaler()
+    data[['age', 'education-num', 'hours-per-week']] = scaler.fit_transform(data[['age', 'education-num', 'hours-per-week']])
+    return data
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bruto", help="CSV bruto; se omitido, gera dados sintéticos")
+    parser.add_argument("--linhas", type=int, default=48842)
+    parser.add_argument("--chunksize", type=int, default=10000)
+    parser.add_argument("--chunksize-pequeno", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        bruto = Path(args.bruto) if args.bruto else tmp / "adult.csv"
+        if not args.bruto:
+            gerar_bruto(args.linhas).to_csv(bruto, index=False)
+
+        saidas = {nome: tmp / f"{nome}.csv" for nome in ("apply", "vetorizado", "blocos", "blocos pequenos")}
+        tempos = {
+            "apply": cronometrar(lambda: notebook(pd.read_csv(bruto)).to_csv(saidas["apply"], **FORMATO_CSV)),
+            "vetorizado": cronometrar(lambda: processar_arquivo(bruto, saidas["vetorizado"])),
+            "blocos": cronometrar(lambda: processar_arquivo(bruto, saidas["blocos"], chunksize=args.chunksize)),
+            "blocos pequenos": cronometrar(lambda: processar_arquivo(bruto, saidas["blocos pequenos"],
+                                                                     chunksize=args.chunksize_pequeno)),
+        }
+
+        diferentes = []
+        for nome, tempo in tempos.items():
+            identico = filecmp.cmp(saidas["apply"], saidas[nome], shallow=False)
+            if not identico:
+                diferentes.append(nome)
+            print(f"{nome:>15}: {tempo:7.3f} s ({tempos['apply'] / tempo:5.1f}x) | idêntico ao notebook: {identico}")
+    return 1 if diferentes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
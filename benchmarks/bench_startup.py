@@ -0,0 +1,77 @@
+"""Tempo até a primeira renderização da página "Dataset" e imports feitos nela.
+
+Uso (a partir da pasta que contém data_processada_final.csv):
+    python benchmarks/bench_startup.py [script ...]
+
+Cada script (padrão: dashboards.py) roda em um subprocesso novo com
+`python -X importtime`, pelo AppTest do Streamlit. São somados os tempos
+de import feitos durante a primeira execução do app (depois do próprio
+Streamlit já carregado), agrupados por pacote. Para comparar com uma
+versão anterior do dashboard:
+
+    git show <commit>:dashboards.py > /tmp/dashboards_antigo.py
+    python benchmarks/bench_startup.py /tmp/dashboards_antigo.py dashboards.py
+"""
+import json
+import re
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+MARCADOR = "-- inicio do app --"
+PACOTES = ["sklearn", "scipy", "mlxtend", "seaborn", "matplotlib", "mpl_toolkits", "plotly", "pandas", "pyarrow", "pvd"]
+
+MEDICAO = r"""
+import json, sys, time
+sys.path.insert(0, {raiz!r})
+from streamlit.testing.v1 import AppTest
+
+sys.stderr.write({marcador!r} + "\n")
+sys.stderr.flush()
+inicio = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=600)
+at.run()
+tempo = time.perf_counter() - inicio
+print(json.dumps({{"tempo_s": tempo, "excecoes": [str(e.value) for e in at.exception]}}))
+"""
+
+LINHA_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)")
+
+
+def medir(script):
+    codigo = MEDICAO.format(raiz=str(RAIZ), marcador=MARCADOR, script=str(Path(script).resolve()))
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                           check=True, capture_output=True, text=True)
+    resultado = json.loads(saida.stdout.strip().splitlines()[-1])
+
+    por_pacote = Counter()
+    depois_do_marcador = False
+    for linha in saida.stderr.splitlines():
+        if linha.startswith(MARCADOR):
+            depois_do_marcador = True
+            continue
+        casamento = LINHA_IMPORTTIME.match(linha)
+        if depois_do_marcador and casamento:
+            por_pacote[casamento.group(2).split(".")[0]] += int(casamento.group(1))
+    resultado["imports_us"] = por_pacote
+    return resultado
+
+
+def main():
+    scripts = sys.argv[1:] or [str(RAIZ / "dashboards.py")]
+    for script in scripts:
+        r = medir(script)
+        imports = r["imports_us"]
+        print(f"{script}: primeira renderização em {r['tempo_s'] * 1000:.0f} ms | "
+              f"imports durante a execução: {sum(imports.values()) / 1000:.0f} ms")
+        for pacote in PACOTES:
+            if imports.get(pacote):
+                print(f"    {pacote:<12} {imports[pacote] / 1000:8.1f} ms")
+        if r["excecoes"]:
+            print(f"    exceções: {r['excecoes']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Geração de dados sintéticos com o mesmo formato do dataset Adult bruto.
+
+As proporções das categorias seguem as contagens mostradas no notebook;
+não há nenhuma relação realista entre os atributos.
+"""
+import numpy as np
+import pandas as pd
+
+WORKCLASS = {
+    "Private": 33906, "Self-emp-not-inc": 3862, "Local-gov": 3136, "State-gov": 1981, "?": 1836,
+    "Self-emp-inc": 1695, "Federal-gov": 1432, "Without-pay": 21, "Never-worked": 10,
+}
+EDUCATION = [
+    "Preschool", "1st-4th", "5th-6th", "7th-8th", "9th", "10th", "11th", "12th", "HS-grad",
+    "Some-college", "Assoc-voc", "Assoc-acdm", "Bachelors", "Masters", "Prof-school", "Doctorate",
+]
+MARITAL_STATUS = [
+    "Married-civ-spouse", "Never-married", "Divorced", "Separated", "Widowed",
+    "Married-spouse-absent", "Married-AF-spouse",
+]
+OCCUPATION = [
+    "Tech-support", "Craft-repair", "Other-service", "Sales", "Exec-managerial", "Prof-specialty",
+    "Handlers-cleaners", "Machine-op-inspct", "Adm-clerical", "Farming-fishing", "Transport-moving",
+    "Priv-house-serv", "Protective-serv", "Armed-Forces", "?",
+]
+RELATIONSHIP = ["Wife", "Own-child", "Husband", "Not-in-family", "Other-relative", "Unmarried"]
+RACE = ["White", "Asian-Pac-Islander", "Amer-Indian-Eskimo", "Other", "Black"]
+PAISES = [
+    "Haiti", "Cuba", "Jamaica", "Mexico", "Dominican-Republic", "Peru", "Puerto-Rico", "Honduras",
+    "Ecuador", "El-Salvador", "Guatemala", "Trinadad&Tobago", "Nicaragua", "China", "India",
+    "Philippines", "Cambodia", "Thailand", "Laos", "Taiwan", "Japan", "Vietnam", "Hong", "England",
+    "Germany", "Poland", "Portugal", "France", "Italy", "Scotland", "Greece", "Ireland", "Hungary",
+    "Holand-Netherlands", "Yugoslavia", "Canada", "Iran", "Columbia", "South",
+    "Outlying-US(Guam-USVI-etc)", "?",
+]
+INCOME = {"<=50K": 0.5, ">50K": 0.16, "<=50K.": 0.26, ">50K.": 0.08}
+
+
+def gerar_bruto(n_linhas=48842, seed=0, fracao_duplicadas=0.1):
+    """DataFrame com as 15 colunas de `adult.data.original`."""
+    rng = np.random.default_rng(seed)
+    n = n_linhas
+
+    pesos_workclass = np.array(list(WORKCLASS.values()), dtype=float)
+    indice_educacao = rng.integers(0, len(EDUCATION), n)
+    ganho = np.where(rng.random(n) < 0.08, rng.choice([2174, 3103, 4386, 5178, 7688, 15024, 99999], n), 0)
+    perda = np.where((ganho == 0) & (rng.random(n) < 0.05), rng.choice([1887, 1902, 1977, 2415, 4356], n), 0)
+    # ~90% dos entrevistados são dos EUA
+    paises = np.where(rng.random(n) < 0.9, "United-States", rng.choice(PAISES, n))
+
+    data = pd.DataFrame({
+        "age": rng.integers(17, 91, n),
+        "workclass": rng.choice(list(WORKCLASS), n, p=pesos_workclass / pesos_workclass.sum()),
+        "fnlwgt": rng.integers(12285, 1490401, n),
+        "education": np.array(EDUCATION)[indice_educacao],
+        "education-num": indice_educacao + 1,
+        "marital-status": rng.choice(MARITAL_STATUS, n),
+        "occupation": rng.choice(OCCUPATION, n),
+        "relationship": rng.choice(RELATIONSHIP, n),
+        "race": rng.choice(RACE, n),
+        "sex": rng.choice(["Male", "Female"], n, p=[0.67, 0.33]),
+        "capital-gain": ganho,
+        "capital-loss": perda,
+        "hours-per-week": np.clip(rng.normal(40, 12, n).round(), 1, 99).astype(int),
+        "native-country": paises,
+        "income": rng.choice(list(INCOME), n, p=list(INCOME.values())),
+    })
+    # Valores ausentes como os do fetch_ucirepo (NA) e linhas repetidas
+    data.loc[rng.random(n) < 0.01, "workclass"] = np.nan
+    n_duplicadas = int(n * fracao_duplicadas)
+    if n_duplicadas:
+        data.iloc[n - n_duplicadas:] = data.iloc[rng.integers(0, n - n_duplicadas, n_duplicadas)].to_numpy()
+    return data
+
+
+def gerar_processado(n_linhas=41000, seed=0):
+    """Dataset no formato do `data_processada_final.csv`, com exatamente `n_linhas` linhas.
+
+    Gera linhas brutas e passa pelo mesmo pré-processamento do notebook
+    (`pvd.preprocessing.processar`), que remove duplicadas e linhas com NA.
+    """
+    from pvd.preprocessing import processar
+
+    # A limpeza descarta ~8% das linhas ("?", NA e duplicadas ao acaso); gera com margem e corta
+    fator = 1.15
+    while True:
+        bruto = gerar_bruto(int(n_linhas * fator) + 100, seed=seed, fracao_duplicadas=0)
+        processado = processar(bruto, manter_nome_pais=True)
+        if len(processado) >= n_linhas:
+            return processado.iloc[:n_linhas]
+        fator *= 1.1
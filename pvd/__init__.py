@@ -0,0 +1 @@
+"""Módulos de apoio ao dashboard do Censo norte-americano de 1994."""
@@ -0,0 +1,185 @@
+"""Backends de consulta: de onde saem as contagens agregadas das páginas.
+
+As Hipóteses 2 a 5 só precisam de contagens por combinação de colunas (o
+cubo de contagens e os pares idade x investimento da Hipótese 5). Um
+backend responde a `count_by(colunas, filtros)` com um DataFrame das
+combinações presentes e a coluna "count":
+
+- "pandas" (padrão): o DataFrame compartilhado de `pvd.shared`, inteiro na
+  memória, como sempre foi;
+- "duckdb": o DuckDB lê o CSV ou os arquivos Parquet em disco (um arquivo,
+  um glob como `dados/*.parquet` ou uma pasta) e executa filtros e
+  agrupamentos ele mesmo, devolvendo só o resultado agregado. As linhas
+  nunca entram no processo Python, então o dataset pode ser maior que a
+  memória.
+
+O backend é escolhido ao iniciar o dashboard pela variável de ambiente
+PVD_BACKEND. Páginas que precisam das linhas (Dataset e Hipótese 1) recebem,
+no backend "duckdb", uma amostra aleatória de `AMOSTRA_LINHAS` linhas.
+"""
+import glob
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from pvd.cube import WORKCLASS_BASE, coluna_workclass, colunas_workclass
+from pvd.loader import CACHE_DIR_PADRAO, DATASET_PADRAO, dataset_version, schema
+
+BACKEND_PADRAO = "pandas"
+AMOSTRA_LINHAS = 200_000
+SEMENTE_AMOSTRA = 42
+
+# Coluna derivada disponível nos dois backends: a classe de trabalho reconstruída das colunas one-hot
+COLUNA_WORKCLASS = "workclass"
+
+
+def _mascara(df, filtros):
+    mascara = None
+    for coluna, valores in (filtros or {}).items():
+        valores = list(valores) if isinstance(valores, (list, tuple, set, frozenset)) else [valores]
+        serie = coluna_workclass(df) if coluna == COLUNA_WORKCLASS else df[coluna]
+        atual = pd.Series(serie, index=df.index).isin(valores).to_numpy()
+        mascara = atual if mascara is None else mascara & atual
+    return mascara
+
+
+class PandasBackend:
+    """Contagens calculadas sobre o DataFrame inteiro na memória."""
+
+    nome = "pandas"
+    linhas_em_memoria = True
+
+    def __init__(self, df, versao):
+        self.df = df
+        self.versao = versao
+
+    @classmethod
+    def abrir(cls, caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+        from pvd.shared import load_shared_dataset
+        return cls(*load_shared_dataset(caminho, cache_dir))
+
+    def n_linhas(self):
+        return len(self.df)
+
+    def count_by(self, colunas, filtros=None):
+        df = self.df
+        mascara = _mascara(df, filtros)
+        if mascara is not None:
+            df = df[mascara]
+        dados = {c: (coluna_workclass(df) if c == COLUNA_WORKCLASS else df[c].to_numpy()) for c in colunas}
+        return pd.DataFrame(dados).value_counts(sort=False).rename("count").reset_index()
+
+    def dataframe(self):
+        return self.df
+
+
+def _arquivos(caminho):
+    """Arquivos de dados de um caminho, glob ou pasta (Parquet ou CSV)."""
+    caminho = str(caminho)
+    if os.path.isdir(caminho):
+        arquivos = sorted(Path(caminho).glob("*.parquet"))
+    elif glob.has_magic(caminho):
+        arquivos = sorted(Path(a) for a in glob.glob(caminho))
+    else:
+        arquivos = [Path(caminho)]
+    if not arquivos:
+        raise FileNotFoundError(f"Nenhum arquivo de dados em {caminho!r}")
+    return arquivos
+
+
+def _literal(valor):
+    return "'" + str(valor).replace("'", "''") + "'"
+
+
+class DuckDBBackend:
+    """Contagens calculadas pelo DuckDB direto dos arquivos, sem carregar as linhas."""
+
+    nome = "duckdb"
+    linhas_em_memoria = False
+
+    def __init__(self, caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO, amostra_linhas=AMOSTRA_LINHAS):
+        import duckdb
+
+        self.arquivos = _arquivos(caminho)
+        self.amostra_linhas = amostra_linhas
+        self._conexao = duckdb.connect()
+        lista = "[" + ", ".join(_literal(a) for a in self.arquivos) + "]"
+        if self.arquivos[0].suffix == ".csv":
+            # Mesmo formato do CSV do notebook: decimais com vírgula
+            origem = f"read_csv({lista}, header=true, decimal_separator=',')"
+        else:
+            origem = f"read_parquet({lista})"
+        self._conexao.execute(f"CREATE VIEW dados AS SELECT * FROM {origem}")
+        self.colunas = [linha[0] for linha in self._conexao.execute("DESCRIBE dados").fetchall()]
+
+        versoes = [dataset_version(a, cache_dir) for a in self.arquivos]
+        self.versao = versoes[0] if len(versoes) == 1 else hashlib.sha256("".join(versoes).encode()).hexdigest()[:16]
+        self._amostra = None
+
+    @classmethod
+    def abrir(cls, caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+        return cls(caminho, cache_dir)
+
+    def _consultar(self, sql):
+        # Um cursor por consulta: as páginas e o aquecimento consultam de threads diferentes
+        return self._conexao.cursor().execute(sql).df()
+
+    def _expressao(self, coluna):
+        if coluna != COLUNA_WORKCLASS:
+            return f'"{coluna}"'
+        # A primeira coluna one-hot ligada, como no argmax de `coluna_workclass`
+        casos = " ".join(f"WHEN \"{c}\" = 1 THEN {_literal(c)}" for c in colunas_workclass(self.colunas))
+        return f"CASE {casos} ELSE {_literal(WORKCLASS_BASE)} END"
+
+    def _where(self, filtros):
+        condicoes = []
+        for coluna, valores in (filtros or {}).items():
+            valores = list(valores) if isinstance(valores, (list, tuple, set, frozenset)) else [valores]
+            if not valores:
+                condicoes.append("FALSE")
+                continue
+            literais = ", ".join(_literal(v) if isinstance(v, str) else repr(v) for v in valores)
+            condicoes.append(f"{self._expressao(coluna)} IN ({literais})")
+        return " AND ".join(condicoes)
+
+    def n_linhas(self):
+        return int(self._consultar("SELECT count(*) AS n FROM dados")["n"].iloc[0])
+
+    def count_by(self, colunas, filtros=None):
+        selecao = ", ".join(f"{self._expressao(c)} AS \"{c}\"" for c in colunas)
+        # Como o value_counts do pandas, combinações com valores nulos ficam de fora
+        condicoes = [f"{self._expressao(c)} IS NOT NULL" for c in colunas]
+        if filtros:
+            condicoes.append(self._where(filtros))
+        sql = (f"SELECT {selecao}, count(*) AS count FROM dados WHERE {' AND '.join(condicoes)} "
+               f"GROUP BY ALL")
+        agregado = self._consultar(sql)
+        # Mesmos tipos do backend pandas (e a classe de trabalho na mesma ordem de `coluna_workclass`)
+        agregado = agregado.astype({"count": "int64", **schema(colunas)})
+        if COLUNA_WORKCLASS in colunas:
+            categorias = colunas_workclass(self.colunas) + [WORKCLASS_BASE]
+            agregado[COLUNA_WORKCLASS] = pd.Categorical(agregado[COLUNA_WORKCLASS], categories=categorias)
+        return agregado
+
+    def dataframe(self):
+        """Amostra aleatória (reprodutível) das linhas, com o mesmo schema do CSV processado."""
+        if self._amostra is None:
+            df = self._consultar(f"SELECT * FROM dados USING SAMPLE reservoir({self.amostra_linhas} ROWS) "
+                                 f"REPEATABLE ({SEMENTE_AMOSTRA})")
+            self._amostra = df.astype(schema(df.columns))
+        return self._amostra
+
+
+BACKENDS = {
+    PandasBackend.nome: PandasBackend,
+    DuckDBBackend.nome: DuckDBBackend,
+}
+
+
+def abrir_backend(nome=BACKEND_PADRAO, caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+    """Backend `nome` ("pandas" ou "duckdb") sobre os dados de `caminho`."""
+    if nome not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {nome!r} (opções: {', '.join(BACKENDS)})")
+    return BACKENDS[nome].abrir(caminho, cache_dir)
@@ -0,0 +1,100 @@
+"""Índice de bitmaps para compor filtros sem materializar DataFrames.
+
+Cada coluna one-hot e cada valor das colunas categóricas vira um bitset
+compactado (np.packbits, 1 bit por linha). Filtros são compostos com & | ~
+e contados por popcount, sem criar máscaras booleanas nem cópias do df.
+"""
+import numpy as np
+
+COLUNAS_CATEGORICAS = ("native-country-name", "education-num", "hours-per-week")
+
+if hasattr(np, "bitwise_count"):
+    def _popcount(bytes_):
+        return int(np.bitwise_count(bytes_).sum())
+else:
+    _BITS_POR_BYTE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(bytes_):
+        return int(_BITS_POR_BYTE[bytes_].sum(dtype=np.int64))
+
+
+class Bitmap:
+    """Conjunto de linhas representado por um bitset compactado."""
+
+    __slots__ = ("bytes", "n_linhas")
+
+    def __init__(self, bytes_, n_linhas):
+        self.bytes = bytes_
+        self.n_linhas = n_linhas
+
+    @classmethod
+    def from_mask(cls, mascara):
+        return cls(np.packbits(np.asarray(mascara, dtype=bool)), len(mascara))
+
+    def __and__(self, outro):
+        return Bitmap(self.bytes & outro.bytes, self.n_linhas)
+
+    def __or__(self, outro):
+        return Bitmap(self.bytes | outro.bytes, self.n_linhas)
+
+    def __invert__(self):
+        invertido = ~self.bytes
+        # Zera os bits de preenchimento do último byte
+        sobra = self.n_linhas % 8
+        if sobra:
+            invertido[-1] &= np.uint8((0xFF << (8 - sobra)) & 0xFF)
+        return Bitmap(invertido, self.n_linhas)
+
+    def contar(self):
+        """Número de linhas no conjunto (popcount)."""
+        return _popcount(self.bytes)
+
+    def linhas(self):
+        """Posições das linhas no conjunto."""
+        return np.flatnonzero(np.unpackbits(self.bytes, count=self.n_linhas))
+
+
+class BitmapIndex:
+    """Bitmaps de colunas one-hot (valor 1) e de cada valor das colunas categóricas."""
+
+    def __init__(self, n_linhas, bitmaps):
+        self.n_linhas = n_linhas
+        self._bitmaps = bitmaps
+
+    @classmethod
+    def from_frame(cls, df, colunas_categoricas=COLUNAS_CATEGORICAS):
+        bitmaps = {}
+        for coluna in df.columns:
+            valores = df[coluna]
+            if coluna in colunas_categoricas:
+                codigos, niveis = valores.factorize(sort=True)
+                for i, nivel in enumerate(niveis.tolist()):
+                    bitmaps[(coluna, nivel)] = Bitmap.from_mask(codigos == i)
+            elif valores.dtype.kind in "uib" and valores.isin([0, 1]).all():
+                bitmaps[(coluna, 1)] = Bitmap.from_mask(valores.to_numpy() == 1)
+        return cls(len(df), bitmaps)
+
+    def todos(self):
+        return ~Bitmap(np.zeros((self.n_linhas + 7) // 8, dtype=np.uint8), self.n_linhas)
+
+    def nenhum(self):
+        return Bitmap(np.zeros((self.n_linhas + 7) // 8, dtype=np.uint8), self.n_linhas)
+
+    def bits(self, coluna, valor=1):
+        """Linhas em que `coluna == valor`."""
+        if (coluna, valor) in self._bitmaps:
+            return self._bitmaps[(coluna, valor)]
+        if valor == 0 and (coluna, 1) in self._bitmaps:
+            return ~self._bitmaps[(coluna, 1)]
+        return self.nenhum()
+
+    def em(self, coluna, valores):
+        """Linhas em que o valor de `coluna` está em `valores` (OR dos bitmaps)."""
+        resultado = self.nenhum()
+        for valor in valores:
+            resultado = resultado | self.bits(coluna, valor)
+        return resultado
+
+    @property
+    def nbytes(self):
+        return sum(b.bytes.nbytes for b in self._bitmaps.values())
@@ -0,0 +1,149 @@
+"""Intervalos de confiança e testes de permutação para duas proporções.
+
+A renda é binária, então uma reamostragem bootstrap de um grupo com n
+pessoas, k delas acima de $50k, só depende de quantos "1" foram
+sorteados: cada réplica é um sorteio Binomial(n, k/n). Da mesma forma,
+permutar os rótulos dos dois grupos (teste de permutação da diferença)
+equivale a sortear quantos dos K "1" caem nas n_a posições do grupo A,
+uma Hipergeométrica(K, N - K, n_a). Milhares de réplicas são alguns
+vetores do NumPy, sem percorrer as linhas do DataFrame.
+
+As réplicas são divididas em blocos com sementes independentes
+(`SeedSequence.spawn`) e sorteadas em um pool de threads (os geradores do
+NumPy liberam o GIL). A semente de cada comparação vem das contagens,
+então o resultado é o mesmo com qualquer número de threads e em qualquer
+execução. Como as contagens determinam o resultado, o cache LRU é por
+(contagens, réplicas, nível): filtros diferentes com as mesmas contagens
+reaproveitam a mesma entrada.
+"""
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+REPLICAS_PADRAO = 10_000
+NIVEL_PADRAO = 0.95
+SEMENTE = 2024
+BLOCOS = 8
+
+
+@dataclass(frozen=True)
+class Comparacao:
+    """Proporções (entre 0 e 1) dos grupos A e B, intervalos bootstrap e p-valor da diferença."""
+    proporcao_a: float
+    proporcao_b: float
+    intervalo_a: tuple
+    intervalo_b: tuple
+    diferenca: float
+    intervalo_diferenca: tuple
+    p_valor: float
+    replicas: int
+    nivel: float
+
+
+def _tamanhos_blocos(replicas, blocos):
+    base, resto = divmod(replicas, blocos)
+    return [base + (i < resto) for i in range(blocos) if base + (i < resto) > 0]
+
+
+def _sortear_bloco(semente, tamanho, sucessos_a, total_a, sucessos_b, total_b):
+    """Diferenças B - A de um bloco de réplicas: (bootstrap de A, bootstrap de B, permutação)."""
+    rng = np.random.default_rng(semente)
+    boot_a = rng.binomial(total_a, sucessos_a / total_a, size=tamanho) / total_a
+    boot_b = rng.binomial(total_b, sucessos_b / total_b, size=tamanho) / total_b
+    # Permutação dos rótulos: quantos dos sucessos somados caem no grupo A
+    sucessos = sucessos_a + sucessos_b
+    perm_a = rng.hypergeometric(sucessos, total_a + total_b - sucessos, total_a, size=tamanho)
+    perm = (sucessos - perm_a) / total_b - perm_a / total_a
+    return boot_a, boot_b, perm
+
+
+class Bootstrap:
+    """Comparações de proporções com réplicas vetorizadas, em paralelo e memoizadas."""
+
+    def __init__(self, replicas=REPLICAS_PADRAO, nivel=NIVEL_PADRAO, max_threads=None, max_entradas=1024):
+        self.replicas = replicas
+        self.nivel = nivel
+        self.max_threads = max_threads or min(BLOCOS, os.cpu_count() or 1)
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    def _mapear(self, funcao, argumentos):
+        if self.max_threads == 1:
+            return [funcao(*a) for a in argumentos]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="pvd-bootstrap")
+        return list(self._executor.map(lambda a: funcao(*a), argumentos))
+
+    def comparar(self, sucessos_a, total_a, sucessos_b, total_b, replicas=None, nivel=None):
+        """Comparação do grupo A (sucessos_a de total_a) com o B; None se algum grupo estiver vazio."""
+        replicas = replicas or self.replicas
+        nivel = nivel or self.nivel
+        contagens = tuple(int(c) for c in (sucessos_a, total_a, sucessos_b, total_b))
+        if contagens[1] == 0 or contagens[3] == 0:
+            return None
+
+        chave = (contagens, replicas, nivel)
+        with self._lock:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return self._entradas[chave]
+            self.faltas += 1
+
+        sementes = np.random.SeedSequence([SEMENTE, *contagens]).spawn(BLOCOS)
+        blocos = self._mapear(_sortear_bloco, [(semente, tamanho, *contagens) for semente, tamanho
+                                               in zip(sementes, _tamanhos_blocos(replicas, BLOCOS))])
+        boot_a, boot_b, perm = (np.concatenate(partes) for partes in zip(*blocos))
+
+        sucessos_a, total_a, sucessos_b, total_b = contagens
+        proporcao_a, proporcao_b = sucessos_a / total_a, sucessos_b / total_b
+        diferenca = proporcao_b - proporcao_a
+        alfa = (1 - nivel) / 2
+        quantis = [alfa, 1 - alfa]
+        intervalo_a, intervalo_b, intervalo_diferenca = (
+            tuple(np.quantile(amostra, quantis).tolist()) for amostra in (boot_a, boot_b, boot_b - boot_a))
+        # Bicaudal; a tolerância evita que empates exatos se percam no arredondamento
+        extremos = np.count_nonzero(np.abs(perm) >= abs(diferenca) - 1e-12)
+        p_valor = (extremos + 1) / (replicas + 1)
+
+        resultado = Comparacao(proporcao_a, proporcao_b, intervalo_a, intervalo_b, diferenca,
+                               intervalo_diferenca, p_valor, replicas, nivel)
+        with self._lock:
+            self._entradas[chave] = resultado
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+        return resultado
+
+    def estatisticas(self):
+        with self._lock:
+            return {"entradas": len(self._entradas), "acertos": self.acertos, "faltas": self.faltas}
+
+
+def formatar_p(comparacao):
+    """p-valor com 4 casas; no limite de resolução das réplicas, "< 1/réplicas"."""
+    if comparacao.p_valor <= 1 / (comparacao.replicas + 1):
+        return f"< {1 / comparacao.replicas:.4f}"
+    return f"{comparacao.p_valor:.4f}"
+
+
+def descrever(comparacao, rotulo_a, rotulo_b):
+    """Parágrafo em markdown com os intervalos e o p-valor, para as descrições das páginas."""
+    if comparacao is None:
+        return ""
+    (a_min, a_max), (b_min, b_max) = comparacao.intervalo_a, comparacao.intervalo_b
+    d_min, d_max = comparacao.intervalo_diferenca
+    return f"""
+        **Incerteza das proporções:** com {comparacao.replicas} reamostragens bootstrap, o intervalo de {comparacao.nivel:.0%} de confiança
+        da proporção que ganha mais de \\$50.000 é de {a_min:.1%} a {a_max:.1%} para {rotulo_a} e de {b_min:.1%} a {b_max:.1%} para {rotulo_b}.
+        A diferença ({rotulo_b} menos {rotulo_a}) é de {comparacao.diferenca * 100:.1f} pontos percentuais (intervalo de {d_min * 100:.1f} a {d_max * 100:.1f}),
+        e o teste de permutação dá um p-valor de {formatar_p(comparacao)} para a hipótese de que as duas proporções são iguais.
+        """
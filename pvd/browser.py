@@ -0,0 +1,101 @@
+"""Navegação paginada no dataset, sem enviar o DataFrame inteiro ao navegador.
+
+Filtros e ordenação são aplicados aqui, sobre arrays do NumPy, e só as
+linhas da página atual (e as colunas escolhidas) são recortadas do df. A
+ordem de cada coluna (argsort estável) e o resumo por coluna são
+calculados uma vez e reaproveitados.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class DatasetBrowser:
+    """Páginas de um DataFrame com projeção de colunas, filtros e ordenação."""
+
+    def __init__(self, df):
+        self.df = df
+        self._ordens = {}
+        self._valores = {}
+        self._resumo = None
+        self._lock = threading.Lock()
+
+    def numerica(self, coluna):
+        return pd.api.types.is_numeric_dtype(self.df[coluna])
+
+    def resumo(self):
+        """Estatísticas por coluna: tipo, nulos, distintos, mínimo, máximo, média, desvio e valor mais frequente."""
+        with self._lock:
+            if self._resumo is None:
+                linhas = {}
+                for coluna in self.df.columns:
+                    serie = self.df[coluna]
+                    contagens = serie.value_counts()
+                    numerica = self.numerica(coluna)
+                    linhas[coluna] = {
+                        "tipo": str(serie.dtype),
+                        "nulos": int(serie.isna().sum()),
+                        "distintos": len(contagens),
+                        "mínimo": float(serie.min()) if numerica else np.nan,
+                        "máximo": float(serie.max()) if numerica else np.nan,
+                        "média": float(serie.mean()) if numerica else np.nan,
+                        "desvio padrão": float(serie.std()) if numerica else np.nan,
+                        "mais frequente": str(contagens.index[0]) if len(contagens) else "",
+                    }
+                self._resumo = pd.DataFrame.from_dict(linhas, orient="index")
+            return self._resumo
+
+    def valores(self, coluna):
+        """Valores distintos (ordenados) de uma coluna não numérica."""
+        with self._lock:
+            if coluna not in self._valores:
+                self._valores[coluna] = sorted(self.df[coluna].dropna().unique().tolist())
+            return self._valores[coluna]
+
+    def _ordem(self, coluna):
+        with self._lock:
+            if coluna not in self._ordens:
+                valores = self.df[coluna]
+                if not self.numerica(coluna):
+                    valores = valores.astype(str)
+                self._ordens[coluna] = np.argsort(valores.to_numpy(), kind="stable")
+            return self._ordens[coluna]
+
+    def mascara(self, filtros):
+        """Linhas que passam em todos os filtros.
+
+        `filtros` é um dict {coluna: (mínimo, máximo)} para colunas numéricas
+        ou {coluna: [valores]} para as demais.
+        """
+        mascara = np.ones(len(self.df), dtype=bool)
+        for coluna, condicao in (filtros or {}).items():
+            valores = self.df[coluna]
+            if self.numerica(coluna):
+                minimo, maximo = condicao
+                valores = valores.to_numpy()
+                mascara &= (valores >= minimo) & (valores <= maximo)
+            else:
+                mascara &= valores.isin(condicao).to_numpy()
+        return mascara
+
+    def pagina(self, colunas=None, mascara=None, ordenar_por=None, crescente=True, pagina=0, tamanho=100):
+        """(DataFrame da página, total de linhas filtradas).
+
+        A página `pagina` (começando em 0) tem até `tamanho` linhas dentre as
+        de `mascara` (todas, se None), já ordenadas; só ela é recortada do
+        DataFrame.
+        """
+        colunas = list(self.df.columns) if not colunas else list(colunas)
+
+        if ordenar_por is None:
+            posicoes = np.arange(len(self.df)) if mascara is None else np.flatnonzero(mascara)
+        else:
+            posicoes = self._ordem(ordenar_por)
+            if not crescente:
+                posicoes = posicoes[::-1]
+            if mascara is not None:
+                posicoes = posicoes[mascara[posicoes]]
+
+        inicio = pagina * tamanho
+        return self.df.iloc[posicoes[inicio:inicio + tamanho]][colunas], len(posicoes)
@@ -0,0 +1,69 @@
+"""Gráficos desenhados a partir de dados agregados (contagens), sem linhas."""
+import numpy as np
+
+
+def _quantil_ponderado(valores, pesos, q):
+    acumulado = np.cumsum(pesos) / pesos.sum()
+    return valores[min(np.searchsorted(acumulado, q), len(valores) - 1)]
+
+
+def violino_ponderado(ax, grupos, cut=2, gridsize=100, largura=0.8, cor="#3274a1"):
+    """Violin plot no estilo do seaborn a partir de valores e contagens.
+
+    `grupos` é uma lista de (rótulo, valores, contagens). A densidade de cada
+    grupo é o KDE gaussiano que as linhas originais teriam, com a largura de
+    banda de Scott, como no `sns.violinplot`; todos os violinos têm a mesma
+    área e o interior mostra quartis, bigodes de 1,5 IQR e a mediana.
+    """
+    curvas = []
+    for _, valores, contagens in grupos:
+        valores = np.asarray(valores, dtype=np.float64)
+        contagens = np.asarray(contagens, dtype=np.float64)
+        manter = contagens > 0
+        valores, contagens = valores[manter], contagens[manter]
+        if contagens.sum() == 0:
+            curvas.append(None)
+            continue
+
+        ordem = np.argsort(valores)
+        valores, contagens = valores[ordem], contagens[ordem]
+        # Mesma banda de Scott que o gaussian_kde daria às n linhas originais
+        n = contagens.sum()
+        media = np.sum(contagens * valores) / n
+        variancia = np.sum(contagens * (valores - media) ** 2) / (n - 1) if n > 1 else 0.0
+        banda = np.sqrt(variancia) * n ** (-1 / 5)
+        if banda == 0:
+            banda = 1e-3
+
+        grade = np.linspace(valores[0] - cut * banda, valores[-1] + cut * banda, gridsize)
+        densidade = (contagens[:, None] * np.exp(-0.5 * ((grade[None, :] - valores[:, None]) / banda) ** 2)).sum(axis=0)
+        densidade /= n * banda * np.sqrt(2 * np.pi)
+        curvas.append((grade, densidade, valores, contagens))
+
+    maximo = max((c[1].max() for c in curvas if c is not None), default=1)
+    for posicao, curva in enumerate(curvas):
+        if curva is None:
+            continue
+        grade, densidade, valores, contagens = curva
+        meia_largura = densidade / maximo * largura / 2
+        ax.fill_betweenx(grade, posicao - meia_largura, posicao + meia_largura,
+                         facecolor=cor, edgecolor=".25", linewidth=1.25)
+
+        q1, mediana, q3 = (_quantil_ponderado(valores, contagens, q) for q in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        bigode_inferior = valores[valores >= q1 - 1.5 * iqr].min()
+        bigode_superior = valores[valores <= q3 + 1.5 * iqr].max()
+        ax.plot([posicao, posicao], [bigode_inferior, bigode_superior], color=".25", linewidth=1)
+        ax.plot([posicao, posicao], [q1, q3], color=".25", linewidth=5, solid_capstyle="butt")
+        ax.scatter([posicao], [mediana], color="white", s=12, zorder=3)
+
+    ax.set_xticks(range(len(grupos)))
+    ax.set_xticklabels([str(rotulo) for rotulo, _, _ in grupos])
+    ax.set_xlim(-0.5, len(grupos) - 0.5)
+
+
+def curva_preenchida(ax, x, y, cor="C0"):
+    """Curva com a área preenchida, como o `sns.kdeplot(..., fill=True)`."""
+    ax.fill_between(x, y, color=cor, alpha=0.25, linewidth=0)
+    ax.plot(x, y, color=cor)
+    ax.set_ylim(bottom=0)
@@ -0,0 +1,95 @@
+"""Matrizes de correlação completas, calculadas uma vez por versão do dataset.
+
+A matriz de Pearson sai dos co-momentos (X - média)ᵀ(X - média), obtidos
+com um único produto de matrizes (BLAS). Os heatmaps só fatiam a matriz
+guardada. Ao acrescentar linhas (`append`), média e co-momentos são
+combinados com os do novo bloco (atualização de Chan et al.), sem
+recalcular sobre todo o dataset. A de Spearman usa os postos das colunas
+e, como os postos mudam com novas linhas, é recalculada sob demanda a
+partir do DataFrame de origem e dos blocos acrescentados (sem guardar uma
+cópia do dataset).
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+METODOS = ("pearson", "spearman")
+
+
+def _comomentos(dados):
+    media = dados.mean(axis=0)
+    centrado = dados - media
+    return media, centrado.T @ centrado
+
+
+def _correlacao(comomentos):
+    desvios = np.sqrt(np.diag(comomentos))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        matriz = comomentos / np.outer(desvios, desvios)
+    # Colunas constantes ficam com NaN, como no DataFrame.corr()
+    matriz[desvios == 0, :] = np.nan
+    matriz[:, desvios == 0] = np.nan
+    np.fill_diagonal(matriz, np.where(desvios == 0, np.nan, 1.0))
+    return np.clip(matriz, -1.0, 1.0)
+
+
+class CorrelationService:
+    """Correlações de Pearson e Spearman entre todas as colunas numéricas."""
+
+    def __init__(self, df, colunas=None):
+        self.colunas = list(df.select_dtypes(include=["number"]).columns) if colunas is None else list(colunas)
+        dados = df[self.colunas].to_numpy(dtype=np.float64)
+        self.n = len(dados)
+        self.media, self.comomentos = _comomentos(dados)
+        # Para a Spearman: referência ao DataFrame de origem (o compartilhado, sem copiá-lo) e só os blocos novos
+        self._origem = df
+        self._blocos = []
+        self._pearson = None
+        self._spearman = None
+        self._lock = threading.Lock()
+
+    def append(self, novos):
+        """Acrescenta linhas, atualizando média e co-momentos sem recálculo completo."""
+        dados = novos[self.colunas].to_numpy(dtype=np.float64)
+        if len(dados) == 0:
+            return
+        n_b = len(dados)
+        media_b, comomentos_b = _comomentos(dados)
+        delta = media_b - self.media
+        n = self.n + n_b
+        with self._lock:
+            self.comomentos = self.comomentos + comomentos_b + np.outer(delta, delta) * self.n * n_b / n
+            self.media = self.media + delta * n_b / n
+            self.n = n
+            self._blocos.append(novos[self.colunas])
+            self._pearson = None
+            self._spearman = None
+
+    def pearson(self):
+        with self._lock:
+            if self._pearson is None:
+                self._pearson = _correlacao(self.comomentos)
+            matriz = self._pearson
+        return pd.DataFrame(matriz, index=self.colunas, columns=self.colunas)
+
+    def spearman(self):
+        with self._lock:
+            if self._spearman is None:
+                dados = self._origem[self.colunas]
+                if self._blocos:
+                    dados = pd.concat([dados, *self._blocos], ignore_index=True)
+                postos = dados.rank().to_numpy(dtype=np.float64)
+                self._spearman = _correlacao(_comomentos(postos)[1])
+            matriz = self._spearman
+        return pd.DataFrame(matriz, index=self.colunas, columns=self.colunas)
+
+    def matriz(self, selecao=None, metodo="pearson"):
+        """Recorte da matriz completa para as colunas em `selecao` (na ordem dada)."""
+        if metodo not in METODOS:
+            raise ValueError(f"Método de correlação desconhecido: {metodo!r} (use um de {METODOS})")
+        completa = self.pearson() if metodo == "pearson" else self.spearman()
+        if selecao is None:
+            return completa
+        selecao = [c for c in selecao if c in self.colunas]
+        return completa.loc[selecao, selecao]
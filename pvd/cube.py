@@ -0,0 +1,111 @@
+"""Cubo de contagens pré-agregado para as Hipóteses 2, 3 e 4.
+
+O cubo guarda, em um ndarray, quantas pessoas existem em cada combinação
+das dimensões de baixa cardinalidade usadas pelas páginas (país, classe de
+trabalho, educação, horas semanais, sexo e renda). Depois de montado, as
+consultas só somam fatias do array: o custo não depende do número de linhas.
+"""
+import numpy as np
+import pandas as pd
+
+PREFIXO_WORKCLASS = "workclass_"
+# Categoria eliminada pelo drop_first do get_dummies (todas as colunas em 0)
+WORKCLASS_BASE = "workclass_Federal-gov"
+
+DIMENSOES = ["native-country-name", "workclass", "education-num", "hours-per-week", "sex_Male", "income"]
+
+
+def colunas_workclass(colunas):
+    """Colunas one-hot da classe de trabalho presentes em `colunas`, em ordem alfabética (como no get_dummies)."""
+    return sorted(c for c in colunas if c.startswith(PREFIXO_WORKCLASS) and c != WORKCLASS_BASE)
+
+
+def coluna_workclass(df):
+    """Reconstrói a classe de trabalho (nome da coluna one-hot) de cada linha."""
+    presentes = colunas_workclass(df.columns)
+    one_hot = df[presentes].to_numpy()
+    nomes = np.array(presentes + [WORKCLASS_BASE])
+    indice = np.where(one_hot.any(axis=1), one_hot.argmax(axis=1), len(presentes))
+    return pd.Categorical(nomes[indice], categories=nomes)
+
+
+class CountCube:
+    """Contagens por combinação de níveis das dimensões.
+
+    `niveis[dim]` lista os valores de cada dimensão, na ordem dos eixos de
+    `contagens`. Filtros são dicionários {dimensão: valor ou lista de valores}.
+    """
+
+    def __init__(self, dims, niveis, contagens):
+        self.dims = list(dims)
+        self.niveis = niveis
+        self.contagens = contagens
+        self._posicoes = {dim: {valor: i for i, valor in enumerate(niveis[dim].tolist())} for dim in self.dims}
+
+    @classmethod
+    def from_counts(cls, agregado, dims):
+        """Monta o cubo a partir de um DataFrame com as dimensões e a coluna "count"."""
+        niveis, codigos = {}, []
+        for dim in dims:
+            codigo, valores = pd.factorize(agregado[dim], sort=True)
+            niveis[dim] = np.asarray(valores)
+            codigos.append(codigo)
+        contagens = np.zeros([len(niveis[dim]) for dim in dims], dtype=np.int64)
+        np.add.at(contagens, tuple(codigos), agregado["count"].to_numpy())
+        return cls(dims, niveis, contagens)
+
+    @classmethod
+    def from_frame(cls, df, dims=DIMENSOES):
+        """Agrega o DataFrame processado do dashboard."""
+        dados = {dim: (coluna_workclass(df) if dim == "workclass" else df[dim]) for dim in dims}
+        agregado = pd.DataFrame(dados).value_counts(sort=False).rename("count").reset_index()
+        return cls.from_counts(agregado, dims)
+
+    def _indices(self, dim, valores):
+        if np.ndim(valores) == 0:
+            valores = [valores]
+        posicoes = self._posicoes[dim]
+        return [posicoes[v] for v in valores if v in posicoes]
+
+    def somar(self, manter=(), filtros=None):
+        """Soma as contagens filtradas, mantendo os eixos das dimensões em `manter`."""
+        contagens = self.contagens
+        for dim, valores in (filtros or {}).items():
+            contagens = np.take(contagens, self._indices(dim, valores), axis=self.dims.index(dim))
+        eixos_somados = tuple(i for i, dim in enumerate(self.dims) if dim not in manter)
+        soma = contagens.sum(axis=eixos_somados)
+        # Reordena os eixos restantes na ordem pedida em `manter`
+        restantes = [dim for dim in self.dims if dim in manter]
+        return np.moveaxis(soma, [restantes.index(dim) for dim in manter], range(len(manter))) if manter else soma
+
+    def contar(self, filtros=None):
+        """Total de pessoas que satisfazem os filtros."""
+        return int(self.somar(filtros=filtros))
+
+    def serie(self, manter, filtros=None):
+        """Como `somar`, mas retorna uma Series indexada pelos níveis."""
+        manter = list(manter)
+        soma = self.somar(manter, filtros)
+        filtrados = filtros or {}
+        niveis = []
+        for dim in manter:
+            valores = self.niveis[dim]
+            if dim in filtrados:
+                valores = valores[self._indices(dim, filtrados[dim])]
+            niveis.append(valores)
+        if len(manter) == 1:
+            indice = pd.Index(niveis[0], name=manter[0])
+        else:
+            indice = pd.MultiIndex.from_product(niveis, names=manter)
+        return pd.Series(soma.ravel(), index=indice, name="count")
+
+    def percentuais(self, manter, grupo, filtros=None):
+        """Percentual de cada célula de `manter` dentro do seu grupo (dimensões em `grupo`)."""
+        serie = self.serie(manter, filtros)
+        totais = serie.groupby(level=list(grupo)).transform("sum") if grupo else serie.sum()
+        return (serie / totais * 100).fillna(0)
+
+    def niveis_entre(self, dim, minimo, maximo):
+        """Níveis de `dim` no intervalo fechado [minimo, maximo]."""
+        valores = self.niveis[dim]
+        return valores[(valores >= minimo) & (valores <= maximo)].tolist()
@@ -0,0 +1,124 @@
+"""Estimativas de densidade (PDF e CDF) por binning e convolução via FFT.
+
+Cada coluna é discretizada uma única vez em uma grade fixa (binning
+linear), com um histograma por idade. O histograma de uma faixa etária é
+a diferença de duas somas acumuladas sobre as idades, e a PDF é a
+convolução desse histograma com um núcleo gaussiano (largura de banda de Scott, como no
+`sns.kdeplot`) calculada por FFT. A CDF é a soma acumulada da PDF.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+COLUNA_IDADE = "age_naoDiscretizada"
+COLUNA_INVESTIMENTO = "investment_status_naoDiscretizado"
+
+
+@dataclass(frozen=True)
+class Distribuicao:
+    x: np.ndarray
+    pdf: np.ndarray
+    cdf: np.ndarray
+    n: int
+
+
+def _convolucao_gaussiana(histograma, passo, banda):
+    """Convolução do histograma com um núcleo gaussiano de desvio `banda`, via FFT."""
+    m = len(histograma)
+    tamanho = 1 << int(np.ceil(np.log2(2 * m)))
+    deslocamentos = np.arange(tamanho)
+    deslocamentos = np.where(deslocamentos < tamanho // 2, deslocamentos, deslocamentos - tamanho) * passo
+    nucleo = np.exp(-0.5 * (deslocamentos / banda) ** 2) / (banda * np.sqrt(2 * np.pi))
+    return np.fft.irfft(np.fft.rfft(histograma, tamanho) * np.fft.rfft(nucleo), tamanho)[:m]
+
+
+class _Tabelas:
+    """Histogramas e momentos acumulados por idade de uma coluna."""
+
+    def __init__(self, codigo_idade, n_idades, valores, bordas, pesos):
+        n_bins = len(bordas) - 1
+        # Binning linear: cada valor divide seu peso entre os dois centros de bin vizinhos
+        passo = bordas[1] - bordas[0]
+        posicao = np.clip((valores - bordas[0]) / passo - 0.5, 0, n_bins - 1)
+        esquerda = np.minimum(posicao.astype(np.int64), n_bins - 2)
+        fracao = posicao - esquerda
+        histogramas = np.zeros((n_idades, n_bins), dtype=np.float64)
+        np.add.at(histogramas, (codigo_idade, esquerda), (1 - fracao) * pesos)
+        np.add.at(histogramas, (codigo_idade, esquerda + 1), fracao * pesos)
+        contagens = np.bincount(codigo_idade, weights=pesos, minlength=n_idades).astype(np.int64)
+
+        def acumular(por_idade):
+            return np.concatenate([np.zeros((1,) + por_idade.shape[1:], dtype=por_idade.dtype),
+                                   np.cumsum(por_idade, axis=0)])
+
+        self.histogramas = acumular(histogramas)
+        self.contagens = acumular(contagens)
+        self.soma = acumular(np.bincount(codigo_idade, weights=valores * pesos, minlength=n_idades))
+        self.soma_quadrados = acumular(np.bincount(codigo_idade, weights=valores.astype(np.float64) ** 2 * pesos,
+                                                   minlength=n_idades))
+        minimos = np.full(n_idades, np.inf)
+        maximos = np.full(n_idades, -np.inf)
+        np.minimum.at(minimos, codigo_idade, valores)
+        np.maximum.at(maximos, codigo_idade, valores)
+        self.minimos, self.maximos = minimos, maximos
+
+    def faixa(self, i, j):
+        """Histograma, n, soma, soma dos quadrados, mínimo e máximo das idades de índice i..j-1."""
+        return (self.histogramas[j] - self.histogramas[i], int(self.contagens[j] - self.contagens[i]),
+                self.soma[j] - self.soma[i], self.soma_quadrados[j] - self.soma_quadrados[i],
+                self.minimos[i:j].min(initial=np.inf), self.maximos[i:j].max(initial=-np.inf))
+
+
+class DensityEngine:
+    """PDF/CDF de colunas numéricas filtradas por faixa etária."""
+
+    def __init__(self, idades, colunas, investimento, n_bins=2048, margem=0.2, pesos=None):
+        self.idades, codigo_idade = np.unique(idades, return_inverse=True)
+        # Pesos: quantas pessoas cada linha representa (linhas já agregadas por `from_counts`)
+        pesos = np.ones(len(codigo_idade)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+        nao_zero = investimento != 0
+        self.grades, self._tabelas = {}, {}
+        for nome, valores in colunas.items():
+            valores = np.asarray(valores, dtype=np.float64)
+            minimo, maximo = valores.min(), valores.max()
+            folga = (maximo - minimo) * margem or 1.0
+            bordas = np.linspace(minimo - folga, maximo + folga, n_bins + 1)
+            self.grades[nome] = bordas
+            self._tabelas[(nome, False)] = _Tabelas(codigo_idade, len(self.idades), valores, bordas, pesos)
+            self._tabelas[(nome, True)] = _Tabelas(codigo_idade[nao_zero], len(self.idades),
+                                                   valores[nao_zero], bordas, pesos[nao_zero])
+
+    @classmethod
+    def from_frame(cls, df, colunas=(COLUNA_IDADE, COLUNA_INVESTIMENTO), **kwargs):
+        return cls(df[COLUNA_IDADE].to_numpy(), {c: df[c].to_numpy() for c in colunas},
+                   df[COLUNA_INVESTIMENTO].to_numpy(), **kwargs)
+
+    @classmethod
+    def from_counts(cls, agregado, colunas=(COLUNA_IDADE, COLUNA_INVESTIMENTO), **kwargs):
+        """Monta a partir das combinações distintas das colunas e da coluna "count" (ver `pvd.backends`)."""
+        return cls(agregado[COLUNA_IDADE].to_numpy(), {c: agregado[c].to_numpy() for c in colunas},
+                   agregado[COLUNA_INVESTIMENTO].to_numpy(), pesos=agregado["count"].to_numpy(), **kwargs)
+
+    def distribuicao(self, coluna, idade_min, idade_max, excluir_zero=False, cut=3):
+        """PDF e CDF de `coluna` para as pessoas com idade em [idade_min, idade_max].
+
+        Como o `sns.kdeplot`, a curva cobre o intervalo dos dados mais `cut`
+        larguras de banda de cada lado (limitado à grade).
+        """
+        i = np.searchsorted(self.idades, idade_min, side="left")
+        j = np.searchsorted(self.idades, idade_max, side="right")
+        histograma, n, soma, soma_quadrados, minimo, maximo = self._tabelas[(coluna, excluir_zero)].faixa(i, j)
+        bordas = self.grades[coluna]
+        centros = (bordas[:-1] + bordas[1:]) / 2
+        if n < 2:
+            return Distribuicao(centros[:0], centros[:0], centros[:0], n)
+
+        passo = bordas[1] - bordas[0]
+        variancia = max((soma_quadrados - soma ** 2 / n) / (n - 1), 0.0)
+        banda = max(np.sqrt(variancia) * n ** (-1 / 5), passo)
+        pdf = _convolucao_gaussiana(histograma, passo, banda) / n
+        pdf = np.maximum(pdf, 0)
+        cdf = np.cumsum(pdf) * passo
+
+        visivel = (centros >= minimo - cut * banda) & (centros <= maximo + cut * banda)
+        return Distribuicao(centros[visivel], pdf[visivel], cdf[visivel], n)
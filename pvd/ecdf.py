@@ -0,0 +1,97 @@
+"""Índice para a distribuição empírica (ECDF) do investimento por faixa etária.
+
+Os valores de investimento de cada idade ficam ordenados e comprimidos em
+(valor distinto, contagem), com somas acumuladas nas duas direções: sobre
+os valores (a ECDF de cada idade) e sobre as idades. Assim, quantas pessoas
+com idade em [A, B] têm investimento até X é a diferença de duas entradas
+da tabela, achadas com `searchsorted`, sem filtrar o DataFrame. A mesma
+tabela dá a ECDF exata e os quantis de qualquer faixa etária.
+"""
+import numpy as np
+
+from pvd.density import COLUNA_IDADE, COLUNA_INVESTIMENTO
+
+
+class ECDFIndex:
+    """Contagens de investimento até cada valor, acumuladas por idade."""
+
+    def __init__(self, idades, valores, pesos=None):
+        self.idades, codigo_idade = np.unique(idades, return_inverse=True)
+        self.valores, codigo_valor = np.unique(valores, return_inverse=True)
+        n_idades, n_valores = len(self.idades), len(self.valores)
+
+        # Pesos: quantas pessoas cada linha representa (linhas já agregadas por `from_counts`)
+        contagens = np.bincount(codigo_idade * n_valores + codigo_valor, weights=pesos,
+                                minlength=n_idades * n_valores).astype(np.int64)
+        contagens = contagens.reshape(n_idades, n_valores)
+        # _acumulado[j, k]: pessoas com índice de idade < j e índice de valor < k
+        self._acumulado = np.zeros((n_idades + 1, n_valores + 1), dtype=np.int64)
+        self._acumulado[1:, 1:] = np.cumsum(np.cumsum(contagens, axis=1), axis=0)
+        self._zero = np.searchsorted(self.valores, 0, side="left"), np.searchsorted(self.valores, 0, side="right")
+
+    @classmethod
+    def from_frame(cls, df, coluna=COLUNA_INVESTIMENTO):
+        return cls(df[COLUNA_IDADE].to_numpy(), df[coluna].to_numpy())
+
+    @classmethod
+    def from_counts(cls, agregado, coluna=COLUNA_INVESTIMENTO):
+        """Monta a partir das combinações distintas (idade, valor) e da coluna "count" (ver `pvd.backends`)."""
+        return cls(agregado[COLUNA_IDADE].to_numpy(), agregado[coluna].to_numpy(), agregado["count"].to_numpy())
+
+    def _faixa(self, idade_min, idade_max):
+        i = np.searchsorted(self.idades, idade_min, side="left")
+        j = np.searchsorted(self.idades, idade_max, side="right")
+        return self._acumulado[j] - self._acumulado[i]
+
+    def _zeros(self, acumulado):
+        inicio, fim = self._zero
+        return int(acumulado[fim] - acumulado[inicio])
+
+    def contar(self, idade_min, idade_max, excluir_zero=False):
+        """Pessoas com idade em [idade_min, idade_max] (sem as de investimento 0, se `excluir_zero`)."""
+        acumulado = self._faixa(idade_min, idade_max)
+        return int(acumulado[-1]) - (self._zeros(acumulado) if excluir_zero else 0)
+
+    def contar_acima(self, limiar, idade_min, idade_max, excluir_zero=False):
+        """Pessoas com idade em [idade_min, idade_max] e investimento maior que `limiar`."""
+        acumulado = self._faixa(idade_min, idade_max)
+        acima = int(acumulado[-1] - acumulado[np.searchsorted(self.valores, limiar, side="right")])
+        if excluir_zero and limiar < 0:
+            acima -= self._zeros(acumulado)
+        return acima
+
+    def probabilidade_acima(self, limiar, idade_min, idade_max, excluir_zero=False):
+        """Fração (entre 0 e 1) da faixa etária com investimento maior que `limiar`; 0 se a faixa estiver vazia."""
+        total = self.contar(idade_min, idade_max, excluir_zero)
+        return self.contar_acima(limiar, idade_min, idade_max, excluir_zero) / total if total > 0 else 0.0
+
+    def ecdf(self, idade_min, idade_max, excluir_zero=False):
+        """(valores, F(valor)) da ECDF exata do investimento na faixa etária, só nos valores presentes."""
+        acumulado = self._faixa(idade_min, idade_max)
+        presentes = np.diff(acumulado) > 0
+        if excluir_zero:
+            presentes[self._zero[0]:self._zero[1]] = False
+        contagens = np.diff(acumulado)[presentes]
+        if contagens.sum() == 0:
+            return self.valores[:0], np.zeros(0)
+        return self.valores[presentes], np.cumsum(contagens) / contagens.sum()
+
+    def quantil(self, q, idade_min, idade_max, excluir_zero=False):
+        """Quantil(is) empírico(s) do investimento na faixa etária: o menor valor com F(valor) >= q."""
+        valores, cdf = self.ecdf(idade_min, idade_max, excluir_zero)
+        if len(valores) == 0:
+            return np.full(np.shape(q), np.nan)
+        return valores[np.minimum(np.searchsorted(cdf, q, side="left"), len(valores) - 1)]
+
+    def ecdf_idade(self, idade_min, idade_max, excluir_zero=False):
+        """(idades, proporção em cada idade, F(idade)) da faixa etária."""
+        i = np.searchsorted(self.idades, idade_min, side="left")
+        j = np.searchsorted(self.idades, idade_max, side="right")
+        por_idade = np.diff(self._acumulado[i:j + 1, -1])
+        if excluir_zero:
+            inicio, fim = self._zero
+            por_idade = por_idade - np.diff(self._acumulado[i:j + 1, fim] - self._acumulado[i:j + 1, inicio])
+        total = por_idade.sum()
+        if total == 0:
+            return self.idades[:0], np.zeros(0), np.zeros(0)
+        return self.idades[i:j], por_idade / total, np.cumsum(por_idade) / total
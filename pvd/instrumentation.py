@@ -0,0 +1,146 @@
+"""Medição do tempo gasto em cada seção do dashboard.
+
+    from pvd.instrumentation import span
+
+    with span("pca"):
+        projecao = ...
+
+A instrumentação só fica ativa com a variável de ambiente PVD_INSTRUMENTACAO=1.
+Desativada, `span` devolve sempre o mesmo objeto que não faz nada, e
+`cronometrado` chama a função diretamente.
+
+Ativa, cada seção guarda a duração da execução atual do script (por thread,
+já que o Streamlit roda cada sessão em uma thread própria), uma janela
+com as últimas durações para os percentis p50/p95 e os eventos, que podem
+ser exportados como JSON lines ou no formato texto do Prometheus.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+
+class _SpanNulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_SPAN_NULO = _SpanNulo()
+
+
+class _Span:
+    __slots__ = ("instrumentacao", "nome", "inicio")
+
+    def __init__(self, instrumentacao, nome):
+        self.instrumentacao = instrumentacao
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instrumentacao.registrar(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class Instrumentacao:
+    """Durações das seções: execução atual, janela para percentis e totais acumulados."""
+
+    def __init__(self, ativo=False, janela=500, max_eventos=10000):
+        self.ativo = ativo
+        self._janelas = defaultdict(lambda: deque(maxlen=janela))
+        self._totais = defaultdict(lambda: [0, 0.0])
+        self._eventos = deque(maxlen=max_eventos)
+        self._execucao = threading.local()
+        self._lock = threading.Lock()
+
+    def span(self, nome):
+        if not self.ativo:
+            return _SPAN_NULO
+        return _Span(self, nome)
+
+    def cronometrado(self, nome):
+        """Decorador: mede cada chamada da função como a seção `nome`."""
+        def decorador(funcao):
+            @functools.wraps(funcao)
+            def envolvida(*args, **kwargs):
+                if not self.ativo:
+                    return funcao(*args, **kwargs)
+                with _Span(self, nome):
+                    return funcao(*args, **kwargs)
+            return envolvida
+        return decorador
+
+    def iniciar_execucao(self):
+        """Começa uma nova execução do script na thread atual."""
+        self._execucao.duracoes = {}
+
+    def execucao_atual(self):
+        """Durações (em segundos) das seções da execução atual nesta thread."""
+        return dict(getattr(self._execucao, "duracoes", {}))
+
+    def registrar(self, nome, duracao):
+        duracoes = getattr(self._execucao, "duracoes", None)
+        if duracoes is not None:
+            duracoes[nome] = duracoes.get(nome, 0.0) + duracao
+        with self._lock:
+            self._janelas[nome].append(duracao)
+            total = self._totais[nome]
+            total[0] += 1
+            total[1] += duracao
+            self._eventos.append({"secao": nome, "fim": time.time(), "duracao_s": duracao})
+
+    def percentis(self):
+        """{seção: (p50, p95, amostras na janela)}, em segundos."""
+        with self._lock:
+            janelas = {nome: np.array(valores) for nome, valores in self._janelas.items()}
+        return {nome: (float(np.percentile(v, 50)), float(np.percentile(v, 95)), len(v))
+                for nome, v in janelas.items()}
+
+    def jsonl(self):
+        with self._lock:
+            eventos = list(self._eventos)
+        return "".join(json.dumps(evento, ensure_ascii=False) + "\n" for evento in eventos)
+
+    def prometheus(self, metrica="pvd_secao_duracao_segundos"):
+        """Resumo (summary) no formato texto do Prometheus."""
+        percentis = self.percentis()
+        with self._lock:
+            totais = {nome: tuple(total) for nome, total in self._totais.items()}
+        linhas = [
+            f"# HELP {metrica} Duração das seções instrumentadas do dashboard.",
+            f"# TYPE {metrica} summary",
+        ]
+        for nome in sorted(totais):
+            rotulo = nome.replace("\\", "\\\\").replace('"', '\\"')
+            p50, p95, _ = percentis[nome]
+            linhas.append(f'{metrica}{{secao="{rotulo}",quantile="0.5"}} {p50:.6f}')
+            linhas.append(f'{metrica}{{secao="{rotulo}",quantile="0.95"}} {p95:.6f}')
+            linhas.append(f'{metrica}_sum{{secao="{rotulo}"}} {totais[nome][1]:.6f}')
+            linhas.append(f'{metrica}_count{{secao="{rotulo}"}} {totais[nome][0]}')
+        return "\n".join(linhas) + "\n"
+
+    def exportar(self, pasta):
+        """Grava `spans.jsonl` e `pvd.prom` em `pasta` (substituindo os anteriores)."""
+        os.makedirs(pasta, exist_ok=True)
+        for arquivo, conteudo in (("spans.jsonl", self.jsonl()), ("pvd.prom", self.prometheus())):
+            caminho = os.path.join(pasta, arquivo)
+            temporario = caminho + ".tmp"
+            with open(temporario, "w", encoding="utf-8") as f:
+                f.write(conteudo)
+            os.replace(temporario, caminho)
+
+
+instrumentacao = Instrumentacao(ativo=os.environ.get("PVD_INSTRUMENTACAO") == "1")
+span = instrumentacao.span
+cronometrado = instrumentacao.cronometrado
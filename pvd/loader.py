@@ -0,0 +1,122 @@
+"""Carregamento do dataset processado com cache colunar tipado.
+
+O CSV gerado pelo notebook é lido uma única vez; as leituras seguintes usam
+um arquivo Parquet (ou pickle, se o pyarrow não estiver instalado) cujo nome
+contém o hash do CSV de origem.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_DISPONIVEL = True
+except ImportError:
+    PARQUET_DISPONIVEL = False
+
+DATASET_PADRAO = "data_processada_final.csv"
+CACHE_DIR_PADRAO = ".cache"
+
+# Colunas binárias geradas pelo get_dummies do notebook (valores 0/1)
+PREFIXOS_ONE_HOT = ("workclass_", "marital-status_", "occupation_", "relationship_", "race_", "sex_")
+COLUNAS_BINARIAS = ("income", "native-country")
+COLUNAS_CATEGORICAS = ("native-country-name",)
+
+# Colunas inteiras não discretizadas
+COLUNAS_INTEIRAS = {
+    "age_naoDiscretizada": "int16",
+    "investment_status_naoDiscretizado": "int32",
+}
+
+
+def schema(colunas):
+    """Retorna o dtype explícito de cada coluna conhecida do dataset."""
+    tipos = {}
+    for coluna in colunas:
+        if coluna in COLUNAS_BINARIAS or coluna.startswith(PREFIXOS_ONE_HOT):
+            tipos[coluna] = "uint8"
+        elif coluna in COLUNAS_CATEGORICAS:
+            tipos[coluna] = "category"
+        elif coluna in COLUNAS_INTEIRAS:
+            tipos[coluna] = COLUNAS_INTEIRAS[coluna]
+    return tipos
+
+
+def _sha256(caminho, tamanho_bloco=1 << 20):
+    h = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def dataset_version(caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+    """Identificador da versão do CSV, derivado do conteúdo e do mtime.
+
+    O hash só é recalculado quando o mtime ou o tamanho do arquivo mudam;
+    caso contrário é reaproveitado do índice salvo junto ao cache.
+    """
+    caminho = Path(caminho)
+    info = caminho.stat()
+    indice = Path(cache_dir) / f"{caminho.stem}.json"
+
+    if indice.exists():
+        salvo = json.loads(indice.read_text())
+        if salvo.get("mtime_ns") == info.st_mtime_ns and salvo.get("size") == info.st_size:
+            return salvo["version"]
+
+    versao = _sha256(caminho)[:16]
+    indice.parent.mkdir(parents=True, exist_ok=True)
+    indice.write_text(json.dumps({"mtime_ns": info.st_mtime_ns, "size": info.st_size, "version": versao}))
+    return versao
+
+
+def read_csv_tipado(caminho=DATASET_PADRAO):
+    """Lê o CSV do notebook aplicando o schema explícito."""
+    colunas = pd.read_csv(caminho, sep=",", decimal=",", header=0, nrows=0).columns
+    return pd.read_csv(caminho, sep=",", decimal=",", header=0, dtype=schema(colunas))
+
+
+def ler_tipado(caminho=DATASET_PADRAO):
+    """Lê o CSV do notebook, ou um Parquet com as mesmas colunas, aplicando o schema explícito."""
+    if Path(caminho).suffix == ".parquet":
+        df = pd.read_parquet(caminho)
+        return df.astype(schema(df.columns))
+    return read_csv_tipado(caminho)
+
+
+def _arquivo_cache(caminho, versao, cache_dir):
+    extensao = "parquet" if PARQUET_DISPONIVEL else "pkl"
+    return Path(cache_dir) / f"{Path(caminho).stem}-{versao}.{extensao}"
+
+
+def load_dataset(caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+    """Carrega o dataset processado, usando o cache colunar quando válido.
+
+    Retorna a tupla (df, versao). Caches de versões antigas do mesmo CSV são
+    removidos ao gravar um novo.
+    """
+    versao = dataset_version(caminho, cache_dir)
+    arquivo = _arquivo_cache(caminho, versao, cache_dir)
+
+    if arquivo.exists():
+        if PARQUET_DISPONIVEL:
+            return pd.read_parquet(arquivo), versao
+        return pd.read_pickle(arquivo), versao
+
+    df = ler_tipado(caminho)
+
+    for antigo in Path(cache_dir).glob(f"{Path(caminho).stem}-*.*"):
+        antigo.unlink()
+    # Grava em arquivo temporário para não deixar cache pela metade
+    temporario = arquivo.with_suffix(".tmp")
+    if PARQUET_DISPONIVEL:
+        df.to_parquet(temporario, index=False)
+    else:
+        df.to_pickle(temporario)
+    os.replace(temporario, arquivo)
+
+    return df, versao
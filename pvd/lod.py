@@ -0,0 +1,108 @@
+"""Redução do número de pontos do gráfico PCA 3D (nível de detalhe).
+
+Dois modos preservam as proporções das classes de cor/forma:
+
+* estratificado: amostra aleatória com cota por classe proporcional ao seu
+  tamanho (método dos maiores restos), até o orçamento de pontos;
+* voxels: agrupa os pontos de cada classe em uma grade 3D e desenha um
+  marcador por (voxel, classe), no centróide, com tamanho pela contagem.
+
+Em ambos, uma região (intervalos de PC1-PC3) pode ser informada; o
+orçamento é gasto só dentro dela, o que refina o gráfico ao "aproximar".
+"""
+import numpy as np
+import pandas as pd
+
+MODOS = ("todos", "estratificado", "voxels")
+ROTULOS_MODOS = {
+    "todos": "Todos os pontos",
+    "estratificado": "Amostragem estratificada",
+    "voxels": "Agregação em voxels",
+}
+
+
+def codigos_classe(valores, max_classes=20, faixas=10):
+    """Códigos inteiros de classe; colunas com muitos valores viram faixas de quantis."""
+    valores = pd.Series(valores)
+    if valores.nunique() <= max_classes:
+        return pd.factorize(valores, sort=True)[0]
+    return pd.qcut(valores, q=faixas, labels=False, duplicates="drop").to_numpy()
+
+
+def combinar_classes(*codigos):
+    """Combina vários vetores de códigos em um único código por linha."""
+    combinado = np.zeros(len(codigos[0]), dtype=np.int64)
+    for c in codigos:
+        combinado = combinado * (int(c.max()) + 1) + c
+    return combinado
+
+
+def amostra_estratificada(codigos, orcamento, seed=0):
+    """Índices (ordenados) de uma amostra com cotas proporcionais por classe."""
+    n = len(codigos)
+    if orcamento >= n:
+        return np.arange(n)
+
+    _, inverso, contagens = np.unique(codigos, return_inverse=True, return_counts=True)
+    cotas = contagens * orcamento / n
+    k = np.floor(cotas).astype(np.int64)
+    k[np.argsort(k - cotas)[:orcamento - k.sum()]] += 1
+
+    rng = np.random.default_rng(seed)
+    ordem = np.lexsort((rng.random(n), inverso))
+    inicios = np.repeat(np.cumsum(contagens) - contagens, contagens)
+    posicao_na_classe = np.arange(n) - inicios
+    return np.sort(ordem[posicao_na_classe < np.repeat(k, contagens)])
+
+
+def agregar_voxels(pontos, codigos, resolucao):
+    """Agrupa os pontos por (voxel, classe).
+
+    Retorna o grupo de cada ponto, o centróide e a contagem de cada grupo.
+    """
+    minimos = pontos.min(axis=0)
+    passo = (pontos.max(axis=0) - minimos) / resolucao
+    passo[passo == 0] = 1.0
+    celula = np.minimum(((pontos - minimos) / passo).astype(np.int64), resolucao - 1)
+    voxel = (celula[:, 0] * resolucao + celula[:, 1]) * resolucao + celula[:, 2]
+
+    _, grupo, contagem = np.unique(voxel * (int(codigos.max()) + 1) + codigos,
+                                   return_inverse=True, return_counts=True)
+    centroides = np.column_stack([
+        np.bincount(grupo, weights=pontos[:, eixo]) for eixo in range(pontos.shape[1])
+    ]) / contagem[:, None]
+    return grupo, centroides, contagem
+
+
+def reduzir(dados, eixos, colunas_classe, modo="estratificado", orcamento=10000, regiao=None, seed=0):
+    """Reduz `dados` para no máximo ~`orcamento` marcadores.
+
+    `eixos` são as colunas de coordenadas e `colunas_classe` as de cor/forma.
+    No modo "voxels" o resultado ganha a coluna "contagem"; as colunas de
+    classe recebem a média dentro de cada grupo (o próprio valor, para
+    colunas discretas).
+    """
+    if regiao:
+        dentro = np.ones(len(dados), dtype=bool)
+        for coluna, (inicio, fim) in regiao.items():
+            valores = dados[coluna].to_numpy()
+            dentro &= (valores >= inicio) & (valores <= fim)
+        dados = dados[dentro]
+
+    if modo == "todos" or len(dados) == 0:
+        return dados
+
+    codigos = combinar_classes(*(codigos_classe(dados[c]) for c in colunas_classe))
+
+    if modo == "estratificado":
+        return dados.iloc[amostra_estratificada(codigos, orcamento, seed)]
+
+    n_classes = len(np.unique(codigos))
+    resolucao = max(2, int((orcamento / n_classes) ** (1 / 3)))
+    grupo, centroides, contagem = agregar_voxels(dados[list(eixos)].to_numpy(dtype=np.float64), codigos, resolucao)
+
+    agregado = pd.DataFrame(centroides, columns=list(eixos))
+    for coluna in colunas_classe:
+        agregado[coluna] = np.bincount(grupo, weights=dados[coluna].to_numpy(dtype=np.float64)) / contagem
+    agregado["contagem"] = contagem
+    return agregado
@@ -0,0 +1,187 @@
+"""Árvore de decisão da renda, treinada offline e usada pela página "E se?".
+
+O modelo é o do notebook: `DecisionTreeClassifier(random_state=42)` sobre
+os atributos numéricos do CSV processado (sem `income` e `native-country`),
+com 30% das linhas separadas para medir a acurácia. Ele é treinado uma vez
+e gravado em `.cache/modelo/<versão do dataset>.pkl`, junto com a versão do
+dataset e os atributos na ordem usada no treino:
+
+    python -m pvd.model [--dataset data_processada_final.csv] [--profundidade N]
+
+O dashboard só carrega o arquivo. Os perfis são pontuados em lote: a grade
+de todas as combinações de classe de trabalho, educação e horas semanais é
+montada como um único array e passa por uma só chamada de `predict_proba`.
+"""
+import argparse
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pvd.loader import load_dataset
+
+CACHE_DIR_PADRAO = ".cache/modelo"
+COLUNAS_EXCLUIDAS = ["income", "native-country"]
+PROPORCAO_TESTE = 0.3
+SEMENTE = 42
+
+# Categorias eliminadas pelo drop_first do get_dummies (a primeira em ordem alfabética): todas as colunas em 0
+CATEGORIAS_REFERENCIA = {
+    "workclass": "Federal-gov",
+    "marital-status": "Divorced",
+    "occupation": "Adm-clerical",
+    "relationship": "Husband",
+    "race": "Amer-Indian-Eskimo",
+    "sex": "Female",
+}
+# Atributos variados pela grade da página "E se?", além da classe de trabalho
+COLUNAS_GRADE = ["education-num", "hours-per-week"]
+
+
+def atributos_modelo(df):
+    """Atributos de entrada, como no notebook: os numéricos, menos a renda e o país."""
+    return [c for c in df.select_dtypes(include=["number"]).columns if c not in COLUNAS_EXCLUIDAS]
+
+
+@dataclass(frozen=True)
+class IncomeModel:
+    """Classificador treinado e o que é preciso para montar perfis com os mesmos atributos."""
+    classificador: object
+    atributos: tuple
+    versao: str
+    acuracia: float
+    perfil_padrao: dict
+    niveis: dict
+    faixa_idade: tuple
+    versao_sklearn: str
+
+    def grupo(self, nome):
+        """Colunas one-hot do atributo nominal `nome` presentes no modelo."""
+        return [c for c in self.atributos if c.startswith(nome + "_")]
+
+    def opcoes(self, nome):
+        """Valores do atributo nominal `nome`: a categoria de referência e as colunas one-hot."""
+        return [f"{nome}_{CATEGORIAS_REFERENCIA[nome]}"] + self.grupo(nome)
+
+    def definir(self, perfil, nome, opcao):
+        """Liga a coluna `opcao` do atributo `nome` no perfil (dict), desligando as outras."""
+        for coluna in self.grupo(nome):
+            perfil[coluna] = int(coluna == opcao)
+        return perfil
+
+    def _probabilidade(self, dados):
+        # Probabilidade da classe 1 (renda acima de $50k)
+        return self.classificador.predict_proba(dados)[:, list(self.classificador.classes_).index(1)]
+
+    def probabilidades(self, perfis):
+        """Probabilidade de renda acima de $50k de cada perfil (DataFrame ou lista de dicts), em uma chamada."""
+        perfis = pd.DataFrame(perfis)
+        return self._probabilidade(perfis[list(self.atributos)].to_numpy(dtype=np.float64))
+
+    def grade(self, perfil):
+        """Probabilidade de todas as combinações de classe de trabalho, educação e horas, com o resto do perfil fixo.
+
+        DataFrame com as colunas "workclass", "education-num", "hours-per-week" e "probabilidade".
+        """
+        workclasses = self.opcoes("workclass")
+        niveis = [np.asarray(self.niveis[coluna]) for coluna in COLUNAS_GRADE]
+        posicoes = np.meshgrid(np.arange(len(workclasses)), *[np.arange(len(n)) for n in niveis], indexing="ij")
+        posicoes = [p.ravel() for p in posicoes]
+
+        base = np.array([perfil[coluna] for coluna in self.atributos], dtype=np.float64)
+        dados = np.tile(base, (len(posicoes[0]), 1))
+        # Classe de trabalho: zera as colunas one-hot e liga a da combinação (nenhuma para a referência)
+        colunas_workclass = np.array([self.atributos.index(c) if c in self.atributos else -1 for c in workclasses])
+        dados[:, colunas_workclass[colunas_workclass >= 0]] = 0
+        linhas = np.flatnonzero(colunas_workclass[posicoes[0]] >= 0)
+        dados[linhas, colunas_workclass[posicoes[0][linhas]]] = 1
+        for coluna, valores, posicao in zip(COLUNAS_GRADE, niveis, posicoes[1:]):
+            dados[:, self.atributos.index(coluna)] = valores[posicao]
+
+        return pd.DataFrame({
+            "workclass": np.asarray(workclasses)[posicoes[0]],
+            **{coluna: valores[posicao] for coluna, valores, posicao in zip(COLUNAS_GRADE, niveis, posicoes[1:])},
+            "probabilidade": self._probabilidade(dados),
+        })
+
+
+def treinar(df, versao, profundidade=None):
+    """Treina a árvore com a mesma divisão do notebook e mede a acurácia na parte de teste."""
+    import sklearn
+    from sklearn.metrics import accuracy_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.tree import DecisionTreeClassifier
+
+    atributos = atributos_modelo(df)
+    X = df[atributos].to_numpy(dtype=np.float64)
+    y = df["income"].to_numpy()
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=PROPORCAO_TESTE, random_state=SEMENTE)
+    classificador = DecisionTreeClassifier(max_depth=profundidade, random_state=SEMENTE).fit(X_train, y_train)
+
+    dados = df[atributos]
+    return IncomeModel(
+        classificador=classificador,
+        atributos=tuple(atributos),
+        versao=versao,
+        acuracia=float(accuracy_score(y_test, classificador.predict(X_test))),
+        # Valor mais frequente de cada atributo: o perfil inicial da página
+        perfil_padrao={c: v.item() if hasattr(v, "item") else v for c, v in dados.mode().iloc[0].items()},
+        niveis={c: np.sort(dados[c].unique()).tolist() for c in COLUNAS_GRADE},
+        faixa_idade=(int(df["age_naoDiscretizada"].min()), int(df["age_naoDiscretizada"].max())),
+        versao_sklearn=sklearn.__version__,
+    )
+
+
+def arquivo_modelo(versao, cache_dir=CACHE_DIR_PADRAO):
+    return Path(cache_dir) / f"{versao}.pkl"
+
+
+def salvar(modelo, cache_dir=CACHE_DIR_PADRAO):
+    arquivo = arquivo_modelo(modelo.versao, cache_dir)
+    arquivo.parent.mkdir(parents=True, exist_ok=True)
+    # Grava em arquivo temporário para não deixar um modelo pela metade
+    temporario = arquivo.with_suffix(".tmp")
+    with open(temporario, "wb") as f:
+        pickle.dump(modelo, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporario, arquivo)
+    return arquivo
+
+
+def carregar(versao, cache_dir=CACHE_DIR_PADRAO):
+    """Modelo treinado para a versão `versao` do dataset.
+
+    Sem ele, o modelo gravado mais recentemente (com `modelo.versao` diferente
+    de `versao`); None se nenhum foi treinado.
+    """
+    arquivo = arquivo_modelo(versao, cache_dir)
+    if not arquivo.exists():
+        gravados = sorted(Path(cache_dir).glob("*.pkl"), key=lambda a: a.stat().st_mtime)
+        if not gravados:
+            return None
+        arquivo = gravados[-1]
+    with open(arquivo, "rb") as f:
+        return pickle.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Treina e grava a árvore de decisão da renda.")
+    parser.add_argument("--dataset", default=None, help="CSV processado (padrão: data_processada_final.csv)")
+    parser.add_argument("--profundidade", type=int, default=None, help="profundidade máxima (padrão: sem limite)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR_PADRAO)
+    args = parser.parse_args(argv)
+
+    # Pelo módulo importado, não pelo __main__ do `python -m`: o pickle guarda o caminho da classe IncomeModel
+    from pvd import model
+
+    df, versao = load_dataset(*([args.dataset] if args.dataset else []))
+    modelo = model.treinar(df, versao, args.profundidade)
+    arquivo = model.salvar(modelo, args.cache_dir)
+    print(f"Acurácia no teste: {modelo.acuracia:.4f} ({len(modelo.atributos)} atributos, "
+          f"{modelo.classificador.get_n_leaves()} folhas). Modelo gravado em {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Registro das páginas do dashboard.
+
+Cada página fica em um módulo próprio com uma função `render(df, versao)`.
+O módulo só é importado quando a página é visitada pela primeira vez, então
+dependências pesadas (sklearn e mlxtend, usados na Hipótese 1 e na página
+"E se?") não atrasam a abertura das outras páginas.
+
+Cada módulo também tem `aquecer(df, versao)`, que pré-calcula os artefatos
+da página com os widgets no valor padrão (usado pelo `pvd.warmup`).
+"""
+import functools
+import importlib
+
+PAGINAS = {
+    "Dataset": "pvd.paginas.dataset",
+    "Hipotese 1": "pvd.paginas.hipotese1",
+    "Hipotese 2": "pvd.paginas.hipotese2",
+    "Hipotese 3": "pvd.paginas.hipotese3",
+    "Hipotese 4": "pvd.paginas.hipotese4",
+    "Hipotese 5": "pvd.paginas.hipotese5",
+    "Relevância dos Atributos": "pvd.paginas.relevancia",
+    "E se?": "pvd.paginas.e_se",
+}
+
+
+def carregar_pagina(nome):
+    """Módulo da página `nome` (importado na primeira chamada e reaproveitado depois)."""
+    return importlib.import_module(PAGINAS[nome])
+
+
+def _aquecer(nome, df, versao):
+    carregar_pagina(nome).aquecer(df, versao)
+
+
+def tarefas_aquecimento(df, versao):
+    """Uma tarefa (nome, função) por página, para o aquecimento em segundo plano."""
+    return [(nome, functools.partial(_aquecer, nome, df, versao)) for nome in PAGINAS]
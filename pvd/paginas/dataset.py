@@ -0,0 +1,69 @@
+"""Página "Dataset": o DataFrame processado, navegado página a página."""
+import math
+
+import streamlit as st
+
+from pvd.instrumentation import span
+from pvd.recursos import dataset_browser
+
+ORDEM_ORIGINAL = "(ordem original)"
+SEM_FILTRO = "(nenhum)"
+
+
+def aquecer(df, versao_dataset):
+    dataset_browser(versao_dataset).resumo()
+
+
+def render(df, versao_dataset):
+    st.write("# Dados do Censo norte-americano de 1994")
+    st.write("## Dataset Processado")
+    st.write(f"{len(df.columns)} atributos e {len(df):,} linhas".replace(",", "."))
+    st.write("Informações referentes ao contexto e modo de vida das pessoas entrevistadas. Inclui dados como nível de escolaridade, gênero, nacionalidade, raça, renda, etc")
+
+    navegador = dataset_browser(versao_dataset)
+    resumo = navegador.resumo()
+
+    # Só as colunas escolhidas e as linhas da página atual são enviadas ao navegador
+    colunas = st.multiselect("Colunas exibidas", df.columns.tolist(), default=df.columns.tolist())
+
+    col_ordem, col_sentido, col_filtro = st.columns(3)
+    with col_ordem:
+        ordenar_por = st.selectbox("Ordenar por", [ORDEM_ORIGINAL] + df.columns.tolist())
+    with col_sentido:
+        crescente = st.radio("Sentido", ["Crescente", "Decrescente"], horizontal=True) == "Crescente"
+    with col_filtro:
+        coluna_filtro = st.selectbox("Filtrar por", [SEM_FILTRO] + df.columns.tolist())
+
+    filtros = {}
+    if coluna_filtro != SEM_FILTRO:
+        if navegador.numerica(coluna_filtro):
+            minimo, maximo = float(resumo.loc[coluna_filtro, "mínimo"]), float(resumo.loc[coluna_filtro, "máximo"])
+            if minimo < maximo:
+                filtros[coluna_filtro] = st.slider(f"Intervalo de {coluna_filtro}", minimo, maximo, (minimo, maximo))
+        else:
+            valores = navegador.valores(coluna_filtro)
+            filtros[coluna_filtro] = st.multiselect(f"Valores de {coluna_filtro}", valores, default=valores)
+
+    col_tamanho, col_pagina = st.columns(2)
+    with col_tamanho:
+        tamanho = st.selectbox("Linhas por página", [50, 100, 500, 1000], index=1)
+
+    with span("dataset: filtrar"):
+        mascara = navegador.mascara(filtros) if filtros else None
+    total = len(df) if mascara is None else int(mascara.sum())
+    n_paginas = max(1, math.ceil(total / tamanho))
+    with col_pagina:
+        pagina = st.number_input(f"Página (de {n_paginas})", min_value=1, max_value=n_paginas, value=1, step=1)
+
+    with span("dataset: recortar página"):
+        recorte, total = navegador.pagina(
+            colunas, mascara,
+            ordenar_por=None if ordenar_por == ORDEM_ORIGINAL else ordenar_por, crescente=crescente,
+            pagina=pagina - 1, tamanho=tamanho,
+        )
+    st.dataframe(recorte)
+    inicio = (pagina - 1) * tamanho
+    st.caption(f"Linhas {inicio + 1 if total else 0} a {inicio + len(recorte)} de {total}")
+
+    with st.expander("Resumo das colunas"):
+        st.dataframe(resumo.loc[colunas] if colunas else resumo)
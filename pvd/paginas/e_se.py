@@ -0,0 +1,127 @@
+"""Página "E se?": renda prevista pela árvore de decisão para um perfil editado e para uma grade de perfis."""
+import numpy as np
+import plotly.express as px
+import streamlit as st
+
+from pvd.instrumentation import span
+from pvd.model import COLUNAS_GRADE
+from pvd.recursos import exibir_grafico, income_model
+
+ROTULOS_GRUPOS = {
+    "workclass": "Classe de trabalho",
+    "marital-status": "Estado civil",
+    "occupation": "Ocupação",
+    "relationship": "Relação familiar",
+    "race": "Raça",
+    "sex": "Sexo",
+}
+ROTULOS_EDUCACAO = {
+    0.125: "Médio Não Iniciado/Incompleto",
+    0.25: "Médio Completo",
+    0.625: "Superior Incompleto/Técnico",
+    0.75: "Bacharel",
+    0.875: "Mestrado",
+    1: "Doutorado",
+}
+ROTULOS_HORAS = {0: "Menos de 40h", 0.5: "Exatamente 40h", 1: "Mais de 40h"}
+ROTULOS_INVESTIMENTO = {0: "Sem investimentos", 0.5: "Ganho de capital", 1: "Perda de capital"}
+
+
+def aquecer(df, versao_dataset):
+    modelo = income_model(versao_dataset)
+    if modelo is not None:
+        modelo.grade(modelo.perfil_padrao)
+
+
+def _sem_prefixo(opcao):
+    return opcao.split("_", 1)[1]
+
+
+def _educacao(valor):
+    return ROTULOS_EDUCACAO.get(valor, f"education-num {valor:g}")
+
+
+def render(df, versao_dataset):
+    st.write("## E se? - Probabilidade de renda acima de \\$50.000 prevista pela árvore de decisão do notebook")
+
+    modelo = income_model(versao_dataset)
+    if modelo is None:
+        st.info("Nenhum modelo treinado. Treine a árvore de decisão com `python -m pvd.model` e recarregue a página.")
+        # Sem modelo o recurso não fica em cache: a próxima execução procura o arquivo de novo
+        income_model.clear()
+        return
+    if modelo.versao != versao_dataset:
+        st.warning(f"O modelo foi treinado com outra versão do dataset ({modelo.versao}); "
+                   "treine-o de novo com `python -m pvd.model`.")
+    st.caption(f"Árvore de decisão com {len(modelo.atributos)} atributos, acurácia de {modelo.acuracia:.1%} "
+               f"na parte de teste (scikit-learn {modelo.versao_sklearn}).")
+
+    # Perfil editado: parte do perfil mais frequente do dataset
+    perfil = dict(modelo.perfil_padrao)
+    col_perfil, col_resultado = st.columns(2)
+    with col_perfil:
+        st.subheader("Perfil")
+        idade_min, idade_max = modelo.faixa_idade
+        idade = st.slider("Idade:", idade_min, idade_max, int(perfil["age_naoDiscretizada"]))
+        perfil["age_naoDiscretizada"] = idade
+        perfil["age"] = (idade - idade_min) / (idade_max - idade_min)
+
+        for grupo, rotulo in ROTULOS_GRUPOS.items():
+            opcoes = modelo.opcoes(grupo)
+            atual = next((c for c in modelo.grupo(grupo) if perfil[c] == 1), opcoes[0])
+            escolha = st.selectbox(f"{rotulo}:", opcoes, index=opcoes.index(atual), format_func=_sem_prefixo)
+            modelo.definir(perfil, grupo, escolha)
+
+        perfil["education-num"] = st.select_slider("Educação:", options=modelo.niveis["education-num"],
+                                                   value=perfil["education-num"], format_func=_educacao)
+        perfil["hours-per-week"] = st.radio("Horas semanais:", modelo.niveis["hours-per-week"], horizontal=True,
+                                            index=modelo.niveis["hours-per-week"].index(perfil["hours-per-week"]),
+                                            format_func=lambda h: ROTULOS_HORAS.get(h, h))
+        investimento = st.radio("Investimentos:", list(ROTULOS_INVESTIMENTO), horizontal=True,
+                                format_func=ROTULOS_INVESTIMENTO.get)
+        valor = st.number_input("Valor do ganho ou da perda (US$):", min_value=0, value=0, step=500,
+                                disabled=investimento == 0)
+        perfil["investment_status"] = investimento
+        perfil["investment_status_naoDiscretizado"] = 0 if investimento == 0 else (valor if investimento == 0.5 else -valor)
+
+    with span("e se: pontuar perfil"):
+        probabilidade = modelo.probabilidades([perfil])[0]
+
+    # Todas as combinações de classe de trabalho, educação e horas em uma única chamada de predict_proba
+    with span("e se: pontuar grade"):
+        grade = modelo.grade(perfil)
+
+    with col_resultado:
+        st.subheader("Resultado")
+        st.metric("Probabilidade de renda acima de $50.000", f"{probabilidade:.0%}")
+
+        def grafico_grade():
+            workclasses = modelo.opcoes("workclass")
+            educacoes, horas = (modelo.niveis[coluna] for coluna in COLUNAS_GRADE)
+            matriz = grade["probabilidade"].to_numpy().reshape(len(workclasses), len(educacoes), len(horas))
+            fig = px.imshow(
+                np.moveaxis(matriz, 2, 0), facet_col=0, zmin=0, zmax=1, color_continuous_scale="Blues",
+                x=[_educacao(e) for e in educacoes], y=[_sem_prefixo(w) for w in workclasses], aspect="auto",
+                labels=dict(x="Educação", y="Classe de trabalho", color="Probabilidade"),
+            )
+            fig.for_each_annotation(lambda a: a.update(text=ROTULOS_HORAS.get(horas[int(a.text.split("=")[1])], a.text)))
+            fig.update_layout(height=450, margin=dict(l=0, r=0, t=30, b=0))
+            return fig
+
+        # O modelo entra na chave: treiná-lo de novo (outra profundidade, por exemplo) muda a grade
+        exibir_grafico(st, "E se", [modelo.versao, modelo.acuracia, sorted(perfil.items())], grafico_grade,
+                       use_container_width=True)
+
+    mais_provavel = grade.loc[grade["probabilidade"].idxmax()]
+    st.markdown(f"""
+        **Descrição do Resultado:**
+        Para o perfil escolhido ao lado, a árvore de decisão treinada no notebook estima uma probabilidade de
+        {probabilidade:.0%} de renda anual acima de \\$50.000. O gráfico mostra a mesma previsão para as
+        {len(grade)} combinações de classe de trabalho, educação e horas semanais, mantendo os demais atributos do
+        perfil. A maior probabilidade ({mais_provavel['probabilidade']:.0%}) é a de quem trabalha em
+        {_sem_prefixo(mais_provavel['workclass'])}, com educação {_educacao(mais_provavel['education-num'])} e
+        {ROTULOS_HORAS.get(mais_provavel['hours-per-week'], mais_provavel['hours-per-week']).lower()} semanais.
+        """)
+    if modelo.classificador.max_depth is None:
+        st.caption("A árvore não tem limite de profundidade: as folhas costumam ser puras e as probabilidades ficam "
+                   "perto de 0% ou de 100%.")
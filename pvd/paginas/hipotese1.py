@@ -0,0 +1,252 @@
+"""Hipótese 1: heatmap de correlação, regras de associação e PCA em 3D."""
+import time
+
+import numpy as np
+import plotly.express as px
+import streamlit as st
+
+from pvd.instrumentation import span
+from pvd.lod import MODOS as MODOS_LOD, ROTULOS_MODOS as ROTULOS_LOD, reduzir
+from pvd.projection import METODOS as METODOS_PCA
+from pvd.recursos import correlation_service, exibir_grafico, projection_store, rule_engine
+from pvd.rules import ALGORITMOS as ALGORITMOS_REGRAS, tabela_markdown
+
+ATRIBUTOS_HEATMAP_PADRAO = ['income', 'sex_Male', 'education-num', 'age', 'investment_status', 'race_Black']
+ATRIBUTOS_REGRAS_PADRAO = ['income', 'native-country']
+
+
+def aquecer(df, versao_dataset):
+    # Os mesmos cálculos que a página faz com os widgets no valor padrão
+    correlation_service(versao_dataset).matriz(ATRIBUTOS_HEATMAP_PADRAO, metodo="pearson")
+    regras = rule_engine(versao_dataset)
+    regras.regra("income", "sex_Male")
+    regras.regras(ATRIBUTOS_REGRAS_PADRAO, min_support=0.1, min_confidence=0.6,
+                  algoritmo=next(iter(ALGORITMOS_REGRAS)))
+    numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
+    projection_store().get(df, versao_dataset, numeric_columns, metodo=METODOS_PCA[0])
+
+
+def render(df, versao_dataset):
+    st.write("## Hipótese 1 - A renda dos indivíduos está diretamente relacionada a sua educação e seu gênero.")
+
+    # Criando duas colunas: Heatmap (esquerda) e Tabela (direita)
+    col_hipo1, col_hipo2 = st.columns(2)
+
+    # **HEATMAP** (na esquerda)
+    with col_hipo1:
+        st.subheader('Matriz de Correlação Heatmap')
+        selected_features = st.multiselect("Selecione os atributos para o Heatmap", df.columns.tolist(), default=ATRIBUTOS_HEATMAP_PADRAO)
+        
+        metodo_correlacao = st.radio("Correlação:", ["pearson", "spearman"], horizontal=True,
+                                     format_func=str.capitalize)
+
+        if selected_features:
+            correlacoes = correlation_service(versao_dataset)
+            nao_numericas = [c for c in selected_features if c not in correlacoes.colunas]
+            if nao_numericas:
+                st.info(f"Atributos não numéricos ignorados no Heatmap: {', '.join(nao_numericas)}")
+
+            def grafico_heatmap():
+                with span("hipotese 1: correlação"):
+                    matriz_correlacao = correlacoes.matriz(selected_features, metodo=metodo_correlacao)
+                fig_heatmap = px.imshow(
+                    matriz_correlacao, text_auto=".2f", color_continuous_scale="RdBu_r",
+                    zmin=-1, zmax=1, aspect="auto"
+                )
+                fig_heatmap.update_layout(height=500, margin=dict(l=0, r=0, t=30, b=0))
+                return fig_heatmap
+
+            exibir_grafico(st, "Hipotese 1 - heatmap", [selected_features, metodo_correlacao], grafico_heatmap,
+                           use_container_width=True)
+        else:
+            st.warning("Selecione pelo menos um atributo para exibir o Heatmap.")
+
+        st.markdown(f"""
+        **Descrição do Heatmap:**
+        O Gráfico de correlação Heatmap mostrado acima apresenta as correlações através de uma matriz diagonal a respeito das seguintes variáveis: **{', '.join(selected_features)}**.
+
+        As correlações presentes vão de -1 a 1, em que quando a correlação entre 2 atributos é mais perto de 1, indica-se uma correlação positiva,
+        enquanto uma correlação mais perto de -1, obtemos uma correlação negativa entre essas 2 variáveis.
+        Como destque nesse gráfico, percebe-se uma correlação de 0.22 entre os atributos “Income” e “sex_male”, e de 0.35 entre “Income” e “education”,
+        que representando relações fraca e moderada respectivamente, assim ressaltando a hipotese de haver uma correlação significativa entre essas variáveis. 
+
+        """)
+
+
+    # **TABELA APRIORI** (na direita)
+    with col_hipo2:
+        st.subheader('Tabelas de Regras de Associação Apriori')
+
+        # Tabela gerada a partir do mesmo armazenamento de regras da Tabela Dinâmica
+        with span("hipotese 1: regras de associação"):
+            regra_income_sexo = rule_engine(versao_dataset).regra("income", "sex_Male")
+        markdown_table = tabela_markdown(regra_income_sexo)
+
+        st.markdown(markdown_table)
+
+        if regra_income_sexo.empty:
+            suporte_income_sexo = confianca_income_sexo = lift_income_sexo = 0
+        else:
+            suporte_income_sexo, confianca_income_sexo, lift_income_sexo = regra_income_sexo.iloc[0][["support", "confidence", "lift"]]
+
+        st.markdown(f"""
+            **Descrição da Tabela:**
+            É apresentado acima uma tabela de regras de associação Apriori comparando as variáveis **income**, 
+            que é uma variável booleana indicando se uma uma pessoa recebe um valor acima de \$50.000 anuais como antecedente,
+            e a variável **sex_Male**, que indica se a pessoa é do gênero Masculino ou Feminino.
+            Como principais resultados coletados nessa tabela, visualiza-se o **Suporte**, que nos mostra que a combinação entre income == 1 e sex_Male == 1
+            aparece em {suporte_income_sexo * 100:.0f}% do elementos do dataset. 
+            Também temos o **Confidence**, que possui o valor de {confianca_income_sexo:.2f}, ou seja, que quando uma pessoa tem o
+            income maior dos \$50.000 anuais, a chance dessa pessoa ser homem é de {confianca_income_sexo * 100:.0f}%.
+            E destaca-se também o **Lift**, com valor de {lift_income_sexo:.2f}, ou seja, temos uma associação positiva em que sex_Male == 1 está {(lift_income_sexo - 1) * 100:.0f}%
+            mais propenço de ocorrer quando o income é de mais de \$50.000 anuais.
+        """)
+
+
+        st.subheader('Tabela Dinâmica')
+        # Selecionando dois atributos dinamicamente
+        selected_apriori_features = st.multiselect(
+            "Selecione dois atributos para a Tabela Apriori:",
+            df.columns.tolist(),
+            default=ATRIBUTOS_REGRAS_PADRAO
+        )
+
+        algoritmo_regras = st.radio("Algoritmo:", list(ALGORITMOS_REGRAS), horizontal=True,
+                                    format_func={"apriori": "Apriori", "fpgrowth": "FP-Growth"}.get)
+
+        if len(selected_apriori_features) == 2:
+            # Transações one-hot esparsas e regras memoizadas por par de atributos
+            with span("hipotese 1: regras de associação"):
+                rules = rule_engine(versao_dataset).regras(
+                    selected_apriori_features, min_support=0.1, min_confidence=0.6, algoritmo=algoritmo_regras
+                )
+
+            # Verificando se há regras geradas
+            if not rules.empty:
+                # Exibir regras formatadas no Streamlit
+                st.dataframe(rules[['antecedents', 'consequents', 'support', 'confidence', 'lift']])
+            else:
+                st.warning("Nenhuma regra encontrada com os atributos selecionados.")
+
+            # Descrição dinâmica
+            st.markdown(f"""
+            **Descrição da Tabela:**
+            A tabela acima apresenta as regras de associação Apriori entre **{selected_apriori_features[0]}** e **{selected_apriori_features[1]}**.
+
+            - **Suporte (support):** Indica a frequência da regra no dataset.
+            - **Confiança (confidence):** Mede a probabilidade da regra ser verdadeira.
+            - **Lift:** Indica a força da associação entre as variáveis.
+            """)
+        else:
+            st.warning("Por favor, selecione exatamente dois atributos para a análise Apriori.")
+
+
+
+    # ################## Distribuição PCA dos Dados ##################
+    st.write("## Distribuição PCA dos Dados - Hipótese 1 - A renda dos indivíduos está diretamente relacionada a sua educação e seu gênero")
+
+    chart_placeholder_pca = st.empty()
+    desc_placeholder_pca = st.empty()
+
+    # Obtém a lista de colunas numéricas
+    numeric_columns = df.select_dtypes(include=['number']).columns.tolist()
+    
+    # Define os índices padrão para "income" e "sex_Male"
+    default_color_index = numeric_columns.index("income") if "income" in numeric_columns else 0
+    default_shape_index = numeric_columns.index("sex_Male") if "sex_Male" in numeric_columns else 0
+
+    # Seleção interativa das colunas para colorir e definir o símbolo dos pontos
+    color_feature = st.selectbox("Escolha a coluna para colorir os pontos:", numeric_columns, index=default_color_index)
+    shape_feature = st.selectbox("Escolha a coluna para definir a forma dos pontos:", numeric_columns, index=default_shape_index)
+    
+    metodo_pca = st.radio("Método do PCA:", METODOS_PCA, horizontal=True)
+
+    # Os componentes são calculados uma vez por versão do dataset; trocar cor ou forma só reaproveita a projeção
+    with span("hipotese 1: pca"):
+        projecao = projection_store().get(df, versao_dataset, numeric_columns, metodo=metodo_pca)
+
+    # Apenas as colunas usadas no gráfico, sem copiar o DataFrame inteiro
+    dataPCA = df[list(dict.fromkeys([color_feature, shape_feature]))].assign(
+        PC1=projecao.componentes[:, 0],
+        PC2=projecao.componentes[:, 1],
+        PC3=projecao.componentes[:, 2],
+    )
+
+    # Nível de detalhe: limita quantos pontos são enviados ao navegador
+    with st.expander("Nível de detalhe do gráfico"):
+        modo_lod = st.radio("Modo de exibição:", MODOS_LOD, index=1, format_func=ROTULOS_LOD.get, horizontal=True)
+        orcamento_pontos = st.slider("Orçamento de pontos:", min_value=1000, max_value=50000, value=10000, step=1000)
+        st.write("Restrinja os intervalos dos componentes para aproximar uma região; o orçamento passa a ser gasto só nela.")
+        regiao_pca = {}
+        for pc in ["PC1", "PC2", "PC3"]:
+            limites = (float(np.floor(dataPCA[pc].min())), float(np.ceil(dataPCA[pc].max())))
+            intervalo = st.slider(f"Intervalo do {pc}", *limites, value=limites, step=0.5)
+            if intervalo != limites:
+                regiao_pca[pc] = intervalo
+        medir_payload = st.checkbox("Medir tamanho do gráfico enviado ao navegador", value=False)
+
+    with span("hipotese 1: nível de detalhe"):
+        dataPCA_exibido = reduzir(
+            dataPCA, ["PC1", "PC2", "PC3"], list(dict.fromkeys([color_feature, shape_feature])),
+            modo=modo_lod, orcamento=orcamento_pontos, regiao=regiao_pca,
+        )
+    agregado_em_voxels = "contagem" in dataPCA_exibido.columns
+    
+    def grafico_pca():
+        # Cria o gráfico 3D interativo usando Plotly Express com novas cores e bordas nos pontos
+        figPCA = px.scatter_3d(
+            dataPCA_exibido, 
+            x='PC1', y='PC2', z='PC3',
+            color=color_feature,
+            symbol=shape_feature,
+            size="contagem" if agregado_em_voxels else None,  # No modo voxels, o tamanho indica a quantidade de pontos
+            size_max=20,
+            color_continuous_scale="Viridis",  # Paleta de cores
+            title="Visualização 3D dos Componentes Principais",
+            labels={"PC1": "Componente Principal 1", "PC2": "Componente Principal 2", "PC3": "Componente Principal 3"}
+        )
+
+        # Adiciona borda aos pontos
+        if agregado_em_voxels:
+            figPCA.update_traces(marker=dict(line=dict(width=2, color='black')))
+        else:
+            figPCA.update_traces(marker=dict(size=6, line=dict(width=2, color='black')))  
+
+        # Atualiza o layout para melhor contraste
+        figPCA.update_layout(
+            width=1000, height=800,
+            scene=dict(
+                xaxis=dict(backgroundcolor="rgb(230, 230, 230)"),  # Fundo do eixo X
+                yaxis=dict(backgroundcolor="rgb(230, 230, 230)"),  # Fundo do eixo Y
+                zaxis=dict(backgroundcolor="rgb(230, 230, 230)"),  # Fundo do eixo Z
+            ),
+            coloraxis_colorbar=dict(title=color_feature)  # Ajusta legenda da cor
+        )
+        return figPCA
+
+    # Exibe o gráfico no Streamlit
+    inicio_grafico = time.perf_counter()
+    json_pca = exibir_grafico(
+        chart_placeholder_pca, "Hipotese 1 - PCA",
+        [color_feature, shape_feature, metodo_pca, modo_lod, orcamento_pontos, regiao_pca], grafico_pca,
+        use_container_width=True,
+    )
+    tempo_grafico = (time.perf_counter() - inicio_grafico) * 1000
+
+    if medir_payload:
+        st.caption(f"{len(dataPCA_exibido)} marcadores (de {len(dataPCA)} pontos) | "
+                   f"payload de {len(json_pca) / 1024:.0f} KB | gráfico em {tempo_grafico:.0f} ms")
+
+    # Adiciona a descrição
+    pca_desc = f"""
+        **Descrição do Gráfico PCA:**
+        O gráfico acima apresenta uma visualização em 3 dimensões de todos os dados presentes na dataframe.
+        Esse gráfico foi gerado com o Principal Component Analysis, onde é realizada uma redução (resumo) de todas as
+        features presentes para apenas 3, permitindo assim essa visualização.
+        Através do gráfico também podemos observar que as cores e as formas mudam conforme a variável selecionada.
+        Nesse caso, as variáveis escolhidas para essa visualização são {color_feature} para cores e {shape_feature} para formato.
+        Juntos, os 3 componentes explicam {projecao.variancia_explicada.sum() * 100:.1f}% da variância dos dados padronizados.
+        Com base nesse gráfico, quando selecionamos para ver o contraste entre o income e o sex_Male, conseguimos ver de modo ainda melhor
+        que os pontos azuis (renda anual superior a \$50.000) possuem mais círculos (homens) do que quadrados (mulheres). 
+    """
+    desc_placeholder_pca.markdown(pca_desc)
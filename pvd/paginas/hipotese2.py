@@ -0,0 +1,274 @@
+"""Hipótese 2: renda e educação de imigrantes comparadas às de norte-americanos."""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from pvd.bootstrap import descrever
+from pvd.instrumentation import span
+from pvd.paises import REGIAO_ASIATICOS, REGIAO_EUROPEUS, REGIAO_IMIGRANTES, REGIAO_LATINOS, REGIOES
+from pvd.recursos import bootstrap, country_table, exibir_grafico
+
+WORKCLASSES = [
+    "Qualquer área de trabalho",
+    "workclass_Local-gov", "workclass_Private", "workclass_Self-emp-inc",
+    "workclass_Self-emp-not-inc", "workclass_State-gov", "workclass_Without-pay"
+]
+
+INCOME_LABELS = {
+    0: "Renda Anual Menor que $50.000",
+    1: "Renda Anual Maior que $50.000"
+}
+
+PATTERN_SHAPES_RENDA = {
+    "Renda Anual Menor que $50.000": ".",
+    "Renda Anual Maior que $50.000": "x"
+}
+
+EDUCATION_LABELS = {
+    0.125: "Médio Não Iniciado/Incompleto",
+    0.25: "Médio Completo",
+    0.625: "Superior Incompleto/Técnico",
+    0.75: "Bacharel",
+    0.875: "Mestrado",
+    1: "Doutorado"
+}
+
+PATTERN_SHAPES_EDUCACAO = {
+    "Médio Não Iniciado/Incompleto": ".",
+    "Médio Completo": "x",
+    "Superior Incompleto/Técnico": "+",
+    "Bacharel": "\\",
+    "Mestrado": "|",
+    "Doutorado": "/"
+}
+
+
+def aquecer(df, versao_dataset):
+    # Grupos padrão dos widgets (EUA contra todos os imigrantes), para já deixar os intervalos no cache
+    contagens_a, contagens_b = contagens_grupos(country_table(versao_dataset), ["United-States"],
+                                                REGIOES[REGIAO_IMIGRANTES], WORKCLASSES[0])
+    significancia_renda(bootstrap(), contagens_a, contagens_b)
+
+
+def contagens_grupos(tabela, group_a, group_b, selected_workclass):
+    """Contagens por renda e educação dos dois grupos de países, somadas das linhas de cada país."""
+    workclass = None if selected_workclass == "Qualquer área de trabalho" else selected_workclass
+    return tabela.serie(group_a, workclass), tabela.serie(group_b, workclass)
+
+
+def significancia_renda(motor, contagens_a, contagens_b):
+    """Intervalos bootstrap e p-valor da diferença entre as proporções de renda acima de $50k dos grupos."""
+    def acima_50k(contagens):
+        return int(contagens[contagens.index.get_level_values("income") == 1].sum())
+
+    return motor.comparar(acima_50k(contagens_a), int(contagens_a.sum()), acima_50k(contagens_b), int(contagens_b.sum()))
+
+
+def grupos_renda(contagens_a, contagens_b):
+    df_income_groups = pd.concat([
+        contagens_a.groupby(level="income").sum().rename("total").reset_index().assign(is_from_group_a="Paises do Grupo A"),
+        contagens_b.groupby(level="income").sum().rename("total").reset_index().assign(is_from_group_a="Paises do Grupo B")
+    ], ignore_index=True)
+
+    # Mantém só as combinações presentes, como no groupby sobre as linhas
+    df_income_groups = df_income_groups[df_income_groups['total'] > 0][['is_from_group_a', 'income', 'total']].reset_index(drop=True)
+    df_income_groups = df_income_groups.sort_values("income")
+
+    df_income_groups["income"] = df_income_groups["income"].map(INCOME_LABELS)
+
+    df_income_groups['group_total_income'] = df_income_groups.groupby('is_from_group_a')['total'].transform('sum')
+    df_income_groups['percent'] = df_income_groups['total'] / df_income_groups['group_total_income'] * 100
+    return df_income_groups
+
+
+def grupos_educacao(contagens_a, contagens_b):
+    df_education_groups = pd.concat([
+        contagens_a.groupby(level="education-num").sum().rename("total").reset_index().assign(is_from_group_a="Paises do Grupo A"),
+        contagens_b.groupby(level="education-num").sum().rename("total").reset_index().assign(is_from_group_a="Paises do Grupo B")
+    ], ignore_index=True)
+
+    df_education_groups = df_education_groups[df_education_groups['total'] > 0][['is_from_group_a', 'education-num', 'total']].reset_index(drop=True)
+    df_education_groups = df_education_groups.sort_values("education-num")
+
+    df_education_groups['education-num'] = df_education_groups['education-num'].replace(0, 0.125)
+    df_education_groups['education-num'] = df_education_groups['education-num'].replace(0.375, 0.625)
+    df_education_groups['education-num'] = df_education_groups['education-num'].replace(0.5, 0.625)
+
+    df_education_groups["education-num"] = df_education_groups["education-num"].map(EDUCATION_LABELS)
+
+    df_education_groups['group_total_education'] = df_education_groups.groupby('is_from_group_a')['total'].transform('sum')
+    df_education_groups['percent'] = df_education_groups['total'] / df_education_groups['group_total_education'] * 100
+    return df_education_groups
+
+
+def grafico_renda(df_income_groups):
+    fig_income = px.bar(
+        df_income_groups,
+        x="is_from_group_a",
+        y="percent",
+        color="income",
+        title="Distribuição por Renda Anual (Percentual)",
+        category_orders={"income": list(INCOME_LABELS.values())[::-1]},
+        pattern_shape="income",
+        pattern_shape_map=PATTERN_SHAPES_RENDA,
+        color_discrete_map={
+            "Renda Anual Menor que $50.000": "red",
+            "Renda Anual Maior que $50.000": "green"
+        }
+    )
+
+    fig_income.update_yaxes(title_text="Percentual (%)", range=[0, 100])
+    return fig_income
+
+
+def grafico_educacao(df_education_groups):
+    fig_education = px.bar(
+        df_education_groups,
+        x="is_from_group_a",
+        y="percent",
+        color="education-num",
+        title="Distribuição por Educação (Percentual)",
+        category_orders={"education-num": list(EDUCATION_LABELS.values())},
+        pattern_shape="education-num",
+        pattern_shape_map=PATTERN_SHAPES_EDUCACAO
+    )
+
+    fig_education.update_yaxes(title_text="Percentual (%)", range=[0, 100])
+    return fig_education
+
+
+def descricao_renda(group_a, group_b, population_a, population_b, df_income_groups, comparacao=None):
+    subset_a = df_income_groups[df_income_groups['is_from_group_a'] == 'Paises do Grupo A']['percent']
+    porcentagem_a_mais50k = 0
+    if len(subset_a) > 1:
+        porcentagem_a_mais50k = subset_a.iloc[1]
+
+    subset_b = df_income_groups[df_income_groups['is_from_group_a'] == 'Paises do Grupo B']['percent']
+    porcentagem_b_mais50k = 0
+    if len(subset_b) > 1:
+        porcentagem_b_mais50k = subset_b.iloc[1]
+
+    return f"""
+        **Descrição do Gráfico de Renda:**
+        Este gráfico compara a distribuição de renda entre as populações originárias de diferentes grupos de países e que estão vivendo nos Estados Unidos da América.
+        Para o primeiro grupo, entitulado de **Grupo A** e composto por: {', '.join(group_a)}; Temos as informações de **{population_a}** pessoas, das quais 
+        **{porcentagem_a_mais50k:.1f}%** da população ganha mais de \$50.000 por ano.
+        Enquanto isso, no **Grupo B**, formado por: {', '.join(group_b)}; Observa-se que das **{population_b}** pessoas desse grupo, apenas 
+        **{porcentagem_b_mais50k:.1f}%** delas ganham mais de \$50.000 por ano.
+        """ + descrever(comparacao, "o Grupo A", "o Grupo B")
+
+
+def descricao_educacao(group_a, group_b, population_a, population_b, df_education_groups):
+    if not group_a or not group_b:
+        return f""" Selecione os paises nos dois Grupos para obter a descrição completa """
+    return f"""
+            **Descrição do Gráfico de Educação:**
+            Este gráfico compara os níveis educacionais entre os dois grupos de países selecioandos.
+            No primeiro grupo, chamado de **Grupo A**, temos os dados de **{population_a}** pessoas originárias de: {', '.join(group_a)}. 
+            E para o segundo grupo, entitulado de **Grupo B**, apresenta-se os dados de **{population_b}** pessoas nascidas no(s) seguinte(s) país(es): {', '.join(group_b)}.
+            Através das proporções apresentadas nos gráficos, 
+            percebe-se que no Grupo A, **{(df_education_groups['percent'][0]+df_education_groups['percent'][1]):.1f}%** da população nem sequer possui o Ensino Médio Completo,
+            em comparação, no Grupo B, **{(df_education_groups['percent'][9]+df_education_groups['percent'][10]):.1f}%** da população está nessa mesma categoria.
+            Observa-se também, com relação ao número de pessoas que apenas possuem o Ensino Médio, que **{df_education_groups['percent'][2]:.1f}%** das pessoas do Grupo A e **{df_education_groups['percent'][11]:.1f}%** das pessoas no Grupo B se encontram nessa categoria.
+            Já no Ensino Técnico ou Superior Incompleto, encontram-se **{(df_education_groups['percent'][3]+df_education_groups['percent'][4]+df_education_groups['percent'][5]):.1f}%** das pessoas do Grupo A e **{(df_education_groups['percent'][12]+df_education_groups['percent'][13]+df_education_groups['percent'][14]):.1f}%** das pessoas no Grupo B.
+            Agora com o Ensino Superior Completo, **{df_education_groups['percent'][6]:.1f}%** das pessoas do Grupo A possuem esse diploma enquanto essa proporção é de **{df_education_groups['percent'][15]:.1f}%** no Grupo B.
+            E com relação a Pós-Graduações, o Grupo A é composto em **{df_education_groups['percent'][7]:.1f}% de mestres e {df_education_groups['percent'][8]:.1f}%** de doutores.
+            Enquanto no Grupo B esse valor é de **{df_education_groups['percent'][16]:.1f}%** e **{df_education_groups['percent'][17]:.1f}%** respectivamente.
+            """
+
+
+def render(df, versao_dataset):
+    st.write("## Comparação de Países - Hipótese 2 - Imigrantes recebem menos que norte-americanos")
+
+    # Initialize default values
+    tabela = country_table(versao_dataset)
+    countries = tabela.paises.tolist()
+    default_group_a = ["United-States"]
+    default_group_b = []
+
+    # Create placeholders for the charts
+    chart_placeholder_1 = st.empty()
+    desc_placeholder_1 = st.empty()
+    chart_placeholder_2 = st.empty()
+    desc_placeholder_2 = st.empty()
+
+    # Population info placeholder
+    # population_info = st.empty()
+
+    # ==================== SELECAO DOS PAISES ====================
+    st.write("### Configuração da Análise")
+
+    coluna1_paises, coluna2_paises = st.columns(2)
+
+    with coluna1_paises:
+        group_a = st.multiselect("Selecione os países do Grupo A", countries, default=default_group_a)
+
+    # Initialize selected countries set
+    selected_countries = set()
+
+    st.write("### Grupos de Seleção")
+    st.write("#### Todos os imigrantes")
+    select_all_sem_usa = st.checkbox("Selecionar todos os países menos os EUA para o Grupo B", value=True)
+
+    st.write("#### Regiões")
+    select_all_latinos = st.checkbox("Selecionar todos os Países **Latinos** para o Grupo B", value=False)
+    select_all_asiaticos = st.checkbox("Selecionar todos os Países **Asiáticos** para o Grupo B", value=False)
+    select_all_europeus = st.checkbox("Selecionar todos os Países **Europeus** para o Grupo B", value=False)
+
+    if select_all_sem_usa:
+        selected_countries.update(REGIOES[REGIAO_IMIGRANTES])
+    if select_all_latinos:
+        selected_countries.update(REGIOES[REGIAO_LATINOS])
+    if select_all_asiaticos:
+        selected_countries.update(REGIOES[REGIAO_ASIATICOS])
+    if select_all_europeus:
+        selected_countries.update(REGIOES[REGIAO_EUROPEUS])
+
+    with coluna2_paises:
+        group_b = st.multiselect("Selecione os países do Grupo B", countries, default=list(selected_countries))
+
+    selected_workclass = st.selectbox("Selecione a classe de trabalho:", WORKCLASSES)
+
+    # Data processing (contagens somadas da tabela por país)
+    with span("hipotese 2: contagens por país"):
+        contagens_a, contagens_b = contagens_grupos(tabela, group_a, group_b, selected_workclass)
+
+    # Intervalos de confiança e p-valor da renda (réplicas vetorizadas, memoizadas pelas contagens)
+    with span("hipotese 2: bootstrap"):
+        comparacao_renda = significancia_renda(bootstrap(), contagens_a, contagens_b)
+
+    # Update population info
+    population_a = int(contagens_a.sum())
+    population_b = int(contagens_b.sum())
+
+    # population_info.markdown(f"""
+    # População total do **Grupo A**: {population_a}
+    # População total do **Grupo B**: {population_b}
+    # """)
+
+    # Validation check
+    if not group_a or not group_b:
+        st.warning("⚠️ Selecione pelo menos um país em cada grupo. ⚠️")
+
+    # ==================== GRAFICO 1 ====================
+    df_income_groups = grupos_renda(contagens_a, contagens_b)
+
+    # ==================== GRAFICO 2 ====================
+    df_education_groups = grupos_educacao(contagens_a, contagens_b)
+
+    # ==================== PLOTS E DESCRICOES ====================
+    # A ordem dos países não muda as contagens, então os grupos entram na chave como conjuntos
+    widgets_paises = [set(group_a), set(group_b), selected_workclass]
+    col1_placeholder_pais, col2_placeholder_pais = st.columns(2)
+
+    with col1_placeholder_pais:
+        exibir_grafico(chart_placeholder_1, "Hipotese 2 - renda", widgets_paises,
+                       lambda: grafico_renda(df_income_groups))
+        desc_placeholder_1.markdown(descricao_renda(group_a, group_b, population_a, population_b, df_income_groups,
+                                                   comparacao_renda))
+
+    with col2_placeholder_pais:
+        exibir_grafico(chart_placeholder_2, "Hipotese 2 - educacao", widgets_paises,
+                       lambda: grafico_educacao(df_education_groups))
+        desc_placeholder_2.markdown(descricao_educacao(group_a, group_b, population_a, population_b,
+                                                       df_education_groups))
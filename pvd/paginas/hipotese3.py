@@ -0,0 +1,118 @@
+"""Hipótese 3: horas trabalhadas por semana e renda."""
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+from pvd.charts import violino_ponderado
+from pvd.instrumentation import span
+from pvd.recursos import exibir_grafico, range_table
+
+
+def aquecer(df, versao_dataset):
+    range_table(versao_dataset)
+
+
+def render(df, versao_dataset):
+    st.write("## Comparação de Horas - Hipótese 3 - A quantidade de horas trabalhadas por semana não está relacionada à renda do indivíduo")
+
+    # Use columns to display the two figures side by side at the top of the page
+    col1, col2 = st.columns(2)
+    chart_placeholder_horas = col1.empty()
+    stats_placeholder_horas = col2.empty()
+
+    desc_placeholder_horas = st.empty()
+
+    # Opções de filtro
+    workclassesHoras = [
+        "Qualquer área de trabalho", "workclass_Local-gov", "workclass_Private", "workclass_Self-emp-inc",
+        "workclass_Self-emp-not-inc", "workclass_State-gov", "workclass_Without-pay"
+    ]
+    selected_workclass = st.selectbox("Selecione a classe de trabalho:", workclassesHoras)
+
+    education_labels = {
+        0.125: "Médio Não Iniciado/Incompleto",
+        0.25: "Médio Completo",
+        0.625: "Superior Incompleto/Técnico",
+        0.75: "Bacharel",
+        0.875: "Mestrado",
+        1: "Doutorado"
+    }
+
+    # Slider que permite selecionar um intervalo (range) dentre os valores definidos
+    education_range = st.select_slider(
+        "Selecione o intervalo de education-num:",
+        options=list(education_labels.keys()),
+        value=(min(education_labels.keys()), max(education_labels.keys())),
+        format_func=lambda x: education_labels[x]
+    )
+
+    # Contagens e percentuais por renda e horas semanais para o intervalo e a classe escolhidos,
+    # lidos das somas de prefixo (diferença de duas fatias, qualquer que seja o intervalo)
+    tabelas = range_table(versao_dataset)
+    workclass_filtro = None if selected_workclass == "Qualquer área de trabalho" else selected_workclass
+    with span("hipotese 3: tabelas de prefixo"):
+        contagens_horas = tabelas.tabela(*education_range, workclass=workclass_filtro)
+        percentuais_horas = tabelas.percentuais(*education_range, workclass=workclass_filtro)
+
+    # Gerar a tabela de estatísticas
+    # st.write("### Estatísticas dos Dados Filtrados")
+    income_groups = [0, 1]
+    stats_summary = {
+        "Total de pessoas selecionadas": {},
+        "Faixa de educação escolhida": {},
+        "Área de trabalho escolhida": {},
+        "Menos de 40h Semanais (%)": {},
+        "Exatamente 40h Semanais (%)": {},
+        "Mais de 40h Semanais (%)": {}
+    }
+
+    totais_horas = contagens_horas.sum(axis=1)
+    percentuais_horas = percentuais_horas.reindex(index=income_groups, columns=[0, 0.5, 1], fill_value=0)
+    for income_value in income_groups:
+        total = int(totais_horas.get(income_value, 0))
+        stats_summary["Total de pessoas selecionadas"][income_value] = total
+        stats_summary["Faixa de educação escolhida"][income_value] = f"{education_range}"
+        stats_summary["Área de trabalho escolhida"][income_value] = selected_workclass
+
+        percent_0, percent_0_5, percent_1 = percentuais_horas.loc[income_value]
+
+        stats_summary["Menos de 40h Semanais (%)"][income_value] = f"{percent_0:.1f}%"
+        stats_summary["Exatamente 40h Semanais (%)"][income_value] = f"{percent_0_5:.1f}%"
+        stats_summary["Mais de 40h Semanais (%)"][income_value] = f"{percent_1:.1f}%"
+
+    # Criar o violin plot a partir das contagens (mesmo KDE do seaborn, sem passar pelas linhas)
+    def grafico_horas():
+        figHoras, ax = plt.subplots(figsize=(7, 5))
+        grupos_violino = [
+            (income_value, contagens_horas.columns.to_numpy(), linha.to_numpy())
+            for income_value, linha in contagens_horas.iterrows()
+            if linha.sum() > 0
+        ]
+        violino_ponderado(ax, grupos_violino)
+        ax.set_xlabel("income")
+        ax.set_ylabel("hours-per-week")
+        return figHoras
+
+    stats_summary_df = pd.DataFrame(stats_summary).T
+    stats_summary_df.columns = ["Renda Anual Inferior a $50.000", "Renda Anual Superior a $50.000"]
+
+    exibir_grafico(chart_placeholder_horas, "Hipotese 3", [selected_workclass, education_range], grafico_horas)
+    stats_placeholder_horas.write(stats_summary_df)
+
+    horas_desc = f"""
+        **Descrição do Violin Plot e da Tabela dos dados com base nas Horas:**
+        O gráfico Violin Plot apresentado acima mostra a comparação entre as distribuições da quantidade de pessoas que 
+        trabalham menos de 40 horas semanais, exatamante 40 horas semanais e mais de 40 horas semanais com base na renda
+        que elas possuem, podendo ser mais de \$50.000 anuais ou menos de \$50.000 anuais.
+        Neste Gráfico específico, em conjunto com a tabela ao lado, pode-se observar que considerando apenas as pessoas
+        que trabalham na área de: {selected_workclass}, e, possuem um nível de escolaridade entre {education_range[0]}
+        e {education_range[1]}, temos que para as pessoas com renda inferior a \$50.000 anuais, 
+        {stats_summary["Menos de 40h Semanais (%)"][0]} delas trabalham menos de 40 horas semanais, 
+        {stats_summary["Exatamente 40h Semanais (%)"][0]} delas trabalham exatamente 40 horas semanais e
+        {stats_summary["Mais de 40h Semanais (%)"][0]} delas trabalham mais de 40 horas semanais.
+        Já no grupo das pessoas que tem renda anual superior a \$50.000, observa-se que: 
+        {stats_summary["Menos de 40h Semanais (%)"][1]} delas trabalham menos de 40 horas semanais, 
+        {stats_summary["Exatamente 40h Semanais (%)"][1]} delas trabalham exatamente 40 horas semanais e
+        {stats_summary["Mais de 40h Semanais (%)"][1]} delas trabalham mais de 40 horas semanais.
+        """
+    desc_placeholder_horas.markdown(horas_desc)
@@ -0,0 +1,160 @@
+"""Hipótese 4: renda de mulheres e homens com a mesma área de trabalho e carga horária."""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from pvd.bootstrap import descrever
+from pvd.instrumentation import span
+from pvd.recursos import bitmap_index, bootstrap, carregar_backend, count_cube, exibir_grafico
+
+# Lista de classes de trabalho
+WORKCLASSES = [
+    "Qualquer área de trabalho",
+    "workclass_Local-gov", "workclass_Private", "workclass_Self-emp-inc",
+    "workclass_Self-emp-not-inc", "workclass_State-gov", "workclass_Without-pay"
+]
+HORAS = [0, 0.5, 1, "Todos"] # menos de 40h, igual a 40h, mais de 40h
+
+
+def aquecer(df, versao_dataset):
+    # Filtro padrão dos widgets, para já deixar os intervalos no cache
+    contagens = contar(versao_dataset, WORKCLASSES[0], HORAS[0])
+    comparar_generos(bootstrap(), contagens)
+
+
+def contar(versao_dataset, selected_workclass, selected_hours):
+    """Contagens do filtro pelo índice de bitmaps, ou pelo cubo se as linhas não estão na memória."""
+    # Um span por caminho, para o painel de diagnóstico distinguir os dois
+    if carregar_backend().linhas_em_memoria:
+        with span("hipotese 4: bitmaps"):
+            return contagens_generos(bitmap_index(versao_dataset), selected_workclass, selected_hours)
+    with span("hipotese 4: cubo"):
+        return contagens_generos_cubo(count_cube(versao_dataset), selected_workclass, selected_hours)
+
+
+def contagens_generos(indice, selected_workclass, selected_hours):
+    """(total de mulheres, total de homens, mulheres e homens com renda acima de $50k) no filtro."""
+    # Filtros compostos sobre o índice de bitmaps (AND bit a bit, sem copiar o df)
+    filtro_genero = indice.todos()
+    if selected_workclass != "Qualquer área de trabalho":
+        filtro_genero = filtro_genero & indice.bits(selected_workclass)
+
+    # Filtragem por hours-per-week
+    if selected_hours != "Todos":
+        filtro_genero = filtro_genero & indice.bits("hours-per-week", selected_hours)
+
+    # Contagem total de homens e mulheres no conjunto filtrado
+    mulheres = filtro_genero & indice.bits("sex_Male", 0)
+    homens = filtro_genero & indice.bits("sex_Male", 1)
+    total_women = mulheres.contar()
+    total_men = homens.contar()
+
+    # Contagem de mulheres e homens com income == 1
+    women_with_income = (mulheres & indice.bits("income")).contar()
+    men_with_income = (homens & indice.bits("income")).contar()
+    return total_women, total_men, women_with_income, men_with_income
+
+
+def contagens_generos_cubo(cube, selected_workclass, selected_hours):
+    """Como `contagens_generos`, mas lendo do cubo de contagens (backends que não carregam as linhas)."""
+    filtros = {}
+    if selected_workclass != "Qualquer área de trabalho":
+        filtros["workclass"] = selected_workclass
+    if selected_hours != "Todos":
+        filtros["hours-per-week"] = selected_hours
+    total_women = cube.contar({**filtros, "sex_Male": 0})
+    total_men = cube.contar({**filtros, "sex_Male": 1})
+    women_with_income = cube.contar({**filtros, "sex_Male": 0, "income": 1})
+    men_with_income = cube.contar({**filtros, "sex_Male": 1, "income": 1})
+    return total_women, total_men, women_with_income, men_with_income
+
+
+def percentuais_generos(total_women, total_men, women_with_income, men_with_income):
+    # Cálculo da porcentagem
+    women_income_percentage = (women_with_income / total_women) * 100 if total_women > 0 else 0
+    men_income_percentage = (men_with_income / total_men) * 100 if total_men > 0 else 0
+    return total_women, total_men, women_income_percentage, men_income_percentage
+
+
+def significancia_generos(motor, total_women, total_men, women_with_income, men_with_income):
+    """Intervalos bootstrap e p-valor da diferença entre homens (grupo B) e mulheres (grupo A)."""
+    return motor.comparar(women_with_income, total_women, men_with_income, total_men)
+
+
+def comparar_generos(motor, contagens):
+    """(total de mulheres, total de homens, % de mulheres, % de homens com renda acima de $50k, comparação).
+
+    `contagens` é a tupla de `contagens_generos` (ou `contagens_generos_cubo`); usada pela página e pelo relatório.
+    """
+    return (*percentuais_generos(*contagens), significancia_generos(motor, *contagens))
+
+
+def proporcoes_pizza(women_income_percentage, men_income_percentage):
+    soma = women_income_percentage + men_income_percentage
+    if soma == 0:
+        return 0, 0
+    return (women_income_percentage * 100) / soma, (men_income_percentage * 100) / soma
+
+
+# Criando o gráfico de pizza
+def grafico_genero(women_income_percentage, men_income_percentage):
+    fig_genero, ax = plt.subplots(figsize=(2, 2))
+    labels = ["Mulheres", "Homens"]
+    sizes = [women_income_percentage, men_income_percentage]
+    colors = ["#ff9999", "#66b3ff"]  # Cores para mulheres e homens
+    explode = (0.1, 0)  # Destacar fatia das mulheres
+    if sum(sizes) > 0:
+        ax.pie(sizes, labels=labels, autopct="%1.1f%%", colors=colors, startangle=90, explode=explode, shadow=True)
+    else:
+        # Ninguém com renda acima de $50k no filtro: não há fatias para desenhar
+        ax.text(0.5, 0.5, "Sem dados", ha="center", va="center")
+        ax.axis("off")
+    ax.set_title("Comparação de Probabilidade de Renda Anual Superior a $50.000")
+    return fig_genero
+
+
+def descricao_genero(selected_workclass, selected_hours, total_women, total_men, women_income_percentage,
+                     men_income_percentage, comparacao=None):
+    procentagem_pizza_mulher, procentagem_pizza_homem = proporcoes_pizza(women_income_percentage, men_income_percentage)
+    return f"""
+        **Descrição do Gráfico de Renda por Gênero:**
+        O gráfico mostrado acima é um gráfico de Pizza que apresenta a proporção entre Homens e Mulheres que ganham salários anuais superiores a \$50.000 anuais.
+        Ele foi construído com base na probabilidade de Homens e Mulheres, que trabalham na mesma área de atuação ({selected_workclass}),
+        e com a mesma quantidade de Horas Semanais ({selected_hours}) ganharem mais de \$50.000 anuais.
+        Nessa representação específica, temos que das {total_women} mulheres que atuam nessa área por essas horas, apenas {women_income_percentage:.1f}% ganham acima dos \$50.000 anuais.
+        Enquanto para os Homens nessa mesma área de atuação e que trabalham pela mesma área, verificamos que existem {total_men} homens nessa categoria,
+        dos quais {men_income_percentage:.1f}% recebem acima dos \$50.000 anuais.
+        Assim, considerando a soma dessas porcentagens ({women_income_percentage:.1f} e {men_income_percentage:.1f}), é feita a construção do Gráfico de Pizza.
+        Dessa forma, as porcentagens contidas nesse gráfico indicam que:
+        A proporção dos indivíduos mulheres que recebem mais de \$50.000, trabalha na área da {selected_workclass}, por {selected_hours} semanais é de: {procentagem_pizza_mulher:.1f}%.
+        Enquanto a proporção dos homens com essas mesmas características é de: {procentagem_pizza_homem:.1f}%.
+        """ + descrever(comparacao, "as mulheres", "os homens")
+
+
+def render(df, versao_dataset):
+    st.write("## Comparação de Gênero - Hipótese 4 - Mulheres recebem menos que homens mesmo se filtrarmos por horas trabalhadas e nível de escolaridade")
+
+    chart_placeholder_genero = st.empty()
+    desc_placeholder_genero = st.empty()
+
+    # Caixa de seleção para escolher a classe de trabalho
+    selected_workclass = st.selectbox("Selecione a classe de trabalho:", WORKCLASSES)
+
+    # Caixa de seleção para escolher o valor de hours-per-week
+    selected_hours = st.selectbox("Selecione a carga horária (hours-per-week):", HORAS)
+
+    contagens = contar(versao_dataset, selected_workclass, selected_hours)
+
+    # Percentuais, intervalos de confiança e p-valor (réplicas vetorizadas, memoizadas pelas contagens)
+    with span("hipotese 4: bootstrap"):
+        total_women, total_men, women_income_percentage, men_income_percentage, comparacao = \
+            comparar_generos(bootstrap(), contagens)
+
+    # Exibição dos resultados
+    st.write(f"🔹 **De um total de {total_women} mulheres, {women_income_percentage:.2f}% delas ganham mais de \$50k, trabalham na área de: {selected_workclass}, por {selected_hours} horas/semana):**")
+    st.write(f"🔹 **De um total de {total_men} homens, {men_income_percentage:.2f}% delas ganham mais de \$50k, trabalham na área de: {selected_workclass}, por {selected_hours} horas/semana):**")
+
+    exibir_grafico(chart_placeholder_genero, "Hipotese 4", [selected_workclass, selected_hours],
+                   lambda: grafico_genero(women_income_percentage, men_income_percentage))
+
+    desc_placeholder_genero.markdown(descricao_genero(selected_workclass, selected_hours, total_women, total_men,
+                                                      women_income_percentage, men_income_percentage, comparacao))
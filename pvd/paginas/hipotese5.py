@@ -0,0 +1,167 @@
+"""Hipótese 5: distribuições de idade e de ganhos com investimentos."""
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from pvd.charts import curva_preenchida
+from pvd.density import COLUNA_IDADE, COLUNA_INVESTIMENTO
+from pvd.instrumentation import span
+from pvd.recursos import density_engine, ecdf_index, exibir_grafico
+
+CURVAS_KDE = "Suavizadas (KDE)"
+CURVAS_ECDF = "Empíricas (ECDF)"
+
+
+def aquecer(df, versao_dataset):
+    # Densidades da faixa etária completa (valor padrão do slider) e o índice da probabilidade
+    densidades = density_engine(versao_dataset)
+    for coluna in (COLUNA_IDADE, COLUNA_INVESTIMENTO):
+        densidades.distribuicao(coluna, densidades.idades.min(), densidades.idades.max())
+    ecdf_index(versao_dataset)
+
+
+def grafico_investimento(densidades, selected_age_min, selected_age_max, max_value_input,
+                         exclude_zero_investment, probability_max):
+    # Criação dos gráficos: linhas para idade (PDF e CDF) e investimento (PDF e CDF)
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(12, 8))
+
+    # PDFs e CDFs a partir dos histogramas por idade (sem reprocessar as linhas)
+    with span("hipotese 5: densidades"):
+        dist_idade = densidades.distribuicao(COLUNA_IDADE, selected_age_min, selected_age_max, exclude_zero_investment)
+        dist_investimento = densidades.distribuicao(COLUNA_INVESTIMENTO, selected_age_min, selected_age_max,
+                                                    exclude_zero_investment)
+
+    # Gráficos para Idade
+    curva_preenchida(axes[0, 0], dist_idade.x, dist_idade.pdf)
+    axes[0, 0].set_title("PDF - Idade")
+    axes[0, 0].set_xlabel("Idade")
+    axes[0, 0].set_ylabel("Densidade")
+
+    curva_preenchida(axes[0, 1], dist_idade.x, dist_idade.cdf)
+    axes[0, 1].set_title("CDF - Idade")
+    axes[0, 1].set_xlabel("Idade")
+    axes[0, 1].set_ylabel("Probabilidade Acumulada")
+
+    # Gráficos para Investimento
+    curva_preenchida(axes[1, 0], dist_investimento.x, dist_investimento.pdf)
+    axes[1, 0].set_title("PDF - Investimento")
+    axes[1, 0].set_xlabel("Investimento")
+    axes[1, 0].set_ylabel("Densidade")
+    # Linha vermelha indicando o valor máximo e sua probabilidade (PDF)
+    axes[1, 0].axvline(x=max_value_input, color='r', linestyle='--', label=f'Valor: ${max_value_input} - Prob: {probability_max:.2f}%')
+    axes[1, 0].legend()
+
+    curva_preenchida(axes[1, 1], dist_investimento.x, dist_investimento.cdf)
+    axes[1, 1].set_title("CDF - Investimento")
+    axes[1, 1].set_xlabel("Investimento")
+    axes[1, 1].set_ylabel("Probabilidade Acumulada")
+    # Linha vermelha indicando a probabilidade (CDF)
+    axes[1, 1].axhline(y=probability_max/100, color='r', linestyle='--', label=f'Valor: ${max_value_input} - Prob: {probability_max:.2f}%')
+    axes[1, 1].legend()
+
+    fig.tight_layout()
+    return fig
+
+
+def grafico_investimento_empirico(indice, selected_age_min, selected_age_max, max_value_input,
+                                  exclude_zero_investment, probability_max):
+    # Mesmos painéis, com as distribuições exatas (frequências, ECDFs e quantis) em vez das curvas suavizadas
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(12, 8))
+
+    with span("hipotese 5: ecdf"):
+        idades, frequencias, cdf_idade = indice.ecdf_idade(selected_age_min, selected_age_max, exclude_zero_investment)
+        valores, cdf_investimento = indice.ecdf(selected_age_min, selected_age_max, exclude_zero_investment)
+        niveis = np.linspace(0, 1, 201)
+        quantis = indice.quantil(niveis, selected_age_min, selected_age_max, exclude_zero_investment)
+
+    # Gráficos para Idade
+    axes[0, 0].bar(idades, frequencias, width=1, color="C0", alpha=0.6)
+    axes[0, 0].set_title("Frequência - Idade")
+    axes[0, 0].set_xlabel("Idade")
+    axes[0, 0].set_ylabel("Proporção")
+
+    axes[0, 1].step(idades, cdf_idade, where="post")
+    axes[0, 1].set_title("ECDF - Idade")
+    axes[0, 1].set_xlabel("Idade")
+    axes[0, 1].set_ylabel("Probabilidade Acumulada")
+
+    # Gráficos para Investimento
+    axes[1, 0].step(niveis, quantis, where="post")
+    axes[1, 0].set_title("Quantis - Investimento")
+    axes[1, 0].set_xlabel("Probabilidade Acumulada")
+    axes[1, 0].set_ylabel("Investimento")
+    # Linha vermelha no valor máximo: a probabilidade é a parte da curva acima dela
+    axes[1, 0].axhline(y=max_value_input, color='r', linestyle='--', label=f'Valor: ${max_value_input} - Prob: {probability_max:.2f}%')
+    axes[1, 0].legend()
+
+    axes[1, 1].step(valores, cdf_investimento, where="post")
+    axes[1, 1].set_title("ECDF - Investimento")
+    axes[1, 1].set_xlabel("Investimento")
+    axes[1, 1].set_ylabel("Probabilidade Acumulada")
+    # Linha vermelha no valor máximo e na probabilidade acumulada até ele (1 - probabilidade)
+    axes[1, 1].axvline(x=max_value_input, color='r', linestyle='--', label=f'Valor: ${max_value_input} - Prob: {probability_max:.2f}%')
+    axes[1, 1].axhline(y=1 - probability_max/100, color='r', linestyle=':')
+    axes[1, 1].legend()
+
+    fig.tight_layout()
+    return fig
+
+
+def descricao_investimento(selected_age_min, selected_age_max, max_value_input,
+                           exclude_zero_investment, probability_max):
+    return f"""
+        **Descrição do Gráfico de Renda:**
+        Os gráficos presentes acima apresentam as Distribuições de Probabilidade Acumulada e Distribuídas dos valores das idades e dos rendimentos obtidos com investimentos pela população que participiou do Senso Demográfico.
+        Nessa amostragem estão inclusas as pessoas cuja idade é superior a {selected_age_min} anos de idade e inferior a {selected_age_max} anos de idade.
+        Também é mostrado um valor de limite mínimo de lucro obtido com investimentos para servir como base para cálculos de probabilidade.
+        O limite selecionado é de \${max_value_input}, ou seja, através do gráfico é demonstrado que a **probabilidade de alguém entre {selected_age_min} e {selected_age_max} anos
+        possuir um lucro superior a \${max_value_input} é de {probability_max:.2f}%**.
+        Nesse conjunto de gráficos também possui a opção de incluir ou não as pessoas que não realizam investimentos, onde esta oção atualmente está marcada como: "{exclude_zero_investment}".
+        """
+
+
+def render(df, versao_dataset):
+    st.write("## Comparação de Investimentos - Hipótese 5 - Indivíduos mais jovens se arriscam mais com investimentos do que indivíduos que são mais velhos")
+    
+    chart_placeholder_investimento = st.empty()
+    desc_placeholder_investimentos = st.empty()
+    
+    densidades = density_engine(versao_dataset)
+    idade_min, idade_max = int(densidades.idades.min()), int(densidades.idades.max())
+
+    # Selecionar faixa etária
+    selected_age_range = st.slider("Selecione uma faixa etária", 
+                                   min_value=idade_min, 
+                                   max_value=idade_max, 
+                                   value=(idade_min, idade_max), 
+                                   step=5)
+    selected_age_min, selected_age_max = selected_age_range
+    
+    # Caixa de entrada para o valor máximo (max_values)
+    max_value_input = st.number_input("Digite o valor máximo para analisar a probabilidade de investimento superior", 
+                                      min_value=0, value=15000, step=1000)
+
+    exclude_zero_investment = st.checkbox("Desconsiderar pessoas com investimento 0", value=False)
+
+    curvas = st.radio("Curvas", [CURVAS_KDE, CURVAS_ECDF], horizontal=True)
+
+    # Probabilidade com base no max_value_input, lida do índice da ECDF (sem filtrar o df)
+    indice = ecdf_index(versao_dataset)
+    with span("hipotese 5: probabilidade"):
+        probability_max = indice.probabilidade_acima(max_value_input, selected_age_min, selected_age_max,
+                                                     exclude_zero_investment) * 100
+    
+    st.write(f"A probabilidade de uma pessoa entre {selected_age_min} e {selected_age_max} anos ter um investimento superior a {max_value_input} é de {probability_max:.2f}%")
+    
+    if curvas == CURVAS_KDE:
+        grafico = lambda: grafico_investimento(densidades, selected_age_min, selected_age_max, max_value_input,
+                                               exclude_zero_investment, probability_max)
+    else:
+        grafico = lambda: grafico_investimento_empirico(indice, selected_age_min, selected_age_max, max_value_input,
+                                                        exclude_zero_investment, probability_max)
+    exibir_grafico(chart_placeholder_investimento, "Hipotese 5",
+                   [selected_age_range, max_value_input, exclude_zero_investment, curvas], grafico)
+    
+
+    desc_placeholder_investimentos.markdown(descricao_investimento(selected_age_min, selected_age_max, max_value_input,
+                                                                   exclude_zero_investment, probability_max))
@@ -0,0 +1,77 @@
+"""Relevância dos atributos: informação mútua e correlação com um atributo alvo."""
+import plotly.express as px
+import streamlit as st
+
+from pvd.instrumentation import span
+from pvd.recursos import exibir_grafico, relevance_service
+from pvd.relevance import ALVO_PADRAO, ESTIMADORES
+
+ROTULOS_ESTIMADORES = {
+    "contagens": "Contagens (exato para atributos discretos)",
+    "vizinhos": "k-vizinhos (como no notebook)",
+}
+N_ATRIBUTOS_PADRAO = 15
+
+
+def aquecer(df, versao_dataset):
+    relevance_service(versao_dataset).ranking(ALVO_PADRAO, estimador=ESTIMADORES[0])
+
+
+def render(df, versao_dataset):
+    st.write("## Relevância dos Atributos - Quais atributos mais informam sobre o atributo alvo")
+
+    servico = relevance_service(versao_dataset)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        alvo = st.selectbox("Selecione o atributo alvo:", servico.alvos, index=servico.alvos.index(ALVO_PADRAO)
+                            if ALVO_PADRAO in servico.alvos else 0)
+        estimador = st.radio("Estimador da informação mútua:", list(ESTIMADORES), horizontal=True,
+                             format_func=ROTULOS_ESTIMADORES.get)
+    with col2:
+        classes = st.multiselect("Classes de trabalho consideradas:", servico.grupos, default=servico.grupos)
+        n_atributos = st.slider("Atributos exibidos no gráfico:", 5, len(servico.colunas) - 1, N_ATRIBUTOS_PADRAO)
+
+    if not classes:
+        st.warning("Selecione pelo menos uma classe de trabalho.")
+        return
+
+    # Na primeira vez de cada (alvo, classes), o estimador por k-vizinhos leva alguns segundos
+    with st.spinner("Calculando a informação mútua..."), span("relevância: ranking"):
+        ranking = servico.ranking(alvo, classes, estimador)
+
+    col_grafico, col_tabela = st.columns(2)
+
+    def grafico_relevancia():
+        principais = ranking.head(n_atributos).iloc[::-1].reset_index()
+        fig = px.bar(
+            principais, x="Informação mútua", y="Atributo", orientation="h", color="Correlação",
+            color_continuous_scale="RdBu_r", range_color=(-1, 1),
+        )
+        fig.update_layout(height=max(400, 25 * n_atributos), margin=dict(l=0, r=0, t=30, b=0))
+        return fig
+
+    # As classes formam um conjunto (como no `ranking`): a ordem em que foram escolhidas não muda o gráfico
+    exibir_grafico(col_grafico, "Relevancia", [alvo, tuple(sorted(classes)), estimador, n_atributos],
+                   grafico_relevancia, use_container_width=True)
+    col_tabela.dataframe(ranking.round(4))
+
+    primeiros = ranking.head(3)
+    destaques = ", ".join(
+        f"**{atributo}** ({linha['Informação mútua']:.4f}, correlação de {linha['Correlação']:.2f})"
+        for atributo, linha in primeiros.iterrows()
+    )
+    n_pessoas = f"{servico.n_linhas(classes):,}".replace(",", ".")
+    st.markdown(f"""
+        **Descrição do Gráfico e da Tabela:**
+        O gráfico de barras acima ordena os atributos pela informação mútua com **{alvo}**, ou seja, pelo quanto
+        conhecer o valor de cada atributo reduz a incerteza sobre o alvo (0 indica independência). A cor de cada barra
+        é a correlação de Pearson com o alvo, que também indica o sentido da relação.
+        Considerando as {n_pessoas} pessoas das classes de trabalho selecionadas, os atributos mais relevantes são
+        {destaques}.
+
+        O estimador por contagens calcula a informação mútua exata a partir das tabelas de contingência, já que todos
+        os atributos do dataset processado são discretos. O estimador por k-vizinhos é o usado no notebook, que trata
+        os atributos como contínuos; ele é calculado em paralelo, um atributo por processo, e fica em cache para cada
+        combinação de alvo e classes de trabalho.
+        """)
@@ -0,0 +1,77 @@
+"""Países codificados como inteiros, registro de regiões e contagens por país da Hipótese 2.
+
+Cada país vira o código da sua posição nos níveis do cubo de contagens.
+As regiões do registro `REGIOES` são convertidas uma única vez em arrays
+de códigos. Para cada classe de trabalho (e para todas juntas), a tabela
+guarda as contagens de renda x educação de cada país; as contagens de um
+grupo de países são a soma de no máximo ~40 linhas dessa tabela, sem
+filtrar o DataFrame nem o cubo inteiro.
+"""
+import numpy as np
+import pandas as pd
+
+DIMENSOES = ("income", "education-num")
+DIMENSAO_PAIS = "native-country-name"
+
+REGIAO_IMIGRANTES = "Todos os imigrantes"
+REGIAO_LATINOS = "Latinos"
+REGIAO_ASIATICOS = "Asiáticos"
+REGIAO_EUROPEUS = "Europeus"
+
+REGIOES = {
+    REGIAO_IMIGRANTES: [
+        "Haiti", "Cuba", "Jamaica", "Mexico", "Dominican-Republic", "Peru", "Puerto-Rico", "Honduras", "Ecuador",
+        "El-Salvador", "Guatemala", "Trinadad&Tobago", "Nicaragua", "China", "India", "Philippines", "Cambodia",
+        "Thailand", "Laos", "Taiwan", "Japan", "Vietnam", "Hong", "England", "Germany", "Poland", "Portugal",
+        "France", "Italy", "Scotland", "Greece", "Ireland", "Hungary", "Holand-Netherlands", "Yugoslavia", "Canada",
+        "Iran", "Columbia", "South",
+    ],
+    REGIAO_LATINOS: [
+        "Haiti", "Cuba", "Jamaica", "Mexico", "Dominican-Republic", "Peru", "Puerto-Rico", "Honduras", "Ecuador",
+        "El-Salvador", "Guatemala", "Trinadad&Tobago", "Nicaragua",
+    ],
+    REGIAO_ASIATICOS: ["China", "India", "Philippines", "Cambodia", "Thailand", "Laos", "Taiwan", "Japan", "Vietnam",
+                       "Hong"],
+    REGIAO_EUROPEUS: ["England", "Germany", "Poland", "Portugal", "France", "Italy", "Scotland", "Greece", "Ireland",
+                      "Hungary", "Holand-Netherlands", "Yugoslavia"],
+}
+
+
+class CountryTable:
+    """Contagens de `dims` por país e classe de trabalho, com as regiões pré-codificadas."""
+
+    def __init__(self, cube, dims=DIMENSOES, regioes=REGIOES):
+        self.dims = list(dims)
+        self.paises = cube.niveis[DIMENSAO_PAIS]
+        self.niveis = {dim: cube.niveis[dim] for dim in self.dims}
+        self.codigos = {pais: i for i, pais in enumerate(self.paises.tolist())}
+        self._posicoes_workclass = {valor: i for i, valor in enumerate(cube.niveis["workclass"].tolist())}
+
+        por_pais = cube.somar(["workclass", DIMENSAO_PAIS] + self.dims)
+        # Uma linha extra na classe de trabalho com a soma de todas ("qualquer área de trabalho")
+        self.contagens = np.concatenate([por_pais, por_pais.sum(axis=0, keepdims=True)], axis=0)
+
+        self.regioes = {nome: self.codificar(paises) for nome, paises in regioes.items()}
+        self._indice = pd.MultiIndex.from_product([self.niveis[dim] for dim in self.dims], names=self.dims)
+
+    def codificar(self, paises):
+        """Códigos (sem repetição) dos países conhecidos da lista."""
+        return np.unique(np.array([self.codigos[p] for p in paises if p in self.codigos], dtype=np.intp))
+
+    def contagens_grupo(self, paises, workclass=None):
+        """Array (renda x educação) somado sobre os países do grupo (lista de nomes ou nome de uma região).
+
+        Sem `workclass`, conta todas as classes de trabalho.
+        """
+        codigos = self.regioes[paises] if isinstance(paises, str) else self.codificar(paises)
+        if workclass is None:
+            linha = -1
+        elif workclass in self._posicoes_workclass:
+            linha = self._posicoes_workclass[workclass]
+        else:
+            return np.zeros(self.contagens.shape[2:], dtype=self.contagens.dtype)
+        return self.contagens[linha, codigos].sum(axis=0)
+
+    def serie(self, paises, workclass=None):
+        """Como `contagens_grupo`, mas uma Series indexada pelos níveis (igual a `CountCube.serie`)."""
+        return pd.Series(self.contagens_grupo(paises, workclass).ravel(), index=self._indice, name="count")
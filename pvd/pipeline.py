@@ -0,0 +1,192 @@
+"""Pré-processamento como um DAG de estágios com cache endereçado por conteúdo.
+
+Os estágios são os mesmos passos de `pvd.preprocessing` (e do notebook),
+separados: ingestão dos arquivos brutos `adult.data` e `adult.test` (sem
+`fetch_ucirepo`, sem rede), remoção de duplicatas, remoção de '?' e NA,
+ajuste das categorias e do MinMaxScaler, transformação (get_dummies,
+investimentos, discretização e escala) e exportação do CSV.
+
+A saída de cada estágio é gravada em `.cache/pipeline/` sob uma chave que
+é o hash do nome do estágio, do código da sua função e dos módulos de que
+ela depende (`pvd.preprocessing`, onde está a lógica de fato), dos
+parâmetros que ele usa e das chaves dos estágios de entrada (para a
+ingestão, o hash do conteúdo dos arquivos). Mudar um parâmetro ou um arquivo muda a chave do
+estágio afetado e, em cadeia, a de todos os que dependem dele; os demais
+continuam no cache. Estágios cujos dependentes estão todos no cache nem
+chegam a ser lidos do disco.
+
+Uso:
+    python -m pvd.pipeline adult.data adult.test data_processada_final.csv [--manter-nome-pais]
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+from sklearn.preprocessing import MinMaxScaler
+
+from pvd import preprocessing
+from pvd.preprocessing import COLUNAS_DESCARTADAS, COLUNAS_ESCALADAS, FORMATO_CSV
+
+CACHE_DIR_PADRAO = ".cache/pipeline"
+
+# Colunas de adult.data/adult.test, que não têm cabeçalho
+COLUNAS_BRUTAS = [
+    "age", "workclass", "fnlwgt", "education", "education-num", "marital-status", "occupation",
+    "relationship", "race", "sex", "capital-gain", "capital-loss", "hours-per-week", "native-country", "income",
+]
+
+CACHE = "cache"
+CALCULADO = "calculado"
+NAO_LIDO = "cache (não lido)"
+
+
+def ingerir(arquivos):
+    """Concatena os arquivos brutos, na ordem dada (adult.data e depois adult.test, como no fetch_ucirepo)."""
+    # A primeira linha do adult.test ("|1x3 Cross validator") é descartada como comentário
+    return pd.concat([pd.read_csv(arquivo, header=None, names=COLUNAS_BRUTAS, sep=",", skipinitialspace=True,
+                                  comment="|")
+                      for arquivo in arquivos], ignore_index=True)
+
+
+def deduplicar(bruto):
+    return bruto.drop(columns=COLUNAS_DESCARTADAS).drop_duplicates()
+
+
+def limpar(dados):
+    return preprocessing.limpar(dados)
+
+
+def ajustar(dados):
+    """Categorias dos atributos nominais e MinMaxScaler ajustado."""
+    return preprocessing.categorias(dados), MinMaxScaler().fit(preprocessing.discretizar(dados)[COLUNAS_ESCALADAS])
+
+
+def transformar(dados, ajuste, manter_nome_pais):
+    cats, scaler = ajuste
+    return preprocessing.transformar(dados, cats, scaler, manter_nome_pais)
+
+
+def exportar(processado):
+    """O CSV processado, no mesmo formato do to_csv do notebook."""
+    return processado.to_csv(**FORMATO_CSV).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class Estagio:
+    nome: str
+    funcao: object
+    entradas: tuple = ()
+    parametros: tuple = ()
+    # Módulos cujo código entra na chave: as funções dos estágios só chamam (ou usam constantes de) `preprocessing`
+    modulos: tuple = ()
+
+
+ESTAGIOS = [
+    Estagio("ingerir", ingerir, parametros=("arquivos",)),
+    Estagio("deduplicar", deduplicar, entradas=("ingerir",), modulos=(preprocessing,)),
+    Estagio("limpar", limpar, entradas=("deduplicar",), modulos=(preprocessing,)),
+    Estagio("ajustar", ajustar, entradas=("limpar",), modulos=(preprocessing,)),
+    Estagio("transformar", transformar, entradas=("limpar", "ajustar"), parametros=("manter_nome_pais",),
+            modulos=(preprocessing,)),
+    Estagio("exportar", exportar, entradas=("transformar",), modulos=(preprocessing,)),
+]
+
+
+class Pipeline:
+    """Executa os estágios sob demanda, reaproveitando as saídas já gravadas."""
+
+    def __init__(self, estagios=ESTAGIOS, cache_dir=CACHE_DIR_PADRAO):
+        self.estagios = {estagio.nome: estagio for estagio in estagios}
+        self.cache_dir = Path(cache_dir)
+
+    def _identidade(self, valor):
+        """Valor de um parâmetro como entra na chave: arquivos pelo hash do conteúdo."""
+        if isinstance(valor, (list, tuple)):
+            return [self._identidade(v) for v in valor]
+        if isinstance(valor, Path):
+            return hashlib.sha256(valor.read_bytes()).hexdigest()
+        return valor
+
+    def chaves(self, parametros):
+        """Chave de cada estágio, na ordem do DAG."""
+        chaves = {}
+        for estagio in self.estagios.values():
+            conteudo = json.dumps([
+                estagio.nome,
+                [hashlib.sha256(inspect.getsource(objeto).encode()).hexdigest()
+                 for objeto in (estagio.funcao, *estagio.modulos)],
+                [chaves[entrada] for entrada in estagio.entradas],
+                {nome: self._identidade(parametros[nome]) for nome in estagio.parametros},
+            ])
+            chaves[estagio.nome] = hashlib.sha256(conteudo.encode()).hexdigest()[:16]
+        return chaves
+
+    def _arquivo(self, nome, chave):
+        return self.cache_dir / f"{nome}-{chave}.pkl"
+
+    def executar(self, parametros, alvo="exportar"):
+        """Saída do estágio `alvo` e o relatório {estágio: (situação, segundos, chave)}."""
+        chaves = self.chaves(parametros)
+        relatorio = {nome: (NAO_LIDO, 0.0, chaves[nome]) for nome in chaves}
+        saidas = {}
+
+        def resolver(nome):
+            if nome in saidas:
+                return saidas[nome]
+            estagio, chave = self.estagios[nome], chaves[nome]
+            arquivo = self._arquivo(nome, chave)
+            if arquivo.exists():
+                inicio = time.perf_counter()
+                with open(arquivo, "rb") as f:
+                    saidas[nome] = pickle.load(f)
+                relatorio[nome] = (CACHE, time.perf_counter() - inicio, chave)
+                return saidas[nome]
+
+            entradas = [resolver(entrada) for entrada in estagio.entradas]
+            inicio = time.perf_counter()
+            saidas[nome] = estagio.funcao(*entradas, **{p: parametros[p] for p in estagio.parametros})
+            arquivo.parent.mkdir(parents=True, exist_ok=True)
+            # Grava em arquivo temporário para não deixar cache pela metade
+            temporario = arquivo.with_suffix(".tmp")
+            with open(temporario, "wb") as f:
+                pickle.dump(saidas[nome], f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, arquivo)
+            relatorio[nome] = (CALCULADO, time.perf_counter() - inicio, chave)
+            return saidas[nome]
+
+        return resolver(alvo), relatorio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-processamento do Adult em estágios com cache.")
+    parser.add_argument("arquivos", nargs="+", help="arquivos brutos (adult.data, adult.test) seguidos do CSV de saída")
+    parser.add_argument("--manter-nome-pais", action="store_true",
+                        help="inclui a coluna native-country-name usada pelo dashboard")
+    parser.add_argument("--cache-dir", default=CACHE_DIR_PADRAO)
+    args = parser.parse_args(argv)
+    if len(args.arquivos) < 2:
+        parser.error("informe ao menos um arquivo bruto e o CSV de saída")
+    *brutos, destino = args.arquivos
+
+    parametros = {"arquivos": [Path(a) for a in brutos], "manter_nome_pais": args.manter_nome_pais}
+    inicio = time.perf_counter()
+    csv, relatorio = Pipeline(cache_dir=args.cache_dir).executar(parametros)
+    Path(destino).write_bytes(csv)
+    total = time.perf_counter() - inicio
+
+    print(f"{'estágio':<12} {'situação':<17} {'tempo (ms)':>10}  chave")
+    for nome, (situacao, segundos, chave) in relatorio.items():
+        print(f"{nome:<12} {situacao:<17} {segundos * 1000:10.1f}  {chave}")
+    acertos = sum(situacao != CALCULADO for situacao, _, _ in relatorio.values())
+    print(f"{acertos}/{len(relatorio)} estágios do cache; {total:.2f} s no total. CSV gravado em {destino}")
+
+
+if __name__ == "__main__":
+    main()
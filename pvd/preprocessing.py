@@ -0,0 +1,165 @@
+"""Pré-processamento do dataset Adult, extraído do notebook.
+
+Reproduz as etapas de `Pre_processamento_e_visualizacao.ipynb` (remoção de
+atributos, duplicatas e valores ausentes, codificação de income e
+native-country, get_dummies, investimentos, discretização e MinMaxScaler)
+com operações vetorizadas do NumPy/pandas, no lugar dos `apply(axis=1)`.
+
+Há dois modos: em memória e em streaming por blocos (`chunksize`), que
+percorre o arquivo duas vezes (ajuste e transformação) e mantém em memória
+apenas um bloco por vez e os hashes das linhas já vistas. Os dois modos
+geram o mesmo CSV, byte a byte, que o notebook.
+
+Uso:
+    python -m pvd.preprocessing adult.csv data_processada.csv [--chunksize 100000] [--manter-nome-pais]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import MinMaxScaler
+
+COLUNAS_DESCARTADAS = ["education", "fnlwgt"]
+COLUNAS_NOMINAIS = ["workclass", "marital-status", "occupation", "relationship", "race", "sex"]
+COLUNAS_NUMERICAS = ["age", "education-num", "capital-gain", "capital-loss", "hours-per-week"]
+COLUNAS_ESCALADAS = ["age", "education-num", "hours-per-week"]
+INCOME_MENOR_50K = ["<=50K", "<=50K."]
+
+# Mesmo formato do to_csv do notebook
+FORMATO_CSV = dict(sep=",", decimal=",", index=False, encoding="utf-8")
+
+
+def limpar(data):
+    """Remove as linhas com NA ou com '?' em algum atributo nominal."""
+    data = data.dropna()
+    nominais = data.select_dtypes(include=["object", "string"])
+    data = data[~(nominais == "?").any(axis=1).to_numpy()]
+    # Colunas que tinham NA no bloco são lidas como float
+    return data.astype({coluna: "int64" for coluna in COLUNAS_NUMERICAS})
+
+
+def discretizar(data):
+    """Colunas de idade, educação e horas antes do MinMaxScaler."""
+    horas = data["hours-per-week"].to_numpy()
+    educacao = data["education-num"].to_numpy()
+    return pd.DataFrame({
+        "age": data["age"].to_numpy(),
+        "education-num": np.where(educacao <= 8, 8, educacao),
+        "hours-per-week": np.where(horas < 40, 0.0, np.where(horas == 40, 0.5, 1.0)),
+    }, index=data.index)
+
+
+def categorias(data):
+    """Categorias (ordenadas, como no get_dummies) de cada atributo nominal."""
+    return {coluna: sorted(data[coluna].unique()) for coluna in COLUNAS_NOMINAIS}
+
+
+def transformar(data, cats, scaler, manter_nome_pais=False):
+    """Aplica as etapas do notebook a um bloco já limpo."""
+    nome_pais = data["native-country"]
+    saida = data.drop(columns=COLUNAS_NOMINAIS)
+
+    saida["income"] = np.where(saida["income"].isin(INCOME_MENOR_50K), 0, 1)
+    saida["native-country"] = (saida["native-country"] == "United-States").astype("int64")
+
+    nominais = pd.DataFrame(
+        {coluna: pd.Categorical(data[coluna], categories=cats[coluna]) for coluna in COLUNAS_NOMINAIS},
+        index=data.index,
+    )
+    saida = pd.concat([saida, pd.get_dummies(nominais, drop_first=True, dtype=int)], axis=1)
+
+    ganho = saida["capital-gain"].to_numpy()
+    perda = saida["capital-loss"].to_numpy()
+    sem_investimento = (ganho == 0) & (perda == 0)
+    saida["investment_status_naoDiscretizado"] = np.where(sem_investimento, 0, np.where(ganho > 0, ganho, -perda))
+    saida["investment_status"] = np.where(sem_investimento, 0.0, np.where(ganho > 0, 0.5, 1.0))
+    saida = saida.drop(columns=["capital-gain", "capital-loss"])
+
+    discretizadas = discretizar(data)
+    saida["hours-per-week"] = discretizadas["hours-per-week"]
+    saida["education-num"] = discretizadas["education-num"]
+    saida["age_naoDiscretizada"] = saida["age"]
+    saida[COLUNAS_ESCALADAS] = scaler.transform(discretizadas[COLUNAS_ESCALADAS])
+
+    if manter_nome_pais:
+        saida.insert(saida.columns.get_loc("native-country") + 1, "native-country-name", nome_pais)
+    return saida
+
+
+def processar(data, manter_nome_pais=False):
+    """Processa um DataFrame bruto inteiro em memória."""
+    data = limpar(data.drop(columns=COLUNAS_DESCARTADAS).drop_duplicates())
+    scaler = MinMaxScaler().fit(discretizar(data)[COLUNAS_ESCALADAS])
+    return transformar(data, categorias(data), scaler, manter_nome_pais)
+
+
+def _ajustar_blocos(origem, chunksize):
+    """Primeira passada: categorias nominais e limites do MinMaxScaler.
+
+    Duplicatas não alteram nenhum dos dois, então não precisam ser removidas aqui.
+    """
+    cats = {coluna: set() for coluna in COLUNAS_NOMINAIS}
+    scaler = MinMaxScaler()
+    for bloco in pd.read_csv(origem, chunksize=chunksize):
+        bloco = limpar(bloco.drop(columns=COLUNAS_DESCARTADAS))
+        if bloco.empty:
+            continue
+        for coluna in COLUNAS_NOMINAIS:
+            cats[coluna].update(bloco[coluna].unique())
+        scaler.partial_fit(discretizar(bloco)[COLUNAS_ESCALADAS])
+    return {coluna: sorted(valores) for coluna, valores in cats.items()}, scaler
+
+
+def processar_blocos(origem, destino, chunksize, manter_nome_pais=False):
+    """Processa `origem` em blocos de `chunksize` linhas, gravando em `destino`.
+
+    As duplicatas são detectadas por hash de 64 bits de cada linha bruta, o
+    que custa 8 bytes por linha distinta. Retorna o número de linhas gravadas.
+    """
+    cats, scaler = _ajustar_blocos(origem, chunksize)
+
+    vistos = np.empty(0, dtype=np.uint64)
+    total = 0
+    cabecalho_gravado = False
+    for bloco in pd.read_csv(origem, chunksize=chunksize):
+        bloco = bloco.drop(columns=COLUNAS_DESCARTADAS)
+        hashes = pd.util.hash_pandas_object(bloco, index=False).to_numpy()
+        novas = ~(pd.Series(hashes).duplicated().to_numpy() | np.isin(hashes, vistos))
+        vistos = np.union1d(vistos, hashes[novas])
+
+        bloco = limpar(bloco[novas])
+        # Blocos só com duplicatas ou linhas incompletas não têm o que gravar
+        if bloco.empty:
+            continue
+        saida = transformar(bloco, cats, scaler, manter_nome_pais)
+        saida.to_csv(destino, mode="a" if cabecalho_gravado else "w", header=not cabecalho_gravado, **FORMATO_CSV)
+        cabecalho_gravado = True
+        total += len(saida)
+    return total
+
+
+def processar_arquivo(origem, destino, chunksize=None, manter_nome_pais=False):
+    """Lê o CSV bruto `origem` e grava o CSV processado em `destino`."""
+    if chunksize:
+        return processar_blocos(origem, destino, chunksize, manter_nome_pais)
+    saida = processar(pd.read_csv(origem), manter_nome_pais)
+    saida.to_csv(destino, **FORMATO_CSV)
+    return len(saida)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-processamento do dataset Adult (UCI id=2).")
+    parser.add_argument("origem", help="CSV bruto com as colunas de adult.data.original")
+    parser.add_argument("destino", help="CSV processado de saída")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="processa em blocos deste tamanho, com memória limitada")
+    parser.add_argument("--manter-nome-pais", action="store_true",
+                        help="inclui a coluna native-country-name usada pelo dashboard")
+    args = parser.parse_args(argv)
+
+    linhas = processar_arquivo(args.origem, args.destino, args.chunksize, args.manter_nome_pais)
+    print(f"{linhas} linhas gravadas em {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
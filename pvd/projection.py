@@ -0,0 +1,123 @@
+"""Projeções PCA calculadas uma única vez por versão do dataset.
+
+Os três primeiros componentes principais e a variância explicada são
+guardados em memória e em disco (.npz), com chave formada pela versão do
+dataset, pelo conjunto de colunas numéricas e pelo método usado. Os
+arquivos ficam em `.cache/pca/<versao>/`; só as pastas das versões usadas
+mais recentemente são mantidas.
+"""
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.preprocessing import StandardScaler
+
+from pvd.loader import CACHE_DIR_PADRAO
+
+METODOS = ("completo", "randomizado", "incremental")
+SUBPASTA = "pca"
+# Versões do dataset mantidas em disco (a atual e as anteriores mais recentes, por exemplo de outro CSV)
+MAX_VERSOES = 3
+
+
+@dataclass(frozen=True)
+class Projecao:
+    componentes: np.ndarray
+    variancia_explicada: np.ndarray
+    colunas: tuple
+
+
+def _ajustar(dados, n_componentes, metodo, tamanho_lote):
+    if metodo == "incremental":
+        # Padronização e PCA em lotes: nunca há uma cópia inteira padronizada em memória
+        scaler = StandardScaler()
+        for inicio in range(0, len(dados), tamanho_lote):
+            scaler.partial_fit(dados[inicio:inicio + tamanho_lote])
+        pca = IncrementalPCA(n_components=n_componentes)
+        for inicio in range(0, len(dados), tamanho_lote):
+            pca.partial_fit(scaler.transform(dados[inicio:inicio + tamanho_lote]))
+        componentes = np.vstack([
+            pca.transform(scaler.transform(dados[inicio:inicio + tamanho_lote]))
+            for inicio in range(0, len(dados), tamanho_lote)
+        ])
+        return componentes, pca.explained_variance_ratio_
+
+    if metodo == "randomizado":
+        pca = PCA(n_components=n_componentes, svd_solver="randomized", random_state=0)
+    else:
+        pca = PCA(n_components=n_componentes)
+    componentes = pca.fit_transform(StandardScaler().fit_transform(dados))
+    return componentes, pca.explained_variance_ratio_
+
+
+def _modificacao(pasta):
+    try:
+        return pasta.stat().st_mtime
+    except FileNotFoundError:
+        # Removida por outro processo enquanto a lista era montada
+        return 0.0
+
+
+class ProjectionStore:
+    """Cache de projeções PCA por (versão do dataset, colunas, método)."""
+
+    def __init__(self, cache_dir=CACHE_DIR_PADRAO, n_componentes=3, tamanho_lote=10000):
+        self.cache_dir = Path(cache_dir) / SUBPASTA
+        self.n_componentes = n_componentes
+        self.tamanho_lote = tamanho_lote
+        self._memoria = {}
+        self._lock = threading.Lock()
+
+    def _chave(self, versao, colunas, metodo):
+        texto = "|".join([versao, metodo, str(self.n_componentes), *colunas])
+        return hashlib.sha256(texto.encode()).hexdigest()[:16]
+
+    def get(self, df, versao, colunas, metodo="completo"):
+        """Retorna a `Projecao` de `df[colunas]`, calculando-a só na primeira vez."""
+        if metodo not in METODOS:
+            raise ValueError(f"Método de PCA desconhecido: {metodo!r} (use um de {METODOS})")
+        colunas = tuple(colunas)
+        chave = self._chave(versao, colunas, metodo)
+
+        with self._lock:
+            if chave in self._memoria:
+                return self._memoria[chave]
+
+        projecao = self._ler(versao, chave, colunas)
+        if projecao is None:
+            dados = df[list(colunas)].to_numpy(dtype=np.float64)
+            componentes, variancia = _ajustar(dados, self.n_componentes, metodo, self.tamanho_lote)
+            projecao = Projecao(componentes, variancia, colunas)
+            self._gravar(versao, chave, projecao)
+
+        with self._lock:
+            self._memoria[chave] = projecao
+        return projecao
+
+    def _ler(self, versao, chave, colunas):
+        try:
+            with np.load(self.cache_dir / versao / f"{chave}.npz") as salvo:
+                return Projecao(salvo["componentes"], salvo["variancia_explicada"], colunas)
+        except FileNotFoundError:
+            # Ainda não calculada, ou a pasta da versão foi removida por outro processo
+            return None
+
+    def _gravar(self, versao, chave, projecao):
+        pasta = self.cache_dir / versao
+        pasta.mkdir(parents=True, exist_ok=True)
+        # Nome temporário único por processo e thread: sessões que calculam a mesma chave não se atropelam
+        temporario = pasta / f"{chave}.tmp-{os.getpid()}-{threading.get_ident()}"
+        with open(temporario, "wb") as f:
+            np.savez(f, componentes=projecao.componentes, variancia_explicada=projecao.variancia_explicada)
+        os.replace(temporario, pasta / f"{chave}.npz")
+
+        # Remove as versões antigas, mantendo as MAX_VERSOES pastas gravadas mais recentemente
+        versoes = sorted((p for p in self.cache_dir.iterdir() if p.is_dir()), key=_modificacao)
+        for antiga in versoes[:-MAX_VERSOES]:
+            if antiga != pasta:
+                shutil.rmtree(antiga, ignore_errors=True)
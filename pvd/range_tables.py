@@ -0,0 +1,59 @@
+"""Tabelas de somas de prefixo para filtrar intervalos de uma dimensão ordenada.
+
+A partir do cubo de contagens, guarda para cada (classe de trabalho, renda,
+horas semanais) a contagem acumulada sobre os níveis ordenados de
+`education-num`. A contagem de qualquer intervalo [a, b] é a diferença de
+duas fatias do prefixo, com custo constante, sem somar os níveis do
+intervalo nem voltar às linhas.
+"""
+import numpy as np
+import pandas as pd
+
+DIMENSOES = ("workclass", "income", "hours-per-week")
+DIMENSAO_INTERVALO = "education-num"
+
+
+class RangeTable:
+    """Contagens acumuladas de `dim_intervalo` por combinação das dimensões em `dims`."""
+
+    def __init__(self, cube, dims=DIMENSOES, dim_intervalo=DIMENSAO_INTERVALO):
+        self.dims = list(dims)
+        self.dim_intervalo = dim_intervalo
+        self.niveis = {dim: cube.niveis[dim] for dim in self.dims + [dim_intervalo]}
+        self._posicoes_workclass = {valor: i for i, valor in enumerate(self.niveis["workclass"].tolist())}
+
+        marginal = cube.somar(self.dims + [dim_intervalo])
+        # Uma linha extra na classe de trabalho com a soma de todas ("qualquer área de trabalho")
+        marginal = np.concatenate([marginal, marginal.sum(axis=0, keepdims=True)], axis=0)
+        zeros = np.zeros(marginal.shape[:-1] + (1,), dtype=marginal.dtype)
+        self.prefixos = np.concatenate([zeros, np.cumsum(marginal, axis=-1)], axis=-1)
+
+    def contagens(self, minimo, maximo, workclass=None):
+        """Array (renda x horas) com as contagens de `dim_intervalo` em [minimo, maximo].
+
+        Sem `workclass`, conta todas as classes de trabalho.
+        """
+        niveis = self.niveis[self.dim_intervalo]
+        i = np.searchsorted(niveis, minimo, side="left")
+        j = np.searchsorted(niveis, maximo, side="right")
+        if workclass is None:
+            linha = -1
+        elif workclass in self._posicoes_workclass:
+            linha = self._posicoes_workclass[workclass]
+        else:
+            return np.zeros(self.prefixos.shape[1:-1], dtype=self.prefixos.dtype)
+        return self.prefixos[linha, ..., j] - self.prefixos[linha, ..., i]
+
+    def tabela(self, minimo, maximo, workclass=None):
+        """Contagens do intervalo como DataFrame (linhas: renda, colunas: horas)."""
+        return pd.DataFrame(
+            self.contagens(minimo, maximo, workclass),
+            index=pd.Index(self.niveis["income"], name="income"),
+            columns=pd.Index(self.niveis["hours-per-week"], name="hours-per-week"),
+        )
+
+    def percentuais(self, minimo, maximo, workclass=None):
+        """Percentual de cada faixa de horas dentro de cada renda (0 quando a renda não tem ninguém)."""
+        contagens = self.tabela(minimo, maximo, workclass)
+        totais = contagens.sum(axis=1)
+        return contagens.div(totais.where(totais > 0), axis=0).fillna(0) * 100
@@ -0,0 +1,155 @@
+"""Recursos compartilhados pelas páginas do dashboard.
+
+Tudo aqui usa `st.cache_resource`, então cada estrutura é montada uma vez
+por processo (e por versão do dataset) e compartilhada entre as sessões.
+Os módulos pesados (sklearn, mlxtend, matplotlib, plotly) só são
+importados quando o recurso que depende deles é pedido pela primeira vez.
+
+O CSV usado é o `data_processada_final.csv` da pasta atual, ou o indicado
+na variável de ambiente PVD_DADOS. As contagens das Hipóteses 2 a 5 vêm do
+backend escolhido em PVD_BACKEND (`pvd.backends`). No backend padrão
+(pandas) o DataFrame é o compartilhado de `pvd.shared`: mapeado em
+memória, somente leitura, uma cópia por máquina.
+"""
+import os
+
+import streamlit as st
+
+from pvd.instrumentation import cronometrado, span
+from pvd.loader import DATASET_PADRAO
+
+
+# Backend das consultas agregadas, escolhido ao iniciar pela variável PVD_BACKEND ("pandas" ou "duckdb")
+@st.cache_resource
+@cronometrado("abrir backend")
+def carregar_backend():
+    from pvd.backends import BACKEND_PADRAO, abrir_backend
+    return abrir_backend(os.environ.get("PVD_BACKEND", BACKEND_PADRAO), os.environ.get("PVD_DADOS", DATASET_PADRAO))
+
+# cache_resource mantém um único DataFrame no processo, compartilhado entre as sessões. No backend pandas os
+# dados ficam nos arquivos mapeados de .cache/compartilhado, compartilhados também entre processos; no duckdb
+# é uma amostra das linhas, para as páginas que precisam delas (Dataset e Hipótese 1)
+@st.cache_resource
+@cronometrado("carregar dataset")
+def carregar_dados():
+    backend = carregar_backend()
+    return backend.dataframe(), backend.versao
+
+# Cubo de contagens das Hipóteses 2, 3 e 4, montado uma vez por versão do dataset
+@st.cache_resource
+@cronometrado("montar cubo de contagens")
+def count_cube(versao):
+    from pvd.cube import DIMENSOES, CountCube
+    return CountCube.from_counts(carregar_backend().count_by(DIMENSOES), DIMENSOES)
+
+# Contagens de renda x educação por país e regiões codificadas, para os grupos da Hipótese 2
+@st.cache_resource
+@cronometrado("montar tabela por país")
+def country_table(versao):
+    from pvd.paises import CountryTable
+    return CountryTable(count_cube(versao))
+
+# Somas de prefixo sobre education-num para o intervalo da Hipótese 3
+@st.cache_resource
+@cronometrado("montar tabelas de prefixo")
+def range_table(versao):
+    from pvd.range_tables import RangeTable
+    return RangeTable(count_cube(versao))
+
+# Índice de bitmaps para compor os filtros da Hipótese 4 (só com as linhas na memória, no backend pandas)
+@st.cache_resource
+@cronometrado("montar índice de bitmaps")
+def bitmap_index(versao):
+    from pvd.bitmap import BitmapIndex
+    return BitmapIndex.from_frame(carregar_dados()[0])
+
+# Regras de associação memoizadas (e pré-calculadas com `python -m pvd.rules --precalcular`)
+@st.cache_resource
+@cronometrado("montar motor de regras")
+def rule_engine(versao):
+    from pvd.rules import RuleEngine
+    return RuleEngine(carregar_dados()[0], versao)
+
+# Matrizes de correlação completas; o heatmap só recorta as colunas escolhidas
+@st.cache_resource
+@cronometrado("montar matrizes de correlação")
+def correlation_service(versao):
+    from pvd.correlation import CorrelationService
+    return CorrelationService(carregar_dados()[0])
+
+# Informação mútua e correlação com o alvo, por subconjunto de classes de trabalho (página de relevância)
+@st.cache_resource
+@cronometrado("montar serviço de relevância")
+def relevance_service(versao):
+    from pvd.relevance import RelevanceService
+    return RelevanceService(carregar_dados()[0], versao)
+
+@st.cache_resource
+def projection_store():
+    from pvd.projection import ProjectionStore
+    return ProjectionStore()
+
+# Pessoas por par (idade, investimento), de onde saem as estruturas da Hipótese 5
+@st.cache_resource
+@cronometrado("contar idade x investimento")
+def contagens_idade_investimento(versao):
+    from pvd.density import COLUNA_IDADE, COLUNA_INVESTIMENTO
+    return carregar_backend().count_by([COLUNA_IDADE, COLUNA_INVESTIMENTO])
+
+# Histogramas por idade da Hipótese 5; as PDFs/CDFs saem deles por FFT
+@st.cache_resource
+@cronometrado("montar histogramas por idade")
+def density_engine(versao):
+    from pvd.density import DensityEngine
+    return DensityEngine.from_counts(contagens_idade_investimento(versao))
+
+# ECDF exata do investimento por idade: probabilidade da Hipótese 5 por searchsorted
+@st.cache_resource
+@cronometrado("montar índice da ECDF")
+def ecdf_index(versao):
+    from pvd.ecdf import ECDFIndex
+    return ECDFIndex.from_counts(contagens_idade_investimento(versao))
+
+# Intervalos bootstrap e testes de permutação das Hipóteses 2 e 4, memoizados pelas contagens
+@st.cache_resource
+def bootstrap():
+    from pvd.bootstrap import Bootstrap
+    return Bootstrap()
+
+# Árvore de decisão da renda treinada offline (`python -m pvd.model`), carregada uma vez por processo
+@st.cache_resource
+@cronometrado("carregar modelo de renda")
+def income_model(versao):
+    from pvd.model import carregar
+    return carregar(versao)
+
+# Navegação paginada da página "Dataset" (ordens por coluna e resumo calculados uma vez)
+@st.cache_resource
+def dataset_browser(versao):
+    from pvd.browser import DatasetBrowser
+    return DatasetBrowser(carregar_dados()[0])
+
+# Gráficos já renderizados (PNG ou JSON do Plotly), por página e estado dos widgets
+@st.cache_resource
+def render_cache():
+    from pvd.render_cache import RenderCache
+    return RenderCache()
+
+# Aquecimento em segundo plano das páginas, iniciado pela primeira execução do script no processo
+@st.cache_resource
+def aquecimento(versao):
+    from pvd.paginas import tarefas_aquecimento
+    from pvd.warmup import Aquecimento
+    return Aquecimento(tarefas_aquecimento(carregar_dados()[0], versao)).iniciar()
+
+def exibir_grafico(destino, pagina, widgets, gerar, **opcoes):
+    """Mostra o gráfico de `gerar()` em `destino`, reaproveitando a renderização se os widgets não mudaram."""
+    cache = render_cache()
+    with span(f"gráfico: {pagina}"):
+        tipo, conteudo = cache.obter(cache.chave(pagina, widgets, carregar_dados()[1]), gerar)
+    if tipo == "png":
+        destino.image(conteudo, use_container_width=True)
+    else:
+        import plotly.io as pio
+        destino.plotly_chart(pio.from_json(conteudo), **opcoes)
+    return conteudo
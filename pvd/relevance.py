@@ -0,0 +1,223 @@
+"""Relevância dos atributos: informação mútua e correlação com um atributo alvo.
+
+O notebook ordena os atributos pelo `mutual_info_classif` em relação à
+renda. Aqui o alvo pode ser qualquer atributo discreto e as linhas podem
+ser filtradas por um subconjunto das classes de trabalho. Há dois
+estimadores da informação mútua:
+
+- "contagens": todos os atributos do CSV processado são discretos (no
+  máximo algumas dezenas de valores), então a informação mútua é exata a
+  partir da tabela de contingência atributo x alvo, a mesma de
+  `mutual_info_classif(discrete_features=True)`. As tabelas são montadas
+  uma vez por alvo, separadas por classe de trabalho; a tabela de um
+  subconjunto de classes é a soma das tabelas das classes escolhidas, sem
+  voltar às linhas;
+- "vizinhos": o estimador por k-vizinhos usado no notebook
+  (`discrete_features='auto'`, que trata as colunas como contínuas). Cada
+  atributo é uma tarefa independente, distribuída em um pool de processos.
+
+As correlações de Pearson com o alvo saem da média e dos co-momentos de
+cada classe de trabalho, combinados para o subconjunto (atualização de
+Chan et al., como em `pvd.correlation`). Os rankings ficam em um cache
+LRU por (versão do dataset, alvo, subconjunto de classes, estimador).
+"""
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pvd.cube import coluna_workclass
+
+ALVO_PADRAO = "income"
+ESTIMADORES = ("contagens", "vizinhos")
+# Atributos com até este número de valores podem ser escolhidos como alvo
+MAX_NIVEIS_ALVO = 20
+SEMENTE = 0
+
+
+def _informacao_vizinhos(x, y, semente):
+    """Informação mútua de um atributo com o alvo pelo estimador de k-vizinhos (executado nos processos).
+
+    `x` chega no tipo original da coluna; a versão em float64 só existe aqui, durante a tarefa.
+    """
+    from sklearn.feature_selection import mutual_info_classif
+    x = x.astype(np.float64).reshape(-1, 1)
+    return float(mutual_info_classif(x, y, discrete_features=False, random_state=semente)[0])
+
+
+def _informacao_contagens(tabela):
+    """Informação mútua (em nats) de uma tabela de contingência."""
+    n = tabela.sum()
+    if n == 0:
+        return 0.0
+    linhas = tabela.sum(axis=1, keepdims=True)
+    colunas = tabela.sum(axis=0, keepdims=True)
+    presentes = tabela > 0
+    conjunta = tabela[presentes]
+    esperada = (linhas * colunas)[presentes]
+    return max(float(np.sum(conjunta / n * np.log(conjunta * n / esperada))), 0.0)
+
+
+def _momentos(dados):
+    if len(dados) == 0:
+        return 0, None, None
+    media = dados.mean(axis=0)
+    centrado = dados - media
+    return len(dados), media, centrado.T @ centrado
+
+
+def _combinar(a, b):
+    n_a, media_a, comomentos_a = a
+    n_b, media_b, comomentos_b = b
+    if n_a == 0:
+        return b
+    if n_b == 0:
+        return a
+    n = n_a + n_b
+    delta = media_b - media_a
+    return n, media_a + delta * n_b / n, comomentos_a + comomentos_b + np.outer(delta, delta) * n_a * n_b / n
+
+
+class RelevanceService:
+    """Rankings de relevância dos atributos por alvo e subconjunto de classes de trabalho."""
+
+    def __init__(self, df, versao, max_processos=None, max_entradas=256):
+        self.versao = versao
+        self.colunas = list(df.select_dtypes(include=["number"]).columns)
+        self.max_processos = max_processos or os.cpu_count() or 1
+        self.max_entradas = max_entradas
+
+        workclass = coluna_workclass(df)
+        self.grupos = list(workclass.categories)
+        codigos_grupo = np.asarray(workclass.codes, dtype=np.intp)
+        # Linhas ordenadas por classe de trabalho: as de cada classe formam uma fatia contígua
+        self._ordem = np.argsort(codigos_grupo, kind="stable")
+        self._grupo = codigos_grupo[self._ordem]
+        self._inicios = np.searchsorted(self._grupo, np.arange(len(self.grupos) + 1))
+        # Sem cópia das colunas: o estimador por k-vizinhos lê os valores do DataFrame (o compartilhado)
+        self._df = df
+
+        # Cada atributo codificado pela posição do valor entre os seus valores distintos, no menor inteiro que cabe
+        niveis_colunas = [np.unique(df[coluna].to_numpy(), return_inverse=True) for coluna in self.colunas]
+        self._niveis = [len(valores) for valores, _ in niveis_colunas]
+        tipo = np.min_scalar_type(max(self._niveis, default=1) - 1)
+        self._codigos = np.empty((len(df), len(self.colunas)), dtype=tipo)
+        for j, (_, codigos) in enumerate(niveis_colunas):
+            self._codigos[:, j] = codigos.ravel()[self._ordem]
+        self.alvos = [c for c, niveis in zip(self.colunas, self._niveis) if 1 < niveis <= MAX_NIVEIS_ALVO]
+
+        # Momentos de cada classe de trabalho, convertendo para float64 uma classe de cada vez
+        self._momentos = [_momentos(df[self.colunas].iloc[self._ordem[inicio:fim]].to_numpy(dtype=np.float64))
+                          for inicio, fim in zip(self._inicios[:-1], self._inicios[1:])]
+        self._tabelas = {}
+        self._resultados = OrderedDict()
+        self._executor = None
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    def subconjunto(self, grupos=None):
+        """Posições das classes de trabalho escolhidas (todas, sem `grupos`), na ordem de `self.grupos`."""
+        if grupos is None:
+            return tuple(range(len(self.grupos)))
+        escolhidos = set(grupos)
+        return tuple(i for i, nome in enumerate(self.grupos) if nome in escolhidos)
+
+    def n_linhas(self, grupos=None):
+        return int(sum(self._inicios[g + 1] - self._inicios[g] for g in self.subconjunto(grupos)))
+
+    def _tabelas_alvo(self, alvo):
+        """Tabelas de contingência (classe de trabalho x atributo x alvo) de cada atributo, uma vez por alvo."""
+        with self._lock:
+            if alvo in self._tabelas:
+                return self._tabelas[alvo]
+        t = self.colunas.index(alvo)
+        niveis_alvo = self._niveis[t]
+        tabelas = []
+        for j, niveis in enumerate(self._niveis):
+            celulas = (self._grupo * niveis + self._codigos[:, j]) * niveis_alvo + self._codigos[:, t].astype(np.intp)
+            contagens = np.bincount(celulas, minlength=len(self.grupos) * niveis * niveis_alvo)
+            tabelas.append(contagens.reshape(len(self.grupos), niveis, niveis_alvo))
+        with self._lock:
+            self._tabelas[alvo] = tabelas
+        return tabelas
+
+    def _correlacoes(self, t, subconjunto):
+        momentos = (0, None, None)
+        for g in subconjunto:
+            momentos = _combinar(momentos, self._momentos[g])
+        n, _, comomentos = momentos
+        if n == 0:
+            return np.full(len(self.colunas), np.nan)
+        desvios = np.sqrt(np.diag(comomentos))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlacoes = comomentos[t] / (desvios * desvios[t])
+        # Atributos constantes no subconjunto ficam com NaN, como no DataFrame.corr()
+        correlacoes[(desvios == 0) | (desvios[t] == 0)] = np.nan
+        return np.clip(correlacoes, -1.0, 1.0)
+
+    def _mapear(self, colunas, y):
+        """Informação mútua por k-vizinhos de cada array de `colunas`, uma tarefa por atributo."""
+        if self.max_processos == 1:
+            return [_informacao_vizinhos(x, y, SEMENTE) for x in colunas]
+        with self._lock:
+            if self._executor is None:
+                # "spawn": o processo do dashboard tem várias threads, que o fork copiaria num estado qualquer
+                self._executor = ProcessPoolExecutor(max_workers=self.max_processos,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+        tarefas = [self._executor.submit(_informacao_vizinhos, x, y, SEMENTE) for x in colunas]
+        return [tarefa.result() for tarefa in tarefas]
+
+    def _informacao(self, t, subconjunto, estimador):
+        atributos = [j for j in range(len(self.colunas)) if j != t]
+        if estimador == "contagens":
+            tabelas = self._tabelas_alvo(self.colunas[t])
+            grupos = list(subconjunto)
+            return atributos, [_informacao_contagens(tabelas[j][grupos].sum(axis=0)) for j in atributos]
+
+        linhas = np.concatenate([np.arange(self._inicios[g], self._inicios[g + 1]) for g in subconjunto])
+        if len(linhas) == 0:
+            return atributos, [0.0] * len(atributos)
+        originais = self._ordem[linhas]
+        colunas = [self._df[self.colunas[j]].to_numpy()[originais] for j in atributos]
+        return atributos, self._mapear(colunas, self._codigos[linhas, t].astype(np.intp))
+
+    def ranking(self, alvo=ALVO_PADRAO, grupos=None, estimador=ESTIMADORES[0]):
+        """DataFrame com a informação mútua e a correlação de cada atributo com `alvo`, da mais à menos relevante.
+
+        `grupos` são as classes de trabalho consideradas (todas, se None).
+        """
+        if estimador not in ESTIMADORES:
+            raise ValueError(f"Estimador desconhecido: {estimador!r} (use um de {ESTIMADORES})")
+        if alvo not in self.alvos:
+            raise ValueError(f"Alvo inválido: {alvo!r} (precisa ser um atributo com até {MAX_NIVEIS_ALVO} valores)")
+        subconjunto = self.subconjunto(grupos)
+        chave = (self.versao, alvo, subconjunto, estimador)
+        with self._lock:
+            if chave in self._resultados:
+                self._resultados.move_to_end(chave)
+                self.acertos += 1
+                return self._resultados[chave]
+            self.faltas += 1
+
+        t = self.colunas.index(alvo)
+        atributos, informacao = self._informacao(t, subconjunto, estimador)
+        correlacoes = self._correlacoes(t, subconjunto)[atributos]
+        resultado = pd.DataFrame(
+            {"Informação mútua": informacao, "Correlação": correlacoes},
+            index=pd.Index([self.colunas[j] for j in atributos], name="Atributo"),
+        ).sort_values("Informação mútua", ascending=False, kind="stable")
+
+        with self._lock:
+            self._resultados[chave] = resultado
+            while len(self._resultados) > self.max_entradas:
+                self._resultados.popitem(last=False)
+        return resultado
+
+    def estatisticas(self):
+        with self._lock:
+            return {"entradas": len(self._resultados), "acertos": self.acertos, "faltas": self.faltas}
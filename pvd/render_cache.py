@@ -0,0 +1,115 @@
+"""Cache LRU dos gráficos já renderizados, por página e estado dos widgets.
+
+Figuras do matplotlib viram PNG (com as mesmas opções do `st.pyplot`) e
+são fechadas logo em seguida, mesmo se a renderização ou a função que monta
+o gráfico falharem; figuras do Plotly são guardadas como JSON. A chave é
+(página, valores normalizados dos widgets, versão do dataset), então
+voltar a uma combinação de filtros já vista não refaz o gráfico. O cache é
+limitado em número de entradas e em bytes, descartando as menos usadas
+recentemente.
+"""
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from pvd.instrumentation import span
+
+OPCOES_PNG = {"bbox_inches": "tight", "dpi": 200, "format": "png"}
+
+
+def normalizar(valor):
+    """Converte os valores dos widgets em algo hashable e estável entre execuções."""
+    if isinstance(valor, dict):
+        return tuple(sorted((str(k), normalizar(v)) for k, v in valor.items()))
+    if isinstance(valor, (set, frozenset)):
+        return tuple(sorted((normalizar(v) for v in valor), key=repr))
+    if isinstance(valor, (list, tuple)):
+        return tuple(normalizar(v) for v in valor)
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+
+def renderizar(fig):
+    """("png", bytes) para figuras do matplotlib, ("plotly", json) para as do Plotly."""
+    if hasattr(fig, "to_plotly_json"):
+        with span("serializar figura"):
+            return "plotly", fig.to_json()
+
+    import matplotlib.pyplot as plt
+
+    try:
+        with span("serializar figura"):
+            buffer = io.BytesIO()
+            fig.savefig(buffer, **OPCOES_PNG)
+            return "png", buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+class RenderCache:
+    """LRU de gráficos renderizados, com contadores de acertos e faltas."""
+
+    def __init__(self, max_entradas=128, max_bytes=64 * 2**20):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def chave(pagina, widgets, versao):
+        return (pagina, normalizar(widgets), versao)
+
+    def obter(self, chave, gerar):
+        """Gráfico renderizado de `chave`; `gerar()` só é chamada se ele não estiver no cache."""
+        with self._lock:
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return self._entradas[chave]
+            self.faltas += 1
+
+        import matplotlib.pyplot as plt
+
+        # Figuras abertas por `gerar()` que falhou antes de devolver a sua (renderizar só fecha a devolvida).
+        # Fechar uma figura de outra thread não a estraga: ela sai do pyplot, mas o savefig continua funcionando
+        abertas = set(plt.get_fignums())
+        try:
+            renderizado = renderizar(gerar())
+        finally:
+            for numero in set(plt.get_fignums()) - abertas:
+                plt.close(numero)
+        tamanho = len(renderizado[1])
+        if tamanho > self.max_bytes:
+            return renderizado
+
+        with self._lock:
+            if chave not in self._entradas:
+                self._entradas[chave] = renderizado
+                self._bytes += tamanho
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                _, removido = self._entradas.popitem(last=False)
+                self._bytes -= len(removido[1])
+                self.descartes += 1
+        return renderizado
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estatisticas(self):
+        with self._lock:
+            return {
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+                "descartes": self.descartes,
+            }
@@ -0,0 +1,236 @@
+"""Exportação em lote dos gráficos e descrições das páginas para uma grade de parâmetros.
+
+    python -m pvd.report --saida relatorio --processos 4
+
+A grade cobre todas as combinações de classe de trabalho e carga horária
+da Hipótese 4, os agrupamentos de países (todos os imigrantes e cada
+região) da Hipótese 2 e faixas etárias de 5 em 5 anos da Hipótese 5. As
+células são distribuídas em um pool de processos; cada processo anexa o
+dataset compartilhado (`pvd.shared`, sem copiar os dados) e monta cada
+estrutura agregada (cubo, tabela por país, bitmaps, densidades, ECDF) uma única vez,
+reaproveitando-a em todas as células que receber. Gráficos e descrições
+vêm das mesmas funções usadas pelas páginas.
+
+Na pasta de saída ficam um PNG (matplotlib) ou HTML (Plotly) por gráfico,
+`index.html` com todos os gráficos e descrições e `descricoes.md` só com
+os textos.
+"""
+import argparse
+import html
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from pvd.loader import CACHE_DIR_PADRAO, DATASET_PADRAO
+from pvd.paises import REGIOES
+
+LIMITE_INVESTIMENTO_PADRAO = 15000
+PASSO_IDADE = 5
+
+# Preenchido em cada processo do pool por _iniciar_processo
+_df = None
+_agregados = {}
+
+
+def _montar(nome):
+    """Estrutura agregada `nome` do processo atual, montada na primeira célula que precisar dela."""
+    if nome not in _agregados:
+        if nome == "cubo":
+            from pvd.cube import CountCube
+            _agregados[nome] = CountCube.from_frame(_df)
+        elif nome == "paises":
+            from pvd.paises import CountryTable
+            _agregados[nome] = CountryTable(_montar("cubo"))
+        elif nome == "bitmaps":
+            from pvd.bitmap import BitmapIndex
+            _agregados[nome] = BitmapIndex.from_frame(_df)
+        elif nome == "densidades":
+            from pvd.density import DensityEngine
+            _agregados[nome] = DensityEngine.from_frame(_df)
+        elif nome == "ecdf":
+            from pvd.ecdf import ECDFIndex
+            _agregados[nome] = ECDFIndex.from_frame(_df)
+        elif nome == "bootstrap":
+            from pvd.bootstrap import Bootstrap
+            # Os processos do pool já dividem os núcleos entre si
+            _agregados[nome] = Bootstrap(max_threads=1)
+    return _agregados[nome]
+
+
+def _iniciar_processo(caminho, cache_dir):
+    global _df
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from pvd.shared import load_shared_dataset
+    _df, _ = load_shared_dataset(caminho, cache_dir)
+
+
+def grade(idade_min, idade_max, limite=LIMITE_INVESTIMENTO_PADRAO):
+    """Lista de células (página, parâmetros)."""
+    from pvd.paginas import hipotese4
+
+    celulas = []
+    for workclass in hipotese4.WORKCLASSES:
+        for horas in hipotese4.HORAS:
+            celulas.append(("Hipotese 4", {"workclass": workclass, "horas": horas}))
+    for regiao in REGIOES:
+        celulas.append(("Hipotese 2", {"regiao": regiao}))
+    for inicio in range(idade_min, idade_max, PASSO_IDADE):
+        celulas.append(("Hipotese 5", {"idades": (inicio, min(inicio + PASSO_IDADE, idade_max)), "limite": limite}))
+    return celulas
+
+
+def _celula_hipotese4(parametros):
+    from pvd.paginas import hipotese4
+
+    workclass, horas = parametros["workclass"], parametros["horas"]
+    contagens = hipotese4.contagens_generos(_montar("bitmaps"), workclass, horas)
+    total_women, total_men, pct_women, pct_men, comparacao = hipotese4.comparar_generos(_montar("bootstrap"),
+                                                                                        contagens)
+    return ([hipotese4.grafico_genero(pct_women, pct_men)],
+            hipotese4.descricao_genero(workclass, horas, total_women, total_men, pct_women, pct_men, comparacao))
+
+
+def _celula_hipotese2(parametros):
+    from pvd.paginas import hipotese2
+
+    group_a, group_b = ["United-States"], REGIOES[parametros["regiao"]]
+    contagens_a, contagens_b = hipotese2.contagens_grupos(_montar("paises"), group_a, group_b, "Qualquer área de trabalho")
+    population_a, population_b = int(contagens_a.sum()), int(contagens_b.sum())
+    df_income_groups = hipotese2.grupos_renda(contagens_a, contagens_b)
+    df_education_groups = hipotese2.grupos_educacao(contagens_a, contagens_b)
+    comparacao = hipotese2.significancia_renda(_montar("bootstrap"), contagens_a, contagens_b)
+    figuras = [hipotese2.grafico_renda(df_income_groups), hipotese2.grafico_educacao(df_education_groups)]
+    descricao = (hipotese2.descricao_renda(group_a, group_b, population_a, population_b, df_income_groups, comparacao)
+                 + hipotese2.descricao_educacao(group_a, group_b, population_a, population_b, df_education_groups))
+    return figuras, descricao
+
+
+def _celula_hipotese5(parametros):
+    from pvd.paginas import hipotese5
+
+    (idade_min, idade_max), limite = parametros["idades"], parametros["limite"]
+    probabilidade = _montar("ecdf").probabilidade_acima(limite, idade_min, idade_max) * 100
+    figura = hipotese5.grafico_investimento(_montar("densidades"), idade_min, idade_max, limite, False, probabilidade)
+    return [figura], hipotese5.descricao_investimento(idade_min, idade_max, limite, False, probabilidade)
+
+
+CELULAS = {
+    "Hipotese 2": _celula_hipotese2,
+    "Hipotese 4": _celula_hipotese4,
+    "Hipotese 5": _celula_hipotese5,
+}
+
+
+def _nome_arquivo(indice, pagina, parametros):
+    texto = "-".join(str(v) for v in parametros.values())
+    return f"{indice:03d}-" + re.sub(r"[^\w.]+", "_", f"{pagina}-{texto}").strip("_")
+
+
+def gerar_celula(indice, pagina, parametros, saida):
+    """Gera os gráficos e a descrição de uma célula; retorna um dict com o resultado (ou o erro)."""
+    import plotly.io as pio
+
+    from pvd.render_cache import renderizar
+
+    inicio = time.perf_counter()
+    resultado = {"indice": indice, "pagina": pagina, "parametros": parametros, "arquivos": [], "descricao": "",
+                 "erro": None}
+    try:
+        figuras, resultado["descricao"] = CELULAS[pagina](parametros)
+        for i, figura in enumerate(figuras):
+            tipo, conteudo = renderizar(figura)
+            nome = f"{_nome_arquivo(indice, pagina, parametros)}-{i}"
+            if tipo == "png":
+                nome += ".png"
+                Path(saida, nome).write_bytes(conteudo)
+            else:
+                nome += ".html"
+                pio.write_html(pio.from_json(conteudo), Path(saida, nome), include_plotlyjs="cdn")
+            resultado["arquivos"].append(nome)
+    except Exception as erro:
+        # Combinações sem pessoas suficientes, por exemplo; a célula fica registrada com o erro
+        resultado["erro"] = f"{type(erro).__name__}: {erro}"
+    resultado["tempo_s"] = time.perf_counter() - inicio
+    return resultado
+
+
+def _markdown_para_html(texto):
+    """Conversão mínima das descrições (negrito, \\$ e quebras de linha)."""
+    texto = html.escape(texto.replace("\\$", "$"))
+    texto = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", texto)
+    return "<br>\n".join(linha.strip() for linha in texto.strip().splitlines())
+
+
+def escrever_indice(resultados, saida):
+    partes = ["<!DOCTYPE html>", "<html><head><meta charset='utf-8'><title>Relatório PVD</title></head><body>"]
+    markdown = []
+    pagina_atual = None
+    for r in resultados:
+        if r["pagina"] != pagina_atual:
+            pagina_atual = r["pagina"]
+            partes.append(f"<h1>{html.escape(pagina_atual)}</h1>")
+            markdown.append(f"# {pagina_atual}\n")
+        titulo = ", ".join(f"{k}: {v}" for k, v in r["parametros"].items())
+        partes.append(f"<h2>{html.escape(titulo)}</h2>")
+        markdown.append(f"## {titulo}\n")
+        if r["erro"]:
+            partes.append(f"<p><i>Erro: {html.escape(r['erro'])}</i></p>")
+            markdown.append(f"_Erro: {r['erro']}_\n")
+            continue
+        for arquivo in r["arquivos"]:
+            if arquivo.endswith(".png"):
+                partes.append(f"<img src='{arquivo}' style='max-width: 900px'>")
+            else:
+                partes.append(f"<iframe src='{arquivo}' width='900' height='500' frameborder='0'></iframe>")
+        partes.append(f"<p>{_markdown_para_html(r['descricao'])}</p>")
+        markdown.append(r["descricao"].strip() + "\n")
+    partes.append("</body></html>")
+    Path(saida, "index.html").write_text("\n".join(partes), encoding="utf-8")
+    Path(saida, "descricoes.md").write_text("\n".join(markdown), encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta gráficos e descrições para uma grade de parâmetros.")
+    parser.add_argument("--dataset", default=DATASET_PADRAO, help="CSV processado (padrão: data_processada_final.csv)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR_PADRAO)
+    parser.add_argument("--saida", default="relatorio")
+    parser.add_argument("--processos", type=int, default=os.cpu_count())
+    parser.add_argument("--limite", type=int, default=LIMITE_INVESTIMENTO_PADRAO,
+                        help="valor de investimento das probabilidades da Hipótese 5")
+    args = parser.parse_args(argv)
+
+    from pvd.density import COLUNA_IDADE
+    from pvd.shared import load_shared_dataset
+
+    inicio = time.perf_counter()
+    # Publica o dataset compartilhado antes de criar o pool, para os processos só o anexarem
+    df, _ = load_shared_dataset(args.dataset, args.cache_dir)
+    celulas = grade(int(df[COLUNA_IDADE].min()), int(df[COLUNA_IDADE].max()), args.limite)
+    Path(args.saida).mkdir(parents=True, exist_ok=True)
+
+    resultados = []
+    with ProcessPoolExecutor(max_workers=args.processos, initializer=_iniciar_processo,
+                             initargs=(args.dataset, args.cache_dir)) as pool:
+        futuros = [pool.submit(gerar_celula, i, pagina, parametros, args.saida)
+                   for i, (pagina, parametros) in enumerate(celulas)]
+        for futuro in as_completed(futuros):
+            resultados.append(futuro.result())
+    resultados.sort(key=lambda r: r["indice"])
+    escrever_indice(resultados, args.saida)
+    tempo = time.perf_counter() - inicio
+
+    for pagina in CELULAS:
+        da_pagina = [r for r in resultados if r["pagina"] == pagina]
+        erros = sum(r["erro"] is not None for r in da_pagina)
+        media = sum(r["tempo_s"] for r in da_pagina) / len(da_pagina) if da_pagina else 0
+        print(f"{pagina}: {len(da_pagina)} células ({erros} com erro), {media * 1000:.0f} ms por célula")
+    print(f"{len(resultados)} células em {tempo:.1f} s com {args.processos} processos: "
+          f"{len(resultados) / tempo:.1f} células/s. Relatório em {Path(args.saida) / 'index.html'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Regras de associação memoizadas para a Tabela Dinâmica da Hipótese 1.
+
+A codificação one-hot de cada coluna é feita uma única vez e guardada como
+DataFrame esparso de booleanos; os pares de atributos só concatenam as
+colunas já codificadas. As regras ficam memoizadas por (par de atributos,
+suporte mínimo, confiança mínima) e podem ser pré-calculadas
+para todos os pares e gravadas em disco:
+
+    python -m pvd.rules --precalcular
+"""
+import argparse
+import itertools
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import pandas as pd
+from mlxtend.frequent_patterns import apriori, association_rules, fpgrowth
+
+from pvd.loader import load_dataset
+
+ALGORITMOS = {"apriori": apriori, "fpgrowth": fpgrowth}
+MIN_SUPPORT_PADRAO = 0.1
+MIN_CONFIDENCE_PADRAO = 0.6
+COLUNAS_TABELA = ["antecedents", "consequents", "support", "confidence", "lift"]
+
+
+def codificar_coluna(serie):
+    """Colunas booleanas esparsas de um atributo.
+
+    Atributos binários (0/1) viram uma única coluna com o próprio nome, como
+    no `pd.get_dummies` do dashboard; os demais viram uma coluna por valor.
+    """
+    if serie.dtype.kind in "uifb" and serie.isin([0, 1]).all():
+        return pd.DataFrame({serie.name: pd.arrays.SparseArray(serie.to_numpy() == 1, fill_value=False)})
+    return pd.get_dummies(serie.astype("category"), prefix=serie.name, sparse=True, dtype=bool)
+
+
+def tabela_markdown(regras):
+    """Tabela markdown com as colunas exibidas no dashboard."""
+    linhas = [
+        "| antecedents | consequents | support  | confidence | lift   |",
+        "|------------|------------|----------|------------|----------|",
+    ]
+    for _, regra in regras.iterrows():
+        antecedentes = ", ".join(sorted(regra["antecedents"]))
+        consequentes = ", ".join(sorted(regra["consequents"]))
+        linhas.append(f"| ({antecedentes}) | ({consequentes}) | {regra['support']:.6f} | "
+                      f"{regra['confidence']:.6f} | {regra['lift']:.6f} |")
+    return "\n".join(linhas)
+
+
+class RuleEngine:
+    """Codificação, cálculo e memoização das regras de associação."""
+
+    def __init__(self, df, versao, cache_dir=".cache/regras"):
+        self.df = df
+        self.versao = versao
+        self.arquivo = Path(cache_dir) / f"{versao}.pkl"
+        self._codificadas = {}
+        self._regras = {}
+        self._lock = threading.Lock()
+        if self.arquivo.exists():
+            with open(self.arquivo, "rb") as f:
+                self._regras = pickle.load(f)
+
+    def transacoes(self, colunas):
+        """Matriz de transações (booleana e esparsa) das colunas escolhidas."""
+        partes = []
+        for coluna in colunas:
+            if coluna not in self._codificadas:
+                self._codificadas[coluna] = codificar_coluna(self.df[coluna])
+            partes.append(self._codificadas[coluna])
+        return pd.concat(partes, axis=1)
+
+    @staticmethod
+    def _chave(colunas, min_support, min_confidence):
+        # Apriori e FP-Growth encontram os mesmos itemsets, então o algoritmo não entra na chave
+        return (tuple(sorted(colunas)), float(min_support), float(min_confidence))
+
+    def regras(self, colunas, min_support=MIN_SUPPORT_PADRAO, min_confidence=MIN_CONFIDENCE_PADRAO,
+               algoritmo="apriori"):
+        """Regras de associação entre `colunas`, calculadas só na primeira consulta."""
+        chave = self._chave(colunas, min_support, min_confidence)
+        with self._lock:
+            if chave in self._regras:
+                return self._regras[chave]
+
+        itemsets = ALGORITMOS[algoritmo](self.transacoes(chave[0]), min_support=min_support, use_colnames=True)
+        if itemsets.empty:
+            regras = pd.DataFrame(columns=COLUNAS_TABELA)
+        else:
+            regras = association_rules(itemsets, metric="confidence", min_threshold=min_confidence)
+
+        with self._lock:
+            self._regras[chave] = regras
+        return regras
+
+    def regra(self, antecedente, consequente, **parametros):
+        """Regras com exatamente `antecedente` => `consequente`."""
+        regras = self.regras([antecedente, consequente], **parametros)
+        seleciona = [
+            a == frozenset([antecedente]) and c == frozenset([consequente])
+            for a, c in zip(regras["antecedents"], regras["consequents"])
+        ]
+        return regras[seleciona]
+
+    def precalcular(self, colunas=None, **parametros):
+        """Calcula as regras de todos os pares de `colunas` e grava o resultado em disco."""
+        colunas = list(self.df.columns) if colunas is None else list(colunas)
+        pares = list(itertools.combinations(colunas, 2))
+        for par in pares:
+            self.regras(par, **parametros)
+        self.salvar()
+        return len(pares)
+
+    def salvar(self):
+        self.arquivo.parent.mkdir(parents=True, exist_ok=True)
+        temporario = self.arquivo.with_suffix(".tmp")
+        with self._lock, open(temporario, "wb") as f:
+            pickle.dump(self._regras, f)
+        os.replace(temporario, self.arquivo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-cálculo das regras de associação entre pares de atributos.")
+    parser.add_argument("--precalcular", action="store_true", help="calcula as regras de todos os pares de colunas")
+    parser.add_argument("--dataset", default=None, help="CSV processado (padrão: data_processada_final.csv)")
+    parser.add_argument("--min-support", type=float, default=MIN_SUPPORT_PADRAO)
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE_PADRAO)
+    parser.add_argument("--algoritmo", choices=sorted(ALGORITMOS), default="fpgrowth")
+    args = parser.parse_args(argv)
+
+    df, versao = load_dataset(*([args.dataset] if args.dataset else []))
+    engine = RuleEngine(df, versao)
+    if args.precalcular:
+        n = engine.precalcular(min_support=args.min_support, min_confidence=args.min_confidence,
+                               algoritmo=args.algoritmo)
+        print(f"Regras de {n} pares gravadas em {engine.arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Dataset processado compartilhado, somente leitura, entre sessões e processos.
+
+Na primeira carga de uma versão do dataset, cada coluna é gravada como um
+arquivo `.npy` em `.cache/compartilhado/<nome do CSV>/<versao>/` (colunas
+categóricas como códigos, com as categorias no `meta.json`). Cada CSV tem
+a sua pasta, e só as versões antigas do mesmo CSV são removidas. Os
+processos seguintes não leem o CSV nem o Parquet: mapeiam esses arquivos em memória
+(`np.load(mmap_mode="r")`) e montam o DataFrame sobre eles sem copiar,
+então as páginas do arquivo ficam no cache do sistema operacional uma
+única vez por máquina, qualquer que seja o número de processos e sessões.
+
+Como o mesmo DataFrame é visto por todas as sessões, ele é somente
+leitura: criar, trocar ou remover colunas levanta TypeError, e escrever
+nos valores (`.loc`, `.iloc`) falha no próprio NumPy. Para alterar, derive
+um novo DataFrame (`df.assign(...)`, `df.copy()`).
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pvd.loader import CACHE_DIR_PADRAO, DATASET_PADRAO, dataset_version, load_dataset
+
+SUBPASTA = "compartilhado"
+
+
+class DataFrameSomenteLeitura(pd.DataFrame):
+    """DataFrame que recusa alterações no próprio objeto.
+
+    Operações que produzem outro DataFrame (filtros, seleção de colunas,
+    `assign`, `copy`) devolvem um `pd.DataFrame` comum.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def _recusar(self, *args, **kwargs):
+        raise TypeError("O dataset compartilhado é somente leitura; use df.assign(...) ou df.copy() para alterá-lo")
+
+    __setitem__ = __delitem__ = insert = pop = _recusar
+    # Caminho comum de todas as operações com inplace=True (drop, rename, fillna...)
+    _update_inplace = _recusar
+
+    def __setattr__(self, nome, valor):
+        # `df.coluna = valor` também altera o dataset; durante a construção ainda não há colunas (_mgr)
+        if nome in ("columns", "index") or ("_mgr" in self.__dict__ and nome in self.columns):
+            self._recusar()
+        super().__setattr__(nome, valor)
+
+
+def _pasta(versao, origem, cache_dir):
+    # Uma pasta por arquivo de origem (o nome do CSV, como no cache de `pvd.loader`), com as versões dentro
+    return Path(cache_dir) / SUBPASTA / origem / versao
+
+
+def publicar(df, versao, origem, cache_dir=CACHE_DIR_PADRAO):
+    """Grava as colunas de `df` para serem mapeadas; não faz nada se a versão já estiver publicada.
+
+    `origem` identifica o dataset (o nome do CSV, sem extensão): só as versões antigas dele são removidas.
+    """
+    destino = _pasta(versao, origem, cache_dir)
+    if (destino / "meta.json").exists():
+        return destino
+
+    # Monta em uma pasta temporária e renomeia, para outro processo nunca ver a versão pela metade
+    temporario = destino.with_name(f"{versao}.tmp-{os.getpid()}")
+    temporario.mkdir(parents=True, exist_ok=True)
+    colunas = []
+    for i, nome in enumerate(df.columns):
+        serie = df[nome]
+        arquivo = f"{i}.npy"
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            np.save(temporario / arquivo, serie.cat.codes.to_numpy())
+            colunas.append({"nome": nome, "arquivo": arquivo, "categorias": serie.cat.categories.tolist(),
+                            "ordenada": bool(serie.cat.ordered)})
+        else:
+            np.save(temporario / arquivo, serie.to_numpy())
+            colunas.append({"nome": nome, "arquivo": arquivo, "categorias": None})
+    (temporario / "meta.json").write_text(json.dumps({"linhas": len(df), "colunas": colunas}, ensure_ascii=False))
+
+    try:
+        os.rename(temporario, destino)
+    except OSError:
+        # Outro processo publicou a mesma versão antes
+        shutil.rmtree(temporario, ignore_errors=True)
+
+    # Versões antigas podem ser removidas mesmo se ainda mapeadas: o arquivo só some depois do último munmap
+    for antiga in destino.parent.iterdir():
+        if antiga.name != versao and "." not in antiga.name:
+            shutil.rmtree(antiga, ignore_errors=True)
+    return destino
+
+
+def anexar(versao, origem, cache_dir=CACHE_DIR_PADRAO):
+    """DataFrame somente leitura sobre os arquivos mapeados da versão (sem copiar os dados)."""
+    pasta = _pasta(versao, origem, cache_dir)
+    meta = json.loads((pasta / "meta.json").read_text())
+    colunas = {}
+    for coluna in meta["colunas"]:
+        # view como ndarray comum: continua sobre o mapeamento, mas sem a subclasse np.memmap
+        valores = np.load(pasta / coluna["arquivo"], mmap_mode="r").view(np.ndarray)
+        if coluna["categorias"] is not None:
+            valores = pd.Categorical.from_codes(valores, categories=coluna["categorias"], ordered=coluna["ordenada"])
+        colunas[coluna["nome"]] = valores
+    return DataFrameSomenteLeitura(colunas, copy=False)
+
+
+def load_shared_dataset(caminho=DATASET_PADRAO, cache_dir=CACHE_DIR_PADRAO):
+    """Como `load_dataset`, mas devolve o DataFrame compartilhado e somente leitura.
+
+    Só o primeiro processo a ver uma versão lê o cache colunar (ou o CSV) e
+    publica as colunas; os demais apenas as mapeiam.
+    """
+    origem = Path(caminho).stem
+    versao = dataset_version(caminho, cache_dir)
+    if not (_pasta(versao, origem, cache_dir) / "meta.json").exists():
+        df, versao = load_dataset(caminho, cache_dir)
+        publicar(df, versao, origem, cache_dir)
+    try:
+        return anexar(versao, origem, cache_dir), versao
+    except FileNotFoundError:
+        # Outro processo, com uma versão mais nova do mesmo CSV, removeu a pasta entre a verificação e o mapeamento
+        df, versao = load_dataset(caminho, cache_dir)
+        publicar(df, versao, origem, cache_dir)
+        return anexar(versao, origem, cache_dir), versao
@@ -0,0 +1,99 @@
+"""Aquecimento em segundo plano dos artefatos das páginas.
+
+Ao iniciar, cada tarefa (em geral o `aquecer(df, versao)` de uma página)
+é enviada a um pool de threads. As tarefas chamam as mesmas funções de
+`pvd.recursos` que as páginas, com os valores padrão dos widgets, então o
+resultado fica nos caches compartilhados (`st.cache_resource` e os caches
+internos de cada estrutura). A página não espera o aquecimento: se o
+artefato ainda não estiver pronto, ela o calcula sob demanda (ou espera o
+cálculo já em andamento, pois o `st.cache_resource` não calcula a mesma
+chave duas vezes ao mesmo tempo).
+
+Threads, e não processos, porque os artefatos precisam ficar na memória
+do processo do servidor; o trabalho pesado (NumPy, scikit-learn) libera o
+GIL.
+"""
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+PENDENTE = "pendente"
+EXECUTANDO = "executando"
+PRONTO = "pronto"
+ERRO = "erro"
+
+PREFIXO_THREADS = "pvd-aquecimento"
+
+
+class _SemAvisoDeContexto(logging.Filter):
+    """As threads do aquecimento não pertencem a nenhuma sessão; o aviso do Streamlit sobre isso é esperado."""
+
+    def filter(self, registro):
+        return not registro.threadName.startswith(PREFIXO_THREADS)
+
+
+class Aquecimento:
+    """Executa tarefas nomeadas em segundo plano e guarda o estado e a duração de cada uma."""
+
+    def __init__(self, tarefas, max_threads=4):
+        self._tarefas = list(tarefas)
+        self._max_threads = max_threads
+        self._estados = {nome: {"estado": PENDENTE, "duracao_s": None, "erro": None} for nome, _ in self._tarefas}
+        self._inicio = None
+        self._fim = None
+        self._lock = threading.Lock()
+
+    def iniciar(self):
+        """Envia as tarefas ao pool e retorna imediatamente."""
+        logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(_SemAvisoDeContexto())
+        self._inicio = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self._max_threads, thread_name_prefix=PREFIXO_THREADS)
+        for nome, tarefa in self._tarefas:
+            executor.submit(self._executar, nome, tarefa)
+        # Não bloqueia: as threads terminam sozinhas depois da última tarefa
+        executor.shutdown(wait=False)
+        return self
+
+    def _executar(self, nome, tarefa):
+        with self._lock:
+            self._estados[nome]["estado"] = EXECUTANDO
+        inicio = time.perf_counter()
+        try:
+            tarefa()
+            estado, erro = PRONTO, None
+        except Exception:
+            # Uma tarefa com erro não impede as outras; a página refaz o cálculo (e mostra o erro) sob demanda
+            estado, erro = ERRO, traceback.format_exc(limit=3)
+        with self._lock:
+            self._estados[nome].update(estado=estado, duracao_s=time.perf_counter() - inicio, erro=erro)
+            if all(e["estado"] in (PRONTO, ERRO) for e in self._estados.values()):
+                self._fim = time.perf_counter()
+
+    def concluido(self):
+        with self._lock:
+            return self._fim is not None
+
+    def duracao(self):
+        """Segundos desde o início (ou até o fim, se já concluído); None se não iniciado."""
+        with self._lock:
+            if self._inicio is None:
+                return None
+            return (self._fim if self._fim is not None else time.perf_counter()) - self._inicio
+
+    def estados(self):
+        """{tarefa: {"estado", "duracao_s", "erro"}}."""
+        with self._lock:
+            return {nome: dict(estado) for nome, estado in self._estados.items()}
+
+    def resumo(self):
+        """Texto curto com o progresso, para a barra lateral."""
+        estados = self.estados()
+        prontas = sum(e["estado"] == PRONTO for e in estados.values())
+        erros = sum(e["estado"] == ERRO for e in estados.values())
+        texto = f"{prontas}/{len(estados)} páginas prontas"
+        if erros:
+            texto += f", {erros} com erro"
+        situacao = "concluído" if self.concluido() else "em andamento"
+        return f"Aquecimento {situacao}: {texto} ({self.duracao():.1f} s)"